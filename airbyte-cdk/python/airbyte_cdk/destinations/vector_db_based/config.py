@@ -121,6 +121,13 @@ class ProcessingConfigModel(BaseModel):
         title="Field name mappings",
         description="List of fields to rename. Not applicable for nested fields, but can be used to rename fields already flattened via dot notation.",
     )
+    embedding_concurrency: int = Field(
+        default=1,
+        title="Embedding concurrency",
+        minimum=1,
+        maximum=16,
+        description="Number of batches embedded at the same time. Batches are still indexed in the order of the records and a state message is only emitted once all records before it are indexed.",
+    )
 
     class Config:
         schema_extra = {"group": "processing"}
@@ -153,6 +160,11 @@ class OpenAICompatibleEmbeddingConfigModel(BaseModel):
     dimensions: int = Field(
         title="Embedding dimensions", description="The number of dimensions the embedding model is generating", examples=[1536, 384]
     )
+    batch_requests: bool = Field(
+        default=False,
+        title="Batch requests",
+        description="Send several texts in a single embedding request and several requests at the same time. Only enable this if the service accepts multiple inputs per request like the OpenAI API does.",
+    )
 
     class Config(OneOfOptionConfig):
         title = "OpenAI-compatible"
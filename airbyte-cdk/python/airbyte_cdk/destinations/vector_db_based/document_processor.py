@@ -21,6 +21,9 @@ METADATA_RECORD_ID_FIELD = "_ab_record_id"
 
 CDC_DELETED_FIELD = "_ab_cdc_deleted_at"
 
+# tiktoken encoding used to measure the size of chunks in tokens
+SPLITTER_ENCODING_NAME = "gpt2"
+
 
 @dataclass
 class Chunk:
@@ -70,6 +73,7 @@ class DocumentProcessor:
             splitter_config = SeparatorSplitterConfigModel(mode="separator")
         if splitter_config.mode == "separator":
             return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+                encoding_name=SPLITTER_ENCODING_NAME,
                 chunk_size=chunk_size,
                 chunk_overlap=chunk_overlap,
                 separators=[json.loads(s) for s in splitter_config.separators],
@@ -78,6 +82,7 @@ class DocumentProcessor:
             )
         if splitter_config.mode == "markdown":
             return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+                encoding_name=SPLITTER_ENCODING_NAME,
                 chunk_size=chunk_size,
                 chunk_overlap=chunk_overlap,
                 separators=headers_to_split_on[: splitter_config.split_level],
@@ -87,6 +92,7 @@ class DocumentProcessor:
             )
         if splitter_config.mode == "code":
             return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+                encoding_name=SPLITTER_ENCODING_NAME,
                 chunk_size=chunk_size,
                 chunk_overlap=chunk_overlap,
                 separators=RecursiveCharacterTextSplitter.get_separators_for_language(Language(splitter_config.language)),
@@ -3,10 +3,15 @@
 #
 
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Union, cast
+from typing import Any, Deque, List, Optional, Tuple, Union, cast
 
+import tiktoken
 from airbyte_cdk.destinations.vector_db_based.config import (
     AzureOpenAIEmbeddingConfigModel,
     CohereEmbeddingConfigModel,
@@ -16,12 +21,13 @@ from airbyte_cdk.destinations.vector_db_based.config import (
     OpenAIEmbeddingConfigModel,
     ProcessingConfigModel,
 )
-from airbyte_cdk.destinations.vector_db_based.utils import create_chunks, format_exception
+from airbyte_cdk.destinations.vector_db_based.document_processor import SPLITTER_ENCODING_NAME
+from airbyte_cdk.destinations.vector_db_based.utils import format_exception
 from airbyte_cdk.models import AirbyteRecordMessage
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException, FailureType
 from langchain.embeddings.cohere import CohereEmbeddings
 from langchain.embeddings.fake import FakeEmbeddings
-from langchain.embeddings.localai import LocalAIEmbeddings
+from langchain.embeddings.localai import LocalAIEmbeddings, embed_with_retry
 from langchain.embeddings.openai import OpenAIEmbeddings
 
 
@@ -60,17 +66,140 @@ class Embedder(ABC):
     def embedding_dimensions(self) -> int:
         pass
 
+    @property
+    def model_id(self) -> Optional[str]:
+        """
+        Identifier of the model producing the embeddings, used to key the embeddings stored in an embedding cache.
+        Return None if the embedding of a text can't be reused, e.g. if it doesn't only depend on the text.
+        """
+        return None
+
 
 OPEN_AI_VECTOR_SIZE = 1536
 
 OPEN_AI_TOKEN_LIMIT = 150_000  # limit of tokens per minute
 
+OPEN_AI_MAX_BATCH_DOCUMENTS = 1000  # documents sent in a single request
+
+EMBEDDING_CONCURRENCY = 4  # requests sent at the same time
 
-class BaseOpenAIEmbedder(Embedder):
-    def __init__(self, embeddings: OpenAIEmbeddings, chunk_size: int):
+
+class TokenRateLimiter:
+    """
+    TokenRateLimiter keeps the tokens sent to an embedding API within a tokens per minute budget.
+
+    Each request has to acquire its tokens before being sent, which blocks until the tokens sent within the last minute leave enough room for it.
+    A request larger than the whole budget is only sent once nothing else was sent within the last minute.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.tokens_per_minute = tokens_per_minute
+        self._sent: Deque[Tuple[float, int]] = deque()
+        self._sent_tokens = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and self._sent[0][0] <= now - 60:
+                    self._sent_tokens -= self._sent.popleft()[1]
+                if not self._sent or self._sent_tokens + tokens <= self.tokens_per_minute:
+                    self._sent.append((now, tokens))
+                    self._sent_tokens += tokens
+                    return
+                wait = self._sent[0][0] + 60 - now
+            time.sleep(wait)
+
+
+class TokenBatchingEmbedder(Embedder):
+    """
+    TokenBatchingEmbedder embeds documents in batches packed by the number of tokens of each document and sends several batches at the same time.
+
+    The tokens are counted with the tokenizer the DocumentProcessor uses to split the records into chunks, which is only loaded once documents have to be packed.
+    If the maximum number of tokens of a document is known, documents that fit a single batch even at their maximum size aren't counted.
+    Each batch holds at most a share of the tokens per minute budget, so that the concurrent requests don't exhaust the budget at once,
+    and if a budget is set, requests wait for their tokens before being sent.
+    Subclasses send a single batch to the embedding API in _embed_batch, which has to be thread-safe.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = EMBEDDING_CONCURRENCY,
+        tokens_per_minute: Optional[int] = OPEN_AI_TOKEN_LIMIT,
+        max_document_tokens: Optional[int] = None,
+    ):
         super().__init__()
+        self.concurrency = concurrency
+        self.max_batch_tokens = (tokens_per_minute or OPEN_AI_TOKEN_LIMIT) // concurrency
+        self.max_document_tokens = max_document_tokens
+        self.rate_limiter = TokenRateLimiter(tokens_per_minute) if tokens_per_minute else None
+        self._encoding: Optional[tiktoken.Encoding] = None
+
+    @property
+    def encoding(self) -> tiktoken.Encoding:
+        # loading the encoding may download it, so it's only done once tokens have to be counted
+        if self._encoding is None:
+            self._encoding = tiktoken.get_encoding(SPLITTER_ENCODING_NAME)
+        return self._encoding
+
+    @abstractmethod
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        pass
+
+    def _create_batches(self, texts: List[str]) -> List[Tuple[List[str], int]]:
+        if (
+            self.max_document_tokens
+            and len(texts) <= OPEN_AI_MAX_BATCH_DOCUMENTS
+            and len(texts) * self.max_document_tokens <= self.max_batch_tokens
+        ):
+            return [(texts, len(texts) * self.max_document_tokens)] if texts else []
+
+        batches: List[Tuple[List[str], int]] = []
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = len(self.encoding.encode(text, disallowed_special=()))
+            if batch and (batch_tokens + tokens > self.max_batch_tokens or len(batch) == OPEN_AI_MAX_BATCH_DOCUMENTS):
+                batches.append((batch, batch_tokens))
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append((batch, batch_tokens))
+        return batches
+
+    def _embed_within_budget(self, batch: Tuple[List[str], int]) -> List[List[float]]:
+        texts, tokens = batch
+        if self.rate_limiter:
+            self.rate_limiter.acquire(tokens)
+        return self._embed_batch(texts)
+
+    def embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
+        batches = self._create_batches([document.page_content for document in documents])
+        embeddings: List[Optional[List[float]]] = []
+        if len(batches) <= 1 or self.concurrency == 1:
+            for batch in batches:
+                embeddings.extend(self._embed_within_budget(batch))
+            return embeddings
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(batches))) as executor:
+            for batch_embeddings in executor.map(self._embed_within_budget, batches):
+                embeddings.extend(batch_embeddings)
+        return embeddings
+
+
+class BaseOpenAIEmbedder(TokenBatchingEmbedder):
+    def __init__(
+        self,
+        embeddings: OpenAIEmbeddings,
+        chunk_size: int,
+        concurrency: int = EMBEDDING_CONCURRENCY,
+        tokens_per_minute: int = OPEN_AI_TOKEN_LIMIT,
+    ):
+        # chunks hold at most chunk_size tokens
+        super().__init__(concurrency, tokens_per_minute, max_document_tokens=chunk_size)
         self.embeddings = embeddings
-        self.chunk_size = chunk_size
 
     def check(self) -> Optional[str]:
         try:
@@ -79,37 +208,44 @@ class BaseOpenAIEmbedder(Embedder):
             return format_exception(e)
         return None
 
-    def embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
         """
-        Embed the text of each chunk and return the resulting embedding vectors.
-
-        As the OpenAI API will fail if more than the per-minute limit worth of tokens is sent at once, we split the request into batches and embed each batch separately.
-        It's still possible to run into the rate limit between each embed call because the available token budget hasn't recovered between the calls,
-        but the built-in retry mechanism of the OpenAI client handles that.
+        As the OpenAI API will fail if more than the per-minute limit worth of tokens is sent at once, batches are sized by their tokens and wait for the budget.
+        It's still possible to run into the rate limit as the API counts tokens differently, but the built-in retry mechanism of the OpenAI client handles that.
         """
-        # Each chunk can hold at most self.chunk_size tokens, so tokens-per-minute by maximum tokens per chunk is the number of documents that can be embedded at once without exhausting the limit in a single request
-        embedding_batch_size = OPEN_AI_TOKEN_LIMIT // self.chunk_size
-        batches = create_chunks(documents, batch_size=embedding_batch_size)
-        embeddings: List[Optional[List[float]]] = []
-        for batch in batches:
-            embeddings.extend(self.embeddings.embed_documents([chunk.page_content for chunk in batch]))
-        return embeddings
+        return self.embeddings.embed_documents(texts)
 
     @property
     def embedding_dimensions(self) -> int:
         # vector size produced by text-embedding-ada-002 model
         return OPEN_AI_VECTOR_SIZE
 
+    @property
+    def model_id(self) -> Optional[str]:
+        return f"{self.embeddings.openai_api_type or 'open_ai'}:{self.embeddings.openai_api_base or ''}/{self.embeddings.deployment}"
+
 
 class OpenAIEmbedder(BaseOpenAIEmbedder):
-    def __init__(self, config: OpenAIEmbeddingConfigModel, chunk_size: int):
-        super().__init__(OpenAIEmbeddings(openai_api_key=config.openai_key, max_retries=15, disallowed_special=()), chunk_size)  # type: ignore
+    def __init__(
+        self,
+        config: OpenAIEmbeddingConfigModel,
+        chunk_size: int,
+        concurrency: int = EMBEDDING_CONCURRENCY,
+        tokens_per_minute: int = OPEN_AI_TOKEN_LIMIT,
+    ):
+        super().__init__(OpenAIEmbeddings(openai_api_key=config.openai_key, max_retries=15, disallowed_special=()), chunk_size, concurrency, tokens_per_minute)  # type: ignore
 
 
 class AzureOpenAIEmbedder(BaseOpenAIEmbedder):
-    def __init__(self, config: AzureOpenAIEmbeddingConfigModel, chunk_size: int):
+    def __init__(
+        self,
+        config: AzureOpenAIEmbeddingConfigModel,
+        chunk_size: int,
+        concurrency: int = EMBEDDING_CONCURRENCY,
+        tokens_per_minute: int = OPEN_AI_TOKEN_LIMIT,
+    ):
         # Azure OpenAI API has — as of 20230927 — a limit of 16 documents per request
-        super().__init__(OpenAIEmbeddings(openai_api_key=config.openai_key, chunk_size=16, max_retries=15, openai_api_type="azure", openai_api_version="2023-05-15", openai_api_base=config.api_base, deployment=config.deployment, disallowed_special=()), chunk_size)  # type: ignore
+        super().__init__(OpenAIEmbeddings(openai_api_key=config.openai_key, chunk_size=16, max_retries=15, openai_api_type="azure", openai_api_version="2023-05-15", openai_api_base=config.api_base, deployment=config.deployment, disallowed_special=()), chunk_size, concurrency, tokens_per_minute)  # type: ignore
 
 
 COHERE_VECTOR_SIZE = 1024
@@ -136,6 +272,10 @@ class CohereEmbedder(Embedder):
         # vector size produced by text-embedding-ada-002 model
         return COHERE_VECTOR_SIZE
 
+    @property
+    def model_id(self) -> Optional[str]:
+        return f"cohere:{self.embeddings.model}"
+
 
 class FakeEmbedder(Embedder):
     def __init__(self, config: FakeEmbeddingConfigModel):
@@ -161,13 +301,34 @@ class FakeEmbedder(Embedder):
 CLOUD_DEPLOYMENT_MODE = "cloud"
 
 
-class OpenAICompatibleEmbedder(Embedder):
-    def __init__(self, config: OpenAICompatibleEmbeddingConfigModel):
-        super().__init__()
+class BatchLocalAIEmbeddings(LocalAIEmbeddings):
+    """
+    LocalAIEmbeddings sends a request per text, this sends all texts of a batch in a single request like the OpenAI API allows.
+    """
+
+    def embed_documents(self, texts: List[str], chunk_size: Optional[int] = 0) -> List[List[float]]:
+        if self.model.endswith("001"):
+            # See: https://github.com/openai/openai-python/issues/418#issuecomment-1525939500
+            texts = [text.replace("\n", " ") for text in texts]
+        response: Any = embed_with_retry(self, input=texts, **self._invocation_params)
+        return [item["embedding"] for item in sorted(response["data"], key=lambda item: item["index"])]
+
+
+class OpenAICompatibleEmbedder(TokenBatchingEmbedder):
+    def __init__(
+        self,
+        config: OpenAICompatibleEmbeddingConfigModel,
+        concurrency: int = EMBEDDING_CONCURRENCY,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        # there is no known token budget for self-hosted APIs, so requests are only limited if one is set
+        super().__init__(concurrency, tokens_per_minute)
         self.config = config
+        # many self-hosted servers only accept a single input per request, so texts are only batched if enabled in the config
+        embeddings_class = BatchLocalAIEmbeddings if config.batch_requests else LocalAIEmbeddings
         # Client is set internally
         # Always set an API key even if there is none defined in the config because the validator will fail otherwise. Embedding APIs that don't require an API key don't fail if one is provided, so this is not breaking usage.
-        self.embeddings = LocalAIEmbeddings(model=config.model_name, openai_api_key=config.api_key or "dummy-api-key", openai_api_base=config.base_url, max_retries=15, disallowed_special=())  # type: ignore
+        self.embeddings = embeddings_class(model=config.model_name, openai_api_key=config.api_key or "dummy-api-key", openai_api_base=config.base_url, max_retries=15, disallowed_special=())  # type: ignore
 
     def check(self) -> Optional[str]:
         deployment_mode = os.environ.get("DEPLOYMENT_MODE", "")
@@ -181,13 +342,23 @@ class OpenAICompatibleEmbedder(Embedder):
         return None
 
     def embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
-        return cast(List[Optional[List[float]]], self.embeddings.embed_documents([document.page_content for document in documents]))
+        if not self.config.batch_requests:
+            # a request per text, sent one after the other
+            return cast(List[Optional[List[float]]], self.embeddings.embed_documents([document.page_content for document in documents]))
+        return super().embed_documents(documents)
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
 
     @property
     def embedding_dimensions(self) -> int:
         # vector size produced by the model
         return self.config.dimensions
 
+    @property
+    def model_id(self) -> Optional[str]:
+        return f"openai_compatible:{self.config.base_url}/{self.config.model_name}"
+
 
 class FromFieldEmbedder(Embedder):
     def __init__(self, config: FromFieldEmbeddingConfigModel):
@@ -254,7 +425,6 @@ def create_from_config(
     ],
     processing_config: ProcessingConfigModel,
 ) -> Embedder:
-
     if embedding_config.mode == "azure_openai" or embedding_config.mode == "openai":
         return cast(Embedder, embedder_map[embedding_config.mode](embedding_config, processing_config.chunk_size))
     else:
@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import sqlite3
+import threading
+from array import array
+from typing import Dict, List, Optional
+
+from airbyte_cdk.destinations.vector_db_based.utils import create_chunks
+
+# SQLite limits the number of parameters of a query
+_MAX_KEYS_PER_QUERY = 500
+
+
+class EmbeddingCache:
+    """
+    EmbeddingCache stores embeddings in a SQLite database keyed by the model and the hash of the embedded text,
+    so that re-syncing unchanged records doesn't embed the same text again.
+
+    The Writer class looks up the text of each chunk in the cache before calling the embedder and stores the new embeddings.
+    Pass a file path to keep the embeddings across syncs, by default they're kept in memory.
+    Once the cache holds more than max_entries embeddings, the least recently used ones are evicted.
+    """
+
+    def __init__(self, path: str = ":memory:", max_entries: int = 1_000_000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # the cache is used from the embedding threads of the writer
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, embedding BLOB, last_used INTEGER)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._entries, last_used = self._connection.execute("SELECT count(*), max(last_used) FROM embeddings").fetchone()
+        self._clock = last_used or 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def _key(model: str, text: str) -> bytes:
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()
+
+    def get(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Return the cached embedding of each text, or None if it isn't cached.
+        """
+        keys = [self._key(model, text) for text in texts]
+        found: Dict[bytes, List[float]] = {}
+        with self._lock:
+            self._clock += 1
+            for batch in create_chunks(set(keys), _MAX_KEYS_PER_QUERY):
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})", batch)
+                for key, embedding in rows:
+                    found[key] = array("d", embedding).tolist()
+            self._connection.executemany("UPDATE embeddings SET last_used = ? WHERE key = ?", [(self._clock, key) for key in found])
+            self._connection.commit()
+
+            result = [found.get(key) for key in keys]
+            hits = sum(1 for embedding in result if embedding is not None)
+            self.hits += hits
+            self.misses += len(result) - hits
+        return result
+
+    def put(self, model: str, texts: List[str], embeddings: List[List[float]]) -> None:
+        with self._lock:
+            self._clock += 1
+            rows = {self._key(model, text): array("d", embedding).tobytes() for text, embedding in zip(texts, embeddings)}
+            inserted = self._connection.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, embedding, last_used) VALUES (?, ?, ?)",
+                [(key, embedding, self._clock) for key, embedding in rows.items()],
+            ).rowcount
+            self._entries += inserted
+            if self._entries > self.max_entries:
+                self._connection.execute(
+                    "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (self._entries - self.max_entries,),
+                )
+                self._entries = self.max_entries
+            self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
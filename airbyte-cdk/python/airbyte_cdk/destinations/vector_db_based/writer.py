@@ -3,14 +3,24 @@
 #
 
 
-from collections import defaultdict
-from typing import Dict, Iterable, List, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 from airbyte_cdk.destinations.vector_db_based.config import ProcessingConfigModel
 from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk, DocumentProcessor
 from airbyte_cdk.destinations.vector_db_based.embedder import Document, Embedder
+from airbyte_cdk.destinations.vector_db_based.embedding_cache import EmbeddingCache
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
-from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, ConfiguredAirbyteCatalog, Level, Type
+
+
+@dataclass
+class _PendingBatch:
+    chunks: Dict[Tuple[str, str], List[Chunk]]
+    ids_to_delete: Dict[Tuple[str, str], List[str]]
+    embedded: "Future[None]"
 
 
 class Writer:
@@ -18,22 +28,38 @@ class Writer:
     The Writer class is orchestrating the document processor, the embedder and the indexer:
     * Incoming records are passed through the document processor to generate chunks
     * One the configured batch size is reached, the chunks are passed to the embedder to generate embeddings
-    * The embedder embeds the chunks
-    * The indexer deletes old chunks by the associated record id before indexing the new ones
+    * The embedder embeds the chunks in a worker thread while the next records are processed
+    * The indexer deletes old chunks by the associated record id before indexing the new ones. Batches are indexed in order on the calling thread,
+      overlapping with the embedding of the next batches
 
     The destination connector is responsible to create a writer instance and pass the input messages iterable to the write method.
     The batch size can be configured by the destination connector to give the freedom of either letting the user configure it or hardcoding it to a sensible value depending on the destination.
     The omit_raw_text parameter can be used to omit the raw text from the chunks. This can be useful if the raw text is very large and not needed for the destination.
+    The embedding_concurrency parameter is the number of batches embedded at the same time, it defaults to the embedding concurrency of the processing config.
+    Once that many batches are waiting to be indexed, processing new records waits for the oldest batch to be indexed.
+    Batches are always indexed in the order of the records, and a state message is only emitted after all batches before it are indexed.
+    The embedding_cache parameter can be used to reuse the embeddings of chunks whose text was already embedded by the same model, see EmbeddingCache.
     """
 
     def __init__(
-        self, processing_config: ProcessingConfigModel, indexer: Indexer, embedder: Embedder, batch_size: int, omit_raw_text: bool
+        self,
+        processing_config: ProcessingConfigModel,
+        indexer: Indexer,
+        embedder: Embedder,
+        batch_size: int,
+        omit_raw_text: bool,
+        embedding_concurrency: Optional[int] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ) -> None:
         self.processing_config = processing_config
         self.indexer = indexer
         self.embedder = embedder
         self.batch_size = batch_size
         self.omit_raw_text = omit_raw_text
+        self.embedding_concurrency = embedding_concurrency or processing_config.embedding_concurrency
+        self.embedding_cache = embedding_cache
+        self._pending_batches: Deque[_PendingBatch] = deque()
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._init_batch()
 
     def _init_batch(self) -> None:
@@ -49,37 +75,104 @@ class Writer:
             raise ValueError("Cannot embed a chunk without page content")
         return Document(page_content=chunk.page_content, record=chunk.record)
 
-    def _process_batch(self) -> None:
-        for (namespace, stream), ids in self.ids_to_delete.items():
-            self.indexer.delete(ids, namespace, stream)
+    def _embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
+        """
+        Embed the documents, reusing the cached embeddings of texts that were already embedded by the same model.
+        """
+        model_id = self.embedder.model_id
+        if self.embedding_cache is None or model_id is None:
+            return self.embedder.embed_documents(documents)
 
-        for (namespace, stream), chunks in self.chunks.items():
-            embeddings = self.embedder.embed_documents([self._convert_to_document(chunk) for chunk in chunks])
-            for i, document in enumerate(chunks):
+        texts = [document.page_content for document in documents]
+        embeddings = self.embedding_cache.get(model_id, texts)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            new_embeddings = self.embedder.embed_documents([documents[i] for i in missing])
+            to_cache = [(texts[i], embedding) for i, embedding in zip(missing, new_embeddings) if embedding is not None]
+            self.embedding_cache.put(model_id, [text for text, _ in to_cache], [embedding for _, embedding in to_cache])
+            for i, embedding in zip(missing, new_embeddings):
+                embeddings[i] = embedding
+        return embeddings
+
+    def _embed_chunks(self, chunks: Dict[Tuple[str, str], List[Chunk]]) -> None:
+        for (namespace, stream), stream_chunks in chunks.items():
+            embeddings = self._embed_documents([self._convert_to_document(chunk) for chunk in stream_chunks])
+            for i, document in enumerate(stream_chunks):
                 document.embedding = embeddings[i]
                 if self.omit_raw_text:
                     document.page_content = None
+
+    def _index_batch(self, batch: _PendingBatch) -> None:
+        batch.embedded.result()
+
+        for (namespace, stream), ids in batch.ids_to_delete.items():
+            self.indexer.delete(ids, namespace, stream)
+
+        for (namespace, stream), chunks in batch.chunks.items():
             self.indexer.index(chunks, namespace, stream)
 
-        self._init_batch()
+    def _submit_batch(self) -> None:
+        """
+        Start embedding the current batch. Once more batches than the embedding concurrency are pending, wait for the oldest to be indexed.
+        Already embedded batches are indexed right away.
+        """
+        if self.chunks or self.ids_to_delete:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.embedding_concurrency, thread_name_prefix="embedder")
+            embedded = self._executor.submit(self._embed_chunks, self.chunks)
+            self._pending_batches.append(_PendingBatch(self.chunks, self.ids_to_delete, embedded))
+            self._init_batch()
+
+        while self._pending_batches and (
+            len(self._pending_batches) > self.embedding_concurrency or self._pending_batches[0].embedded.done()
+        ):
+            self._index_batch(self._pending_batches.popleft())
+
+    def _process_batch(self) -> None:
+        """
+        Embed and index the current batch and wait until all pending batches are indexed.
+        """
+        self._submit_batch()
+        while self._pending_batches:
+            self._index_batch(self._pending_batches.popleft())
+
+    def _shutdown(self) -> None:
+        for batch in self._pending_batches:
+            batch.embedded.cancel()
+        self._pending_batches.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     def write(self, configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
         self.processor = DocumentProcessor(self.processing_config, configured_catalog)
         self.indexer.pre_sync(configured_catalog)
-        for message in input_messages:
-            if message.type == Type.STATE:
-                # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
-                # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
-                self._process_batch()
-                yield message
-            elif message.type == Type.RECORD:
-                record_chunks, record_id_to_delete = self.processor.process(message.record)
-                self.chunks[(message.record.namespace, message.record.stream)].extend(record_chunks)
-                if record_id_to_delete is not None:
-                    self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
-                self.number_of_chunks += len(record_chunks)
-                if self.number_of_chunks >= self.batch_size:
+        # the cache can be shared by several writers, only the lookups of this sync are reported
+        cache_hits, cache_misses = (self.embedding_cache.hits, self.embedding_cache.misses) if self.embedding_cache is not None else (0, 0)
+        try:
+            for message in input_messages:
+                if message.type == Type.STATE:
+                    # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
+                    # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
                     self._process_batch()
+                    yield message
+                elif message.type == Type.RECORD:
+                    record_chunks, record_id_to_delete = self.processor.process(message.record)
+                    self.chunks[(message.record.namespace, message.record.stream)].extend(record_chunks)
+                    if record_id_to_delete is not None:
+                        self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
+                    self.number_of_chunks += len(record_chunks)
+                    if self.number_of_chunks >= self.batch_size:
+                        self._submit_batch()
+
+            self._process_batch()
+        finally:
+            self._shutdown()
 
-        self._process_batch()
+        if self.embedding_cache is not None:
+            cache_hits = self.embedding_cache.hits - cache_hits
+            cache_misses = self.embedding_cache.misses - cache_misses
+            hit_rate = cache_hits / (cache_hits + cache_misses) if cache_hits + cache_misses else 0.0
+            message = f"Embedding cache: {cache_hits} hits, {cache_misses} misses ({hit_rate:.1%} hit rate)"
+            yield AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=message))
         yield from self.indexer.post_sync()
@@ -99,7 +99,9 @@ class AbstractSource(Source, ABC):
         # TODO assert all streams exist in the connector
         # get the streams once in case the connector needs to make any queries to generate them
         stream_instances = {s.name: s for s in self.streams(config)}
-        state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state)
+        state_manager = ConnectorStateManager(
+            stream_instance_map=stream_instances, state=state, compact_state_messages=self.compact_state_messages_enabled
+        )
         self._stream_to_instance_map = stream_instances
 
         stream_name_to_exception: MutableMapping[str, AirbyteTracedException] = {}
@@ -164,6 +166,15 @@ class AbstractSource(Source, ABC):
     def per_stream_state_enabled(self) -> bool:
         return True
 
+    @property
+    def compact_state_messages_enabled(self) -> bool:
+        """
+        Per-stream state messages only hold the state of their stream, rather than also holding the deprecated legacy state of all the
+        streams. Enable it for sources with large states checkpointed often, e.g. with many partitions, as the size of each state message
+        otherwise grows with the state of all the streams.
+        """
+        return False
+
     def _read_stream(
         self,
         logger: logging.Logger,
@@ -3,7 +3,7 @@
 #
 
 import copy
-from typing import Any, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import AirbyteMessage, AirbyteStateBlob, AirbyteStateMessage, AirbyteStateType, AirbyteStreamState, StreamDescriptor
 from airbyte_cdk.models import Type as MessageType
@@ -26,10 +26,16 @@ class ConnectorStateManager:
     """
     ConnectorStateManager consolidates the various forms of a stream's incoming state message (STREAM / GLOBAL / LEGACY) under a common
     interface. It also provides methods to extract and update state
+
+    Per-stream state messages also hold the deprecated legacy state of all the streams in their data field, unless compact_state_messages
+    is set, in which case they only hold the state of their own stream.
     """
 
     def __init__(
-        self, stream_instance_map: Mapping[str, Stream], state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None
+        self,
+        stream_instance_map: Mapping[str, Stream],
+        state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None,
+        compact_state_messages: bool = False,
     ):
         shared_state, per_stream_states = self._extract_from_state_message(state, stream_instance_map)
 
@@ -44,6 +50,9 @@ class ConnectorStateManager:
                 "state messages with shared_state will not be processed correctly. "
             )
         self.per_stream_states = per_stream_states
+        self.compact_state_messages = compact_state_messages
+        # Built on the first state message that needs it, then kept up to date as stream states are updated
+        self._legacy_state: Optional[Dict[str, Any]] = None
 
     def get_stream_state(self, stream_name: str, namespace: Optional[str]) -> MutableMapping[str, Any]:
         """
@@ -65,7 +74,10 @@ class ConnectorStateManager:
         :param value: A stream state mapping that is being updated for a stream
         """
         stream_descriptor = HashableStreamDescriptor(name=stream_name, namespace=namespace)
-        self.per_stream_states[stream_descriptor] = AirbyteStateBlob.parse_obj(value)
+        stream_state = AirbyteStateBlob.parse_obj(value)
+        self.per_stream_states[stream_descriptor] = stream_state
+        if self._legacy_state is not None:
+            self._legacy_state[stream_name] = stream_state.dict()
 
     def create_state_message(self, stream_name: str, namespace: Optional[str], send_per_stream_state: bool) -> AirbyteMessage:
         """
@@ -85,11 +97,16 @@ class ConnectorStateManager:
                 StreamDescriptor(name=stream_name) if namespace is None else StreamDescriptor(name=stream_name, namespace=namespace)
             )
 
+            stream_state_message = AirbyteStreamState(stream_descriptor=stream_descriptor, stream_state=stream_state)
+            if self.compact_state_messages:
+                return AirbyteMessage(
+                    type=MessageType.STATE, state=AirbyteStateMessage(type=AirbyteStateType.STREAM, stream=stream_state_message)
+                )
             return AirbyteMessage(
                 type=MessageType.STATE,
                 state=AirbyteStateMessage(
                     type=AirbyteStateType.STREAM,
-                    stream=AirbyteStreamState(stream_descriptor=stream_descriptor, stream_state=stream_state),
+                    stream=stream_state_message,
                     data=dict(self._get_legacy_state()),
                 ),
             )
@@ -167,9 +184,11 @@ class ConnectorStateManager:
     def _get_legacy_state(self) -> Mapping[str, Any]:
         """
         Using the current per-stream state, creates a mapping of all the stream states for the connector being synced
-        :return: A deep copy of the mapping of stream name to stream state value
+        :return: A copy of the mapping of stream name to stream state value, holding copies of the stream states as of their last update
         """
-        return {descriptor.name: state.dict() if state else {} for descriptor, state in self.per_stream_states.items()}
+        if self._legacy_state is None:
+            self._legacy_state = {descriptor.name: state.dict() if state else {} for descriptor, state in self.per_stream_states.items()}
+        return dict(self._legacy_state)
 
     @staticmethod
     def _is_legacy_dict_state(state: Union[List[AirbyteStateMessage], MutableMapping[str, Any]]) -> bool:
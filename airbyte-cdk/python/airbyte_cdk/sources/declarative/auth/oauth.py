@@ -3,6 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass, field
+from datetime import timedelta
 from typing import Any, List, Mapping, Optional, Union
 
 import pendulum
@@ -36,6 +37,7 @@ class DeclarativeOauth2Authenticator(AbstractOauth2Authenticator, DeclarativeAut
         refresh_request_body (Optional[Mapping[str, Any]]): The request body to send in the refresh request
         grant_type: The grant_type to request for access_token. If set to refresh_token, the refresh_token parameter has to be provided
         message_repository (MessageRepository): the message repository used to emit logs on HTTP requests
+        token_expiry_skew (timedelta): Refresh the access token this long before it expires
     """
 
     token_refresh_endpoint: Union[InterpolatedString, str]
@@ -54,9 +56,10 @@ class DeclarativeOauth2Authenticator(AbstractOauth2Authenticator, DeclarativeAut
     refresh_request_body: Optional[Mapping[str, Any]] = None
     grant_type: Union[InterpolatedString, str] = "refresh_token"
     message_repository: MessageRepository = NoopMessageRepository()
+    token_expiry_skew: timedelta = timedelta(0)
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
-        super().__init__()
+        super().__init__(token_expiry_skew=self.token_expiry_skew)
         self._token_refresh_endpoint = InterpolatedString.create(self.token_refresh_endpoint, parameters=parameters)
         self._client_id = InterpolatedString.create(self.client_id, parameters=parameters)
         self._client_secret = InterpolatedString.create(self.client_secret, parameters=parameters)
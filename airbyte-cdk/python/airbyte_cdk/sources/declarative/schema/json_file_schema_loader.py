@@ -2,8 +2,6 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import json
-import pkgutil
 import sys
 from dataclasses import InitVar, dataclass, field
 from typing import Any, Mapping, Union
@@ -55,16 +53,8 @@ class JsonFileSchemaLoader(ResourceSchemaLoader, SchemaLoader):
         # this would require that we find a creative solution to store or retrieve source_name in here since the files are mounted there
         json_schema_path = self._get_json_filepath()
         resource, schema_path = self.extract_resource_and_schema_path(json_schema_path)
-        raw_json_file = pkgutil.get_data(resource, schema_path)
-
-        if not raw_json_file:
-            raise IOError(f"Cannot find file {json_schema_path}")
-        try:
-            raw_schema = json.loads(raw_json_file)
-        except ValueError as err:
-            raise RuntimeError(f"Invalid JSON file format for file {json_schema_path}") from err
         self.package_name = resource
-        return self._resolve_schema_references(raw_schema)
+        return self._get_resolved_schema(schema_path, json_schema_path)
 
     def _get_json_filepath(self):
         return self.file_path.eval(self.config)
@@ -78,7 +78,7 @@ class DefaultFileBasedAvailabilityStrategy(AbstractFileBasedAvailabilityStrategy
         Returns the first file if successful, otherwise raises a CheckAvailabilityError.
         """
         try:
-            file = next(iter(stream.get_files()))
+            file = next(iter(stream.iter_files()))
         except StopIteration:
             raise CheckAvailabilityError(FileBasedSourceError.EMPTY_STREAM, stream=stream.name)
         except CustomFileBasedException as exc:
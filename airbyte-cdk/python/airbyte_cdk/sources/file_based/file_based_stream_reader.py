@@ -7,9 +7,10 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
 from io import IOBase
-from typing import Iterable, List, Optional, Set
+from typing import Any, Iterable, List, Mapping, Optional, Set
 
 from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
+from airbyte_cdk.sources.file_based.file_listing_cache import FileListingCache
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from wcmatch.glob import GLOBSTAR, globmatch
 
@@ -22,8 +23,20 @@ class FileReadMode(Enum):
 class AbstractFileBasedStreamReader(ABC):
     DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
-    def __init__(self) -> None:
+    def __init__(self, listing_cache: Optional[FileListingCache] = None) -> None:
         self._config = None
+        self._listing_cache = listing_cache or FileListingCache()
+
+    @property
+    def listing_cache(self) -> FileListingCache:
+        if not hasattr(self, "_listing_cache"):
+            # Readers that don't call `super().__init__()` still get a cache scoped to the instance
+            self._listing_cache = FileListingCache()
+        return self._listing_cache
+
+    @listing_cache.setter
+    def listing_cache(self, value: FileListingCache) -> None:
+        self._listing_cache = value
 
     @property
     def config(self) -> Optional[AbstractFileBasedSpec]:
@@ -79,6 +92,52 @@ class AbstractFileBasedStreamReader(ABC):
         """
         ...
 
+    def list_matching_files(
+        self,
+        globs: List[str],
+        prefix: Optional[str],
+        logger: logging.Logger,
+    ) -> List[RemoteFile]:
+        """
+        Return all files that match any of the globs, reusing a previous listing for the same globs and prefix if one is
+        available in the listing cache.
+        """
+        return self.listing_cache.get_or_list(
+            self._listing_cache_key(globs, prefix), lambda: self.get_matching_files(globs, prefix, logger), logger
+        )
+
+    def iter_matching_files(
+        self,
+        globs: List[str],
+        prefix: Optional[str],
+        logger: logging.Logger,
+    ) -> Iterable[RemoteFile]:
+        """
+        Iterate over the files that match any of the globs without listing them all first, for callers that only look
+        at the first files. A cached listing is reused if there is one, but a new listing is not cached.
+        """
+        cached_files = self.listing_cache.get(self._listing_cache_key(globs, prefix), logger)
+        if cached_files is not None:
+            return cached_files
+        return self.get_matching_files(globs, prefix, logger)
+
+    def _listing_cache_key(self, globs: List[str], prefix: Optional[str]) -> Mapping[str, Any]:
+        return {
+            "namespace": self.get_listing_cache_namespace(),
+            "globs": sorted(globs),
+            "prefix": prefix,
+            "start_date": self.config.start_date if self.config else None,
+        }
+
+    def get_listing_cache_namespace(self) -> str:
+        """
+        Identifies the location being listed (e.g. the bucket) in the listing cache keys.
+
+        Readers whose listings may be persisted across invocations should override this so that listings of different
+        buckets don't collide.
+        """
+        return type(self).__name__
+
     def filter_files_by_globs_and_start_date(self, files: List[RemoteFile], globs: List[str]) -> Iterable[RemoteFile]:
         """
         Utility method for filtering files based on globs.
@@ -0,0 +1,128 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+
+class FileListingCache:
+    """
+    Cache of file listings, keyed by the namespace (e.g. the bucket), globs, prefix and start date used to list them.
+
+    `check`, `discover` and `read` all need the list of files matching a stream's globs; without this cache each of them
+    lists the whole bucket again. Within one process every caller gets the same listing. Listings can optionally be
+    persisted to `cache_dir` so that consecutive invocations of the connector reuse them until `ttl` expires.
+
+    The number of hits and misses is recorded in `hits` and `misses`.
+    """
+
+    def __init__(self, ttl: Optional[timedelta] = None, cache_dir: Optional[str] = None):
+        self._ttl = ttl
+        self._cache_dir = cache_dir
+        self._entries: Dict[str, Tuple[datetime, List[RemoteFile]]] = {}
+        # Guards the entries, the per-key locks and the metrics; listings themselves only hold the lock of their key
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Mapping[str, Any], logger: logging.Logger) -> Optional[List[RemoteFile]]:
+        """
+        Return the cached listing for `key` if there is a fresh one, without listing files otherwise.
+        """
+        cache_key = self._hash_key(key)
+        with self._lock:
+            entry = self._get_fresh_entry(cache_key, logger)
+            if entry is None:
+                return None
+            self.hits += 1
+        logger.debug(f"File listing cache hit for {dict(key)}. hits={self.hits} misses={self.misses}")
+        return list(entry[1])
+
+    def get_or_list(
+        self, key: Mapping[str, Any], list_files: Callable[[], Iterable[RemoteFile]], logger: logging.Logger
+    ) -> List[RemoteFile]:
+        """
+        Return the cached listing for `key`, calling `list_files` only if there is no fresh entry.
+
+        Concurrent calls for the same key wait for a single listing while other keys are listed in parallel. Listing
+        errors are propagated and nothing is cached for the key. The returned list is a copy that callers may modify.
+        """
+        cache_key = self._hash_key(key)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+
+        with key_lock:
+            cached_files = self.get(key, logger)
+            if cached_files is not None:
+                return cached_files
+
+            with self._lock:
+                self.misses += 1
+            logger.debug(f"File listing cache miss for {dict(key)}. hits={self.hits} misses={self.misses}")
+            files = list(list_files())
+            entry = (datetime.now(), files)
+            with self._lock:
+                self._entries[cache_key] = entry
+            self._save(cache_key, entry, logger)
+            return list(files)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def metrics(self) -> Mapping[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _get_fresh_entry(self, cache_key: str, logger: logging.Logger) -> Optional[Tuple[datetime, List[RemoteFile]]]:
+        entry = self._entries.get(cache_key) or self._load(cache_key, logger)
+        if entry is None or self._is_expired(entry[0]):
+            return None
+        return entry
+
+    def _is_expired(self, listed_at: datetime) -> bool:
+        return self._ttl is not None and datetime.now() - listed_at > self._ttl
+
+    @staticmethod
+    def _hash_key(key: Mapping[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _path(self, cache_key: str) -> Optional[str]:
+        return os.path.join(self._cache_dir, f"{cache_key}.pickle") if self._cache_dir else None
+
+    def _load(self, cache_key: str, logger: logging.Logger) -> Optional[Tuple[datetime, List[RemoteFile]]]:
+        path = self._path(cache_key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                entry: Tuple[datetime, List[RemoteFile]] = pickle.load(f)
+        except Exception as exc:
+            logger.warning(f"Could not load the persisted file listing from {path}: {exc}")
+            return None
+        self._entries[cache_key] = entry
+        return entry
+
+    def _save(self, cache_key: str, entry: Tuple[datetime, List[RemoteFile]], logger: logging.Logger) -> None:
+        path = self._path(cache_key)
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so that a concurrent invocation never reads a partial listing
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(entry, f)
+            os.replace(tmp_path, path)
+        except Exception as exc:
+            logger.warning(f"Could not persist the file listing to {path}: {exc}")
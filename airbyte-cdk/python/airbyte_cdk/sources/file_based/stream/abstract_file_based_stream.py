@@ -77,6 +77,13 @@ class AbstractFileBasedStream(Stream):
         """
         ...
 
+    def iter_files(self) -> Iterable[RemoteFile]:
+        """
+        Iterate over the files that belong to the stream, for callers that only need the first ones (e.g. the
+        availability check). Streams that can list their files lazily should override this.
+        """
+        return self.get_files()
+
     def read_records(
         self,
         sync_mode: SyncMode,
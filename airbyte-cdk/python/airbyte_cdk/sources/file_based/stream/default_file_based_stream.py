@@ -207,7 +207,10 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
         """
         Return all files that belong to the stream as defined by the stream's globs.
         """
-        return self.stream_reader.get_matching_files(self.config.globs or [], self.config.legacy_prefix, self.logger)
+        return self.stream_reader.list_matching_files(self.config.globs or [], self.config.legacy_prefix, self.logger)
+
+    def iter_files(self) -> Iterable[RemoteFile]:
+        return self.stream_reader.iter_matching_files(self.config.globs or [], self.config.legacy_prefix, self.logger)
 
     def infer_schema(self, files: List[RemoteFile]) -> Mapping[str, Any]:
         loop = asyncio.get_event_loop()
@@ -7,8 +7,9 @@ import inspect
 import logging
 import typing
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import airbyte_cdk.sources.utils.casing as casing
 from airbyte_cdk.models import AirbyteMessage, AirbyteStream, SyncMode
@@ -32,6 +33,20 @@ StreamData = Union[Mapping[str, Any], AirbyteMessage]
 JsonSchema = Mapping[str, Any]
 
 
+@dataclass
+class AvailabilityProbe:
+    """
+    The reads started by an availability check of a stream: the first stream slice, the records of that slice (including the records
+    already read by the check) and the remaining stream slices. A full refresh read of the stream continues them instead of requesting
+    the first page again.
+    """
+
+    cursor_field: List[str]
+    stream_slice: Optional[Mapping[str, Any]]
+    records: Iterator[StreamData]
+    remaining_slices: Iterator[Optional[Mapping[str, Any]]]
+
+
 def package_name_from_class(cls: object) -> str:
     """Find the package name given a class name"""
     module = inspect.getmodule(cls)
@@ -88,6 +103,9 @@ class Stream(ABC):
     # TypeTransformer object to perform output data transformation
     transformer: TypeTransformer = TypeTransformer(TransformConfig.NoTransform)
 
+    # reads started by the last availability check, see keep_availability_probe
+    _availability_probe: Optional[AvailabilityProbe] = None
+
     @property
     def name(self) -> str:
         """
@@ -113,7 +131,23 @@ class Stream(ABC):
         logger: logging.Logger,
         slice_logger: SliceLogger,
     ) -> Iterable[StreamData]:
-        slices = self.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=cursor_field)
+        probe = self._pop_availability_probe()
+        # the availability check reads the stream with its own cursor field, which is also the one used when none is configured
+        own_cursor_field = [self.cursor_field] if isinstance(self.cursor_field, str) else self.cursor_field
+        if probe and probe.cursor_field != (cursor_field or own_cursor_field):
+            logger.info(
+                f"Reading {self.name} again instead of continuing the reads of its availability check, "
+                f"which used the cursor field {probe.cursor_field} instead of {cursor_field}"
+            )
+            probe = None
+        if probe:
+            logger.debug(f"Continuing the reads of the availability check of {self.name}")
+            if slice_logger.should_log_slice_message(logger):
+                yield slice_logger.create_slice_log_message(probe.stream_slice)
+            yield from probe.records
+            slices: Iterable[Optional[Mapping[str, Any]]] = probe.remaining_slices
+        else:
+            slices = self.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=cursor_field)
         logger.debug(f"Processing stream slices for {self.name} (sync_mode: full_refresh)", extra={"stream_slices": slices})
         for _slice in slices:
             if slice_logger.should_log_slice_message(logger):
@@ -134,6 +168,8 @@ class Stream(ABC):
         per_stream_state_enabled: bool,
         internal_config: InternalConfig,
     ) -> Iterable[StreamData]:
+        # the requests of an incremental read depend on the state, so the reads of the availability check can't be reused
+        self._pop_availability_probe()
         slices = self.stream_slices(
             cursor_field=cursor_field,
             sync_mode=SyncMode.incremental,
@@ -263,6 +299,18 @@ class Stream(ABC):
             return self.availability_strategy.check_availability(self, logger, source)
         return True, None
 
+    def keep_availability_probe(self, probe: AvailabilityProbe) -> None:
+        """
+        Keep the reads started by an availability check, so that the next full refresh read of this stream continues them
+        instead of fetching the first page again. They are only reused if the read uses the same cursor field as the check,
+        or no cursor field and the check used the stream's own one.
+        """
+        self._availability_probe = probe
+
+    def _pop_availability_probe(self) -> Optional[AvailabilityProbe]:
+        probe, self._availability_probe = self._availability_probe, None
+        return probe
+
     @property
     def availability_strategy(self) -> Optional["AvailabilityStrategy"]:
         """
@@ -2,21 +2,92 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import hashlib
+import itertools
+import json
 import logging
+import os
+import tempfile
+import time
 import typing
-from typing import Dict, Optional, Tuple
+from datetime import timedelta
+from typing import Dict, Iterator, Optional, Tuple
 
 import requests
+from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
-from airbyte_cdk.sources.streams.utils.stream_helper import get_first_record_for_slice, get_first_stream_slice
+from airbyte_cdk.sources.streams.core import AvailabilityProbe, StreamData
 from requests import HTTPError
 
 if typing.TYPE_CHECKING:
     from airbyte_cdk.sources import Source
 
 
+class StreamAvailabilityCache:
+    """
+    A small JSON file remembering when streams were last found to be available, so that their availability checks can be skipped for a while.
+
+    Streams are identified by a hash of the source name, the stream name, the base URL and the authentication headers in use,
+    so that a stream checked with other credentials is checked again and no secret is written to the file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @staticmethod
+    def key(stream: Stream, source: Optional["Source"]) -> str:
+        authenticator = getattr(getattr(stream, "_session", None), "auth", None) or getattr(stream, "authenticator", None)
+        auth_header = authenticator.get_auth_header() if authenticator is not None and hasattr(authenticator, "get_auth_header") else {}
+        identity = [getattr(source, "name", None), stream.name, getattr(stream, "url_base", None), auth_header]
+        return hashlib.sha256(json.dumps(identity, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _load(self) -> Dict[str, float]:
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def is_available(self, key: str, max_age: timedelta) -> bool:
+        checked_at = self._load().get(key)
+        return checked_at is not None and time.time() - checked_at <= max_age.total_seconds()
+
+    def mark_available(self, key: str, max_age: timedelta) -> None:
+        now = time.time()
+        entries = {k: checked_at for k, checked_at in self._load().items() if now - checked_at <= max_age.total_seconds()}
+        entries[key] = now
+        try:
+            # write to a temporary file first so that concurrent syncs never read a partially written file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # the cache only saves requests, a sync shouldn't fail because it can't be written
+            pass
+
+
 class HttpAvailabilityStrategy(AvailabilityStrategy):
+    """
+    Checks the availability of a stream by reading its first record. The reads started by the check are kept on the stream,
+    so that a full refresh read of the stream continues them instead of fetching the first page again.
+
+    If skip_if_available_within is set, streams found to be available within that time are not checked again, which is
+    remembered in a StreamAvailabilityCache file at cache_path. The file must not be writable by other users, as its entries
+    make checks be skipped.
+    """
+
+    skip_if_available_within: Optional[timedelta] = None
+    availability_cache: Optional[StreamAvailabilityCache] = None
+
+    def __init__(self, skip_if_available_within: Optional[timedelta] = None, cache_path: Optional[str] = None):
+        if skip_if_available_within and not cache_path:
+            raise ValueError("A cache_path is required to skip the availability checks of streams available within some time")
+        self.skip_if_available_within = skip_if_available_within
+        self.availability_cache = StreamAvailabilityCache(cache_path) if skip_if_available_within and cache_path else None
+
     def check_availability(self, stream: Stream, logger: logging.Logger, source: Optional["Source"]) -> Tuple[bool, Optional[str]]:
         """
         Check stream availability by attempting to read the first record of the
@@ -30,10 +101,23 @@ class HttpAvailabilityStrategy(AvailabilityStrategy):
           for some reason and the str should describe what went wrong and how to
           resolve the unavailability, if possible.
         """
+        cache_key = None
+        if self.availability_cache and self.skip_if_available_within:
+            cache_key = self.availability_cache.key(stream, source)
+            if self.availability_cache.is_available(cache_key, self.skip_if_available_within):
+                logger.info(
+                    f"Skipped checking the availability of stream {stream.name}, it was available within the last {self.skip_if_available_within}."
+                )
+                return True, None
+
+        cursor_field = [stream.cursor_field] if isinstance(stream.cursor_field, str) else stream.cursor_field
         try:
             # Some streams need a stream slice to read records (e.g. if they have a SubstreamPartitionRouter)
             # Streams that don't need a stream slice will return `None` as their first stream slice.
-            stream_slice = get_first_stream_slice(stream)
+            # We wrap the return output of stream_slices() because some implementations return types that are iterable,
+            # but not iterators such as lists or tuples
+            slices = iter(stream.stream_slices(cursor_field=cursor_field, sync_mode=SyncMode.full_refresh))
+            stream_slice = next(slices)
         except StopIteration:
             # If stream_slices has no `next()` item (Note - this is different from stream_slices returning [None]!)
             # This can happen when a substream's `stream_slices` method does a `for record in parent_records: yield <something>`
@@ -47,17 +131,23 @@ class HttpAvailabilityStrategy(AvailabilityStrategy):
             return is_available, reason
 
         try:
-            get_first_record_for_slice(stream, stream_slice)
-            return True, None
+            records: Iterator[StreamData] = iter(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice))
+            first_record = next(records)
+            records = itertools.chain([first_record], records)
         except StopIteration:
             logger.info(f"Successfully connected to stream {stream.name}, but got 0 records.")
-            return True, None
+            records = iter([])
         except HTTPError as error:
             is_available, reason = self.handle_http_error(stream, logger, source, error)
             if not is_available:
                 reason = f"Unable to read {stream.name} stream. {reason}"
             return is_available, reason
 
+        stream.keep_availability_probe(AvailabilityProbe(cursor_field, stream_slice, records, slices))
+        if self.availability_cache and self.skip_if_available_within and cache_key:
+            self.availability_cache.mark_available(cache_key, self.skip_if_available_within)
+        return True, None
+
     def handle_http_error(
         self, stream: Stream, logger: logging.Logger, source: Optional["Source"], error: HTTPError
     ) -> Tuple[bool, Optional[str]]:
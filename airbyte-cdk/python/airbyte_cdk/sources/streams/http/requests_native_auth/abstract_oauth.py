@@ -3,7 +3,9 @@
 #
 
 import logging
+import threading
 from abc import abstractmethod
+from datetime import timedelta
 from json import JSONDecodeError
 from typing import Any, List, Mapping, MutableMapping, Optional, Tuple, Union
 
@@ -20,6 +22,8 @@ from ..exceptions import DefaultBackoffException
 
 logger = logging.getLogger("airbyte")
 _NOOP_MESSAGE_REPOSITORY = NoopMessageRepository()
+# Used by the authenticators whose __init__ didn't call AbstractOauth2Authenticator.__init__
+_DEFAULT_TOKEN_REFRESH_LOCK = threading.Lock()
 
 
 class AbstractOauth2Authenticator(AuthBase):
@@ -27,23 +31,32 @@ class AbstractOauth2Authenticator(AuthBase):
     Abstract class for an OAuth authenticators that implements the OAuth token refresh flow. The authenticator
     is designed to generically perform the refresh flow without regard to how config fields are get/set by
     delegating that behavior to the classes implementing the interface.
+
+    The authenticator can be shared by threads: only one of them refreshes an expired token while the others wait for the new one.
     """
 
     _NO_STREAM_NAME = None
+    _token_expiry_skew = timedelta(0)
+    _token_refresh_lock: Optional[threading.Lock] = None
 
     def __init__(
         self,
         refresh_token_error_status_codes: Tuple[int, ...] = (),
         refresh_token_error_key: str = "",
         refresh_token_error_values: Tuple[str, ...] = (),
+        token_expiry_skew: timedelta = timedelta(0),
     ) -> None:
         """
         If all of refresh_token_error_status_codes, refresh_token_error_key, and refresh_token_error_values are set,
         then http errors with such params will be wrapped in AirbyteTracedException.
+
+        The token is refreshed token_expiry_skew before its expiry date, so that it doesn't expire while requests are in flight.
         """
         self._refresh_token_error_status_codes = refresh_token_error_status_codes
         self._refresh_token_error_key = refresh_token_error_key
         self._refresh_token_error_values = refresh_token_error_values
+        self._token_expiry_skew = token_expiry_skew
+        self._token_refresh_lock = threading.Lock()
 
     def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
         """Attach the HTTP headers required to authenticate on the HTTP request"""
@@ -57,15 +70,21 @@ class AbstractOauth2Authenticator(AuthBase):
     def get_access_token(self) -> str:
         """Returns the access token"""
         if self.token_has_expired():
-            token, expires_in = self.refresh_access_token()
-            self.access_token = token
-            self.set_token_expiry_date(expires_in)
+            with self._get_token_refresh_lock():
+                # another thread might have refreshed the token while this one was waiting for the lock
+                if self.token_has_expired():
+                    token, expires_in = self.refresh_access_token()
+                    self.access_token = token
+                    self.set_token_expiry_date(expires_in)
 
         return self.access_token
 
     def token_has_expired(self) -> bool:
         """Returns True if the token is expired"""
-        return pendulum.now() > self.get_token_expiry_date()  # type: ignore # this is always a bool despite what mypy thinks
+        return pendulum.now() > self.get_token_expiry_date() - self._token_expiry_skew  # type: ignore # this is always a bool despite what mypy thinks
+
+    def _get_token_refresh_lock(self) -> threading.Lock:
+        return self._token_refresh_lock or _DEFAULT_TOKEN_REFRESH_LOCK
 
     def build_refresh_request_body(self) -> Mapping[str, Any]:
         """
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from datetime import timedelta
 from typing import Any, List, Mapping, Optional, Sequence, Tuple, Union
 
 import dpath
@@ -35,6 +36,7 @@ class Oauth2Authenticator(AbstractOauth2Authenticator):
         refresh_token_error_status_codes: Tuple[int, ...] = (),
         refresh_token_error_key: str = "",
         refresh_token_error_values: Tuple[str, ...] = (),
+        token_expiry_skew: timedelta = timedelta(0),
     ):
         self._token_refresh_endpoint = token_refresh_endpoint
         self._client_secret = client_secret
@@ -50,7 +52,7 @@ class Oauth2Authenticator(AbstractOauth2Authenticator):
         self._token_expiry_date_format = token_expiry_date_format
         self._token_expiry_is_time_of_expiration = token_expiry_is_time_of_expiration
         self._access_token = None
-        super().__init__(refresh_token_error_status_codes, refresh_token_error_key, refresh_token_error_values)
+        super().__init__(refresh_token_error_status_codes, refresh_token_error_key, refresh_token_error_values, token_expiry_skew)
 
     def get_token_refresh_endpoint(self) -> str:
         return self._token_refresh_endpoint
@@ -133,6 +135,7 @@ class SingleUseRefreshTokenOauth2Authenticator(Oauth2Authenticator):
         refresh_token_error_status_codes: Tuple[int, ...] = (),
         refresh_token_error_key: str = "",
         refresh_token_error_values: Tuple[str, ...] = (),
+        token_expiry_skew: timedelta = timedelta(0),
     ):
         """
         Args:
@@ -152,6 +155,7 @@ class SingleUseRefreshTokenOauth2Authenticator(Oauth2Authenticator):
             token_expiry_date_format (Optional[str]): Date format of the token expiry date field (set by expires_in_name). If not specified the token expiry date is interpreted as number of seconds until expiration.
             token_expiry_is_time_of_expiration bool: set True it if expires_in is returned as time of expiration instead of the number seconds until expiration
             message_repository (MessageRepository): the message repository used to emit logs on HTTP requests and control message on config update
+            token_expiry_skew (timedelta): Refresh the access token this long before it expires. Defaults to 0.
         """
         self._client_id = client_id if client_id is not None else dpath.util.get(connector_config, ("credentials", "client_id"))
         self._client_secret = (
@@ -180,6 +184,7 @@ class SingleUseRefreshTokenOauth2Authenticator(Oauth2Authenticator):
             refresh_token_error_status_codes=refresh_token_error_status_codes,
             refresh_token_error_key=refresh_token_error_key,
             refresh_token_error_values=refresh_token_error_values,
+            token_expiry_skew=token_expiry_skew,
         )
 
     def get_refresh_token_name(self) -> str:
@@ -214,7 +219,7 @@ class SingleUseRefreshTokenOauth2Authenticator(Oauth2Authenticator):
 
     def token_has_expired(self) -> bool:
         """Returns True if the token is expired"""
-        return pendulum.now("UTC") > self.get_token_expiry_date()
+        return pendulum.now("UTC") > self.get_token_expiry_date() - self._token_expiry_skew  # type: ignore # this is always a bool despite what mypy thinks
 
     @staticmethod
     def get_new_token_expiry_date(access_token_expires_in: str, token_expiry_date_format: str = None) -> pendulum.DateTime:
@@ -230,20 +235,26 @@ class SingleUseRefreshTokenOauth2Authenticator(Oauth2Authenticator):
             str: The current access_token, updated if it was previously expired.
         """
         if self.token_has_expired():
-            new_access_token, access_token_expires_in, new_refresh_token = self.refresh_access_token()
-            new_token_expiry_date = self.get_new_token_expiry_date(access_token_expires_in, self._token_expiry_date_format)
-            self.access_token = new_access_token
-            self.set_refresh_token(new_refresh_token)
-            self.set_token_expiry_date(new_token_expiry_date)
-            # FIXME emit_configuration_as_airbyte_control_message as been deprecated in favor of package airbyte_cdk.sources.message
-            #  Usually, a class shouldn't care about the implementation details but to keep backward compatibility where we print the
-            #  message directly in the console, this is needed
-            if not isinstance(self._message_repository, NoopMessageRepository):
-                self._message_repository.emit_message(create_connector_config_control_message(self._connector_config))
-            else:
-                emit_configuration_as_airbyte_control_message(self._connector_config)
+            with self._get_token_refresh_lock():
+                # the refresh token can only be used once, another thread might have used it while this one was waiting for the lock
+                if self.token_has_expired():
+                    self._refresh_tokens()
         return self.access_token
 
+    def _refresh_tokens(self) -> None:
+        new_access_token, access_token_expires_in, new_refresh_token = self.refresh_access_token()
+        new_token_expiry_date = self.get_new_token_expiry_date(access_token_expires_in, self._token_expiry_date_format)
+        self.access_token = new_access_token
+        self.set_refresh_token(new_refresh_token)
+        self.set_token_expiry_date(new_token_expiry_date)
+        # FIXME emit_configuration_as_airbyte_control_message as been deprecated in favor of package airbyte_cdk.sources.message
+        #  Usually, a class shouldn't care about the implementation details but to keep backward compatibility where we print the
+        #  message directly in the console, this is needed
+        if not isinstance(self._message_repository, NoopMessageRepository):
+            self._message_repository.emit_message(create_connector_config_control_message(self._connector_config))
+        else:
+            emit_configuration_as_airbyte_control_message(self._connector_config)
+
     def refresh_access_token(self) -> Tuple[str, str, str]:
         response_json = self._get_refresh_access_token_response()
         return (
@@ -3,8 +3,10 @@
 #
 
 
+import hashlib
 import importlib
 import json
+import logging
 import os
 import pkgutil
 from typing import Any, ClassVar, Dict, List, Mapping, MutableMapping, Optional, Tuple
@@ -109,12 +111,87 @@ def rename_key(schema: Any, old_key: str, new_key: str) -> None:
             schema[new_key] = schema.pop(old_key)
 
 
+# Build artifact holding the resolved schemas of a package, see write_resolved_schemas
+RESOLVED_SCHEMAS_FILENAME = "_resolved_schemas.json"
+
+# Resolved schemas by package and schema file, shared by all loaders of the process. They are stored serialized so that they can't be
+# modified and every caller gets its own copy, as connectors commonly modify the schemas they get.
+_resolved_schemas: Dict[Tuple[str, str], str] = {}
+
+# Resolved schemas of the build artifact of each package, None if the package has no up to date artifact
+_resolved_schema_artifacts: Dict[str, Optional[Mapping[str, Any]]] = {}
+
+logger = logging.getLogger("airbyte")
+
+
+def _package_dir(package_name: str) -> str:
+    package = importlib.import_module(package_name)
+    if package.__file__:
+        return os.path.dirname(package.__file__) + "/"
+    else:
+        raise ValueError(f"Package {package} does not have a valid __file__ field")
+
+
+def _schemas_fingerprint(package_dir: str) -> str:
+    """
+    Hash of all schema files of a package, used to detect resolved schema artifacts which are out of date.
+    """
+    digest = hashlib.sha256()
+    schemas_dir = os.path.join(package_dir, "schemas")
+    for root, _, files in sorted(os.walk(schemas_dir)):
+        for filename in sorted(files):
+            if filename.endswith(".json") and filename != RESOLVED_SCHEMAS_FILENAME:
+                path = os.path.join(root, filename)
+                digest.update(os.path.relpath(path, schemas_dir).encode("utf-8"))
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+def write_resolved_schemas(package_name: str) -> str:
+    """
+    Resolve the $refs of all stream schemas of a package and write them to schemas/_resolved_schemas.json, so that the connector doesn't
+    need to resolve them at runtime. Meant to be run when building the connector, e.g.:
+
+        python -c "from airbyte_cdk.sources.utils.schema_helpers import write_resolved_schemas; write_resolved_schemas('source_github')"
+
+    The artifact is ignored if the schema files changed since it was written.
+
+    :param package_name: name of the connector package
+    :return: path of the written artifact
+    """
+    package_dir = _package_dir(package_name)
+    loader = ResourceSchemaLoader(package_name)
+    schemas = {}
+    for filename in sorted(os.listdir(os.path.join(package_dir, "schemas"))):
+        if filename.endswith(".json") and filename != RESOLVED_SCHEMAS_FILENAME:
+            schema_filename = f"schemas/{filename}"
+            schemas[schema_filename] = loader._read_and_resolve_schema(schema_filename, schema_filename)
+
+    path = os.path.join(package_dir, "schemas", RESOLVED_SCHEMAS_FILENAME)
+    with open(path, "w") as f:
+        json.dump({"fingerprint": _schemas_fingerprint(package_dir), "schemas": schemas}, f)
+    return path
+
+
 class ResourceSchemaLoader:
-    """JSONSchema loader from package resources"""
+    """
+    JSONSchema loader from package resources
+
+    Resolved schemas are cached for the whole process, so that creating new stream instances doesn't read and resolve their schemas again.
+    """
 
     def __init__(self, package_name: str):
         self.package_name = package_name
 
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Forget the schemas resolved so far, e.g. after modifying schema files.
+        """
+        _resolved_schemas.clear()
+        _resolved_schema_artifacts.clear()
+
     def get_schema(self, name: str) -> dict[str, Any]:
         """
         This method retrieves a JSON schema from the schemas/ folder.
@@ -129,13 +206,54 @@ class ResourceSchemaLoader:
         """
 
         schema_filename = f"schemas/{name}.json"
+        return self._get_resolved_schema(schema_filename, schema_filename)
+
+    def _get_resolved_schema(self, schema_filename: str, schema_path: str) -> dict[str, Any]:
+        """
+        Get the resolved schema of a file of the package from the process-wide cache, from the resolved schemas artifact or by resolving it.
+
+        :param schema_filename: path of the schema file within the package
+        :param schema_path: path of the schema file to show in errors
+        """
+        key = (self.package_name, schema_filename)
+        serialized_schema = _resolved_schemas.get(key)
+        if serialized_schema is None:
+            artifact = self._get_resolved_schemas_artifact()
+            schema = artifact.get(schema_filename) if artifact else None
+            if schema is None:
+                schema = self._read_and_resolve_schema(schema_filename, schema_path)
+            serialized_schema = json.dumps(schema)
+            _resolved_schemas[key] = serialized_schema
+        resolved: dict[str, Any] = json.loads(serialized_schema)
+        return resolved
+
+    def _get_resolved_schemas_artifact(self) -> Optional[Mapping[str, Any]]:
+        if self.package_name not in _resolved_schema_artifacts:
+            artifact = None
+            raw_artifact = None
+            try:
+                raw_artifact = pkgutil.get_data(self.package_name, f"schemas/{RESOLVED_SCHEMAS_FILENAME}")
+            except (OSError, ValueError, ImportError):
+                pass
+            if raw_artifact:
+                content = json.loads(raw_artifact)
+                if content.get("fingerprint") == _schemas_fingerprint(_package_dir(self.package_name)):
+                    artifact = content["schemas"]
+                else:
+                    logger.warning(
+                        f"Ignoring {RESOLVED_SCHEMAS_FILENAME} of {self.package_name} because the schemas changed since it was written."
+                    )
+            _resolved_schema_artifacts[self.package_name] = artifact
+        return _resolved_schema_artifacts[self.package_name]
+
+    def _read_and_resolve_schema(self, schema_filename: str, schema_path: str) -> dict[str, Any]:
         raw_file = pkgutil.get_data(self.package_name, schema_filename)
         if not raw_file:
-            raise IOError(f"Cannot find file {schema_filename}")
+            raise IOError(f"Cannot find file {schema_path}")
         try:
             raw_schema = json.loads(raw_file)
         except ValueError as err:
-            raise RuntimeError(f"Invalid JSON file format for file {schema_filename}") from err
+            raise RuntimeError(f"Invalid JSON file format for file {schema_path}") from err
 
         return self._resolve_schema_references(raw_schema)
 
@@ -147,11 +265,7 @@ class ResourceSchemaLoader:
         :return JSON serializable object with references without external dependencies.
         """
 
-        package = importlib.import_module(self.package_name)
-        if package.__file__:
-            base = os.path.dirname(package.__file__) + "/"
-        else:
-            raise ValueError(f"Package {package} does not have a valid __file__ field")
+        base = _package_dir(self.package_name)
         resolved = jsonref.JsonRef.replace_refs(raw_schema, loader=JsonFileLoader(base, "schemas/shared"), base_uri=base)
         resolved = resolve_ref_links(resolved)
         if isinstance(resolved, dict):
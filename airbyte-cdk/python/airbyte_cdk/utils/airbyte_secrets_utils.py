@@ -2,7 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping
+import json
+from typing import Any, List, Mapping, Tuple
 
 import dpath.util
 
@@ -54,19 +55,54 @@ def get_secrets(connection_specification: Mapping[str, Any], config: Mapping[str
 
 
 __SECRETS_FROM_CONFIG: List[str] = []
+# The secrets to mask, in all the forms they can take in the filtered strings, from the shortest to the longest
+__SECRET_VALUES: List[str] = []
 
 
-def update_secrets(secrets: List[str]):
+def update_secrets(secrets: List[str]) -> None:
     """Update the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
+    global __SECRETS_FROM_CONFIG, __SECRET_VALUES
     __SECRETS_FROM_CONFIG = secrets
+    values = set()
+    for secret in secrets:
+        if secret:
+            value = str(secret)
+            values.add(value)
+            # quotes, backslashes and non-ascii characters of the secret are escaped in messages formatted with json.dumps
+            values.add(json.dumps(value)[1:-1])
+    __SECRET_VALUES = sorted(values, key=len)
 
 
 def filter_secrets(string: str) -> str:
-    """Filter secrets from a string by replacing them with ****"""
-    # TODO this should perform a maximal match for each secret. if "x" and "xk" are both secret values, and this method is called twice on
-    #  the input "xk", then depending on call order it might only obfuscate "*k". This is a bug.
-    for secret in __SECRETS_FROM_CONFIG:
-        if secret:
-            string = string.replace(str(secret), "****")
-    return string
+    """
+    Filter secrets from a string by replacing them with ****
+
+    All the occurrences of all the secrets are found before replacing them, so that a secret containing or overlapping another one is
+    replaced as a whole.
+    """
+    # most strings can't contain any secret, e.g. when the config has no secrets
+    if not __SECRET_VALUES or len(string) < len(__SECRET_VALUES[0]):
+        return string
+
+    occurrences: List[Tuple[int, int]] = []
+    for secret in __SECRET_VALUES:
+        start = string.find(secret)
+        while start != -1:
+            occurrences.append((start, start + len(secret)))
+            start = string.find(secret, start + 1)
+    if not occurrences:
+        return string
+
+    occurrences.sort()
+    parts = []
+    position = 0
+    masked_start, masked_end = occurrences[0]
+    for start, end in occurrences[1:]:
+        if start <= masked_end:
+            masked_end = max(masked_end, end)
+        else:
+            parts += [string[position:masked_start], "****"]
+            position = masked_end
+            masked_start, masked_end = start, end
+    parts += [string[position:masked_start], "****", string[masked_end:]]
+    return "".join(parts)
@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Benchmark the time spent loading stream schemas by discover, for a generated source whose streams share their
+definitions through $refs. Compares a cold process resolving every schema, a cold process reading the resolved
+schemas artifact and later discovers in the same process hitting the resolved schemas cache.
+
+    python bin/benchmark-discover-schemas.py --streams 200 --runs 5
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.utils.schema_helpers import RESOLVED_SCHEMAS_FILENAME, ResourceSchemaLoader, write_resolved_schemas
+
+PACKAGE_NAME = "benchmark_discover_source"
+
+logger = logging.getLogger("airbyte")
+
+
+def create_package(root: str, streams: int, shared_definitions: int) -> None:
+    schemas_dir = os.path.join(root, PACKAGE_NAME, "schemas")
+    os.makedirs(os.path.join(schemas_dir, "shared"))
+    with open(os.path.join(root, PACKAGE_NAME, "__init__.py"), "w"):
+        pass
+
+    definitions = {
+        f"definition_{i}": {"type": ["null", "object"], "properties": {f"field_{j}": {"type": ["null", "string"]} for j in range(20)}}
+        for i in range(shared_definitions)
+    }
+    with open(os.path.join(schemas_dir, "shared", "definitions.json"), "w") as f:
+        json.dump({"definitions": definitions}, f)
+
+    for i in range(streams):
+        properties: Mapping[str, Any] = {
+            "id": {"type": "integer"},
+            "updated_at": {"type": "string", "format": "date-time"},
+            **{f"object_{j}": {"$ref": f"definitions.json#/definitions/definition_{j}"} for j in range(shared_definitions)},
+        }
+        with open(os.path.join(schemas_dir, f"stream_{i}.json"), "w") as f:
+            json.dump({"type": "object", "properties": properties}, f)
+
+
+class BenchmarkStream(Stream):
+    primary_key = "id"
+
+    def __init__(self, name: str):
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def read_records(self, *args: Any, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        return []
+
+
+# schemas are loaded from the package of the stream class
+BenchmarkStream.__module__ = PACKAGE_NAME
+
+
+class BenchmarkSource(AbstractSource):
+    def __init__(self, streams: int):
+        self._stream_count = streams
+
+    def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
+        return True, None
+
+    def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        return [BenchmarkStream(f"stream_{i}") for i in range(self._stream_count)]
+
+
+def time_discover(source: BenchmarkSource, runs: int, cold: bool) -> float:
+    elapsed = 0.0
+    for _ in range(runs):
+        if cold:
+            ResourceSchemaLoader.clear_cache()
+        start = time.perf_counter()
+        source.discover(logger, {})
+        elapsed += time.perf_counter() - start
+    return elapsed / runs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=200)
+    parser.add_argument("--shared-definitions", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        create_package(tmp_dir, args.streams, args.shared_definitions)
+        sys.path.insert(0, tmp_dir)
+        importlib.import_module(PACKAGE_NAME)
+        source = BenchmarkSource(args.streams)
+
+        print(f"cold discover, resolving schemas: {time_discover(source, args.runs, cold=True) * 1000:.1f}ms")
+        print(f"warm discover, cached schemas: {time_discover(source, args.runs, cold=False) * 1000:.1f}ms")
+
+        write_resolved_schemas(PACKAGE_NAME)
+        print(f"cold discover, {RESOLVED_SCHEMAS_FILENAME}: {time_discover(source, args.runs, cold=True) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
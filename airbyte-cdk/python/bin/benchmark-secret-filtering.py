@@ -0,0 +1,66 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Benchmark the secret filtering of the logs of a connector builder style run, where every request and response is
+logged, comparing filter_secrets with replacing each secret one after the other.
+
+    python bin/benchmark-secret-filtering.py --requests 2000 --secrets 5
+"""
+
+import argparse
+import json
+import random
+import string
+import time
+from typing import Callable, List
+
+from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets, update_secrets
+
+
+def replace_each_secret(secrets: List[str]) -> Callable[[str], str]:
+    def filter_message(message: str) -> str:
+        for secret in secrets:
+            message = message.replace(secret, "****")
+        return message
+
+    return filter_message
+
+
+def http_messages(requests: int, secrets: List[str]) -> List[str]:
+    messages = []
+    for i in range(requests):
+        records = [{"id": i * 100 + j, "name": f"name {j}", "updated_at": "2023-12-01T00:00:00Z"} for j in range(100)]
+        http = {
+            "title": "Stream request",
+            "request": {
+                "url": f"https://api.example.com/v1/items?page={i}",
+                "headers": {"Authorization": f"Bearer {secrets[0]}"},
+            },
+            "response": {"status_code": 200, "body": json.dumps({"data": records, "next_page": i + 1})},
+        }
+        messages.append(json.dumps({"http": http, "log": {"level": "debug"}}))
+    return messages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--secrets", type=int, default=5)
+    args = parser.parse_args()
+
+    secrets = ["".join(random.choices(string.ascii_letters + string.digits, k=32)) for _ in range(args.secrets)]
+    messages = http_messages(args.requests, secrets)
+    update_secrets(secrets)
+
+    for name, filter_message in [("replace each secret", replace_each_secret(secrets)), ("filter_secrets", filter_secrets)]:
+        start = time.perf_counter()
+        for message in messages:
+            filter_message(message)
+        elapsed = time.perf_counter() - start
+        print(f"{name}: filtered {len(messages)} messages in {elapsed * 1000:.1f}ms: {len(messages) / elapsed:.0f} messages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measure the bytes of the state messages emitted by a sync of streams with per-partition states checkpointed often,
+with the default state messages and with compact state messages.
+
+    python bin/benchmark-state-messages.py --streams 20 --partitions 500 --checkpoints 50
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, Mapping
+
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+
+
+def partitioned_state(partitions: int, checkpoint: int) -> Mapping[str, Any]:
+    states: List[Dict[str, Any]] = [
+        {"partition": {"parent_id": str(i)}, "cursor": {"updated_at": f"2023-12-01T00:{checkpoint % 60:02d}:00Z"}}
+        for i in range(partitions)
+    ]
+    return {"states": states}
+
+
+def sync(streams: int, partitions: int, checkpoints: int, compact_state_messages: bool) -> int:
+    state_manager = ConnectorStateManager({}, [], compact_state_messages=compact_state_messages)
+    emitted_bytes = 0
+    for stream in range(streams):
+        for checkpoint in range(checkpoints):
+            state_manager.update_state_for_stream(f"stream_{stream}", None, partitioned_state(partitions, checkpoint))
+            message = state_manager.create_state_message(f"stream_{stream}", None, send_per_stream_state=True)
+            emitted_bytes += len(message.json(exclude_unset=True))
+    return emitted_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=20)
+    parser.add_argument("--partitions", type=int, default=500)
+    parser.add_argument("--checkpoints", type=int, default=50)
+    args = parser.parse_args()
+
+    for name, compact_state_messages in [("default state messages", False), ("compact state messages", True)]:
+        start = time.perf_counter()
+        emitted_bytes = sync(args.streams, args.partitions, args.checkpoints, compact_state_messages)
+        elapsed = time.perf_counter() - start
+        print(f"{name}: emitted {emitted_bytes / 1_000_000:.1f}MB of state messages in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -210,6 +210,12 @@ def test_json_schema_generation():
                                 "examples": [1536, 384],
                                 "type": "integer",
                             },
+                            "batch_requests": {
+                                "title": "Batch requests",
+                                "description": "Send several texts in a single embedding request and several requests at the same time. Only enable this if the service accepts multiple inputs per request like the OpenAI API does.",
+                                "default": False,
+                                "type": "boolean",
+                            },
                         },
                         "required": ["base_url", "dimensions", "mode"],
                         "description": "Use a service that's compatible with the OpenAI API to embed text.",
@@ -370,6 +376,14 @@ def test_json_schema_generation():
                             "required": ["from_field", "to_field"],
                         },
                     },
+                    "embedding_concurrency": {
+                        "title": "Embedding concurrency",
+                        "description": "Number of batches embedded at the same time. Batches are still indexed in the order of the records and a state message is only emitted once all records before it are indexed.",
+                        "default": 1,
+                        "minimum": 1,
+                        "maximum": 16,
+                        "type": "integer",
+                    },
                 },
                 "required": ["chunk_size"],
                 "group": "processing",
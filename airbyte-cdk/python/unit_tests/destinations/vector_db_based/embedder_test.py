@@ -2,7 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from unittest.mock import MagicMock, call
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from airbyte_cdk.destinations.vector_db_based.config import (
@@ -23,11 +27,27 @@ from airbyte_cdk.destinations.vector_db_based.embedder import (
     FromFieldEmbedder,
     OpenAICompatibleEmbedder,
     OpenAIEmbedder,
+    TokenRateLimiter,
 )
 from airbyte_cdk.models.airbyte_protocol import AirbyteRecordMessage
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 
+class FakeEncoding:
+    """
+    Counts a token per word instead of loading the tokenizer, which has to be downloaded.
+    """
+
+    def encode(self, text, **kwargs):
+        return text.split()
+
+
+@pytest.fixture(autouse=True)
+def fake_encoding():
+    with patch("airbyte_cdk.destinations.vector_db_based.embedder.tiktoken.get_encoding", return_value=FakeEncoding()) as get_encoding:
+        yield get_encoding
+
+
 @pytest.mark.parametrize(
     "embedder_class, args, dimensions",
     (
@@ -66,7 +86,7 @@ from airbyte_cdk.utils.traced_exception import AirbyteTracedException
         ),
     ),
 )
-def test_embedder(embedder_class, args, dimensions):
+def test_embedder(embedder_class, args, dimensions, fake_encoding):
     embedder = embedder_class(*args)
     mock_embedding_instance = MagicMock()
     embedder.embeddings = mock_embedding_instance
@@ -87,6 +107,8 @@ def test_embedder(embedder_class, args, dimensions):
     ]
     assert embedder.embed_documents(chunks) == mock_embedding_instance.embed_documents.return_value
     mock_embedding_instance.embed_documents.assert_called_with(["a", "b"])
+    # documents that fit a single batch even at the maximum chunk size aren't tokenized
+    fake_encoding.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -122,4 +144,143 @@ def test_openai_chunking():
         Document(page_content="a", record=AirbyteRecordMessage(stream="mystream", data={}, emitted_at=0)) for _ in range(1005)
     ]
     assert embedder.embed_documents(chunks) == [[0] * OPEN_AI_VECTOR_SIZE] * 1005
-    mock_embedding_instance.embed_documents.assert_has_calls([call(["a"] * 1000), call(["a"] * 5)])
+    mock_embedding_instance.embed_documents.assert_has_calls([call(["a"] * 1000), call(["a"] * 5)], any_order=True)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def monotonic(self):
+        with self.lock:
+            return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    clock = FakeClock()
+    with patch("airbyte_cdk.destinations.vector_db_based.embedder.time", clock):
+        yield clock
+
+
+def _documents(word_counts):
+    return [
+        Document(page_content=" ".join(["word"] * count), record=AirbyteRecordMessage(stream="mystream", data={}, emitted_at=0))
+        for count in word_counts
+    ]
+
+
+def test_openai_batches_are_packed_by_tokens(fake_clock):
+    config = OpenAIEmbeddingConfigModel(**{"mode": "openai", "openai_key": "abc"})
+    embedder = OpenAIEmbedder(config, 1000, concurrency=2, tokens_per_minute=100)
+    mock_embedding_instance = MagicMock()
+    embedder.embeddings = mock_embedding_instance
+    mock_embedding_instance.embed_documents.side_effect = lambda texts: [[len(text.split())] for text in texts]
+
+    assert embedder.embed_documents(_documents([30, 30, 10, 10, 40])) == [[30], [30], [10], [10], [40]]
+    # each batch holds at most half of the tokens per minute to leave room for the concurrent batch
+    assert sorted(len(call_args[0][0]) for call_args in mock_embedding_instance.embed_documents.call_args_list) == [1, 1, 3]
+    # the last batch waits for the tokens of the first one to be available again
+    assert fake_clock.now == 60
+
+
+def test_token_rate_limiter(fake_clock):
+    limiter = TokenRateLimiter(100)
+    limiter.acquire(60)
+    fake_clock.sleep(10)
+    limiter.acquire(40)
+    assert fake_clock.now == 10
+
+    limiter.acquire(50)
+    assert fake_clock.now == 60
+    limiter.acquire(40)
+    assert fake_clock.now == 70
+
+    # requests larger than the budget are sent once nothing else was sent within the last minute
+    limiter.acquire(500)
+    assert fake_clock.now == 130
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeOpenAIRequestHandler)
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+
+class FakeOpenAIRequestHandler(BaseHTTPRequestHandler):
+    server: FakeOpenAIServer
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.requests.append(body["input"])
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        time.sleep(0.05)
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+        # return the embeddings in reverse order, the index field defines which input they belong to
+        data = [{"object": "embedding", "index": i, "embedding": [float(len(text.split())), 1.0]} for i, text in enumerate(body["input"])]
+        response = json.dumps({"object": "list", "data": data[::-1], "model": body["model"], "usage": {}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_openai_server():
+    server = FakeOpenAIServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_openai_compatible_embedder_batches_requests(fake_openai_server, fake_clock):
+    config = OpenAICompatibleEmbeddingConfigModel(
+        mode="openai_compatible",
+        base_url=f"http://127.0.0.1:{fake_openai_server.server_port}/v1",
+        model_name="my-model",
+        dimensions=2,
+        batch_requests=True,
+    )
+    embedder = OpenAICompatibleEmbedder(config, concurrency=3, tokens_per_minute=300)
+    word_counts = [(i % 5 + 1) * 10 for i in range(50)]
+
+    embeddings = embedder.embed_documents(_documents(word_counts))
+
+    assert embeddings == [[float(count), 1.0] for count in word_counts]
+    # 1500 tokens packed into batches of at most 100 tokens instead of a request per document
+    assert len(fake_openai_server.requests) < len(word_counts)
+    assert sorted(len(text.split()) for texts in fake_openai_server.requests for text in texts) == sorted(word_counts)
+    assert all(sum(len(text.split()) for text in texts) <= 100 for texts in fake_openai_server.requests)
+    assert fake_openai_server.max_in_flight > 1
+    # 1500 tokens with a budget of 300 tokens per minute
+    assert fake_clock.now >= 4 * 60
+
+
+def test_openai_compatible_embedder_sends_a_request_per_text_by_default(fake_openai_server, fake_encoding):
+    config = OpenAICompatibleEmbeddingConfigModel(
+        mode="openai_compatible", base_url=f"http://127.0.0.1:{fake_openai_server.server_port}/v1", model_name="my-model", dimensions=2
+    )
+    embedder = OpenAICompatibleEmbedder(config)
+
+    assert embedder.embed_documents(_documents([1, 2, 3])) == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+    assert fake_openai_server.requests == [["word"], ["word word"], ["word word word"]]
+    assert fake_openai_server.max_in_flight == 1
+    fake_encoding.assert_not_called()
@@ -0,0 +1,43 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from airbyte_cdk.destinations.vector_db_based.embedding_cache import EmbeddingCache
+
+
+def test_get_returns_embeddings_of_the_same_model():
+    cache = EmbeddingCache()
+    cache.put("model_a", ["text 1", "text 2"], [[0.1, 0.2], [1 / 3, -2.5]])
+
+    assert cache.get("model_a", ["text 2", "text 3", "text 1"]) == [[1 / 3, -2.5], None, [0.1, 0.2]]
+    assert cache.get("model_b", ["text 1"]) == [None]
+    assert cache.hits == 2
+    assert cache.misses == 2
+    assert cache.hit_rate == 0.5
+
+
+def test_hit_rate_without_lookups():
+    assert EmbeddingCache().hit_rate == 0.0
+
+
+def test_least_recently_used_embeddings_are_evicted():
+    cache = EmbeddingCache(max_entries=2)
+    cache.put("model", ["text 1"], [[1.0]])
+    cache.put("model", ["text 2"], [[2.0]])
+    cache.get("model", ["text 1"])
+    cache.put("model", ["text 3"], [[3.0]])
+
+    assert cache.get("model", ["text 1", "text 2", "text 3"]) == [[1.0], None, [3.0]]
+
+
+def test_embeddings_are_kept_across_instances(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    cache = EmbeddingCache(path, max_entries=2)
+    cache.put("model", ["text 1", "text 2"], [[1.0], [2.0]])
+    cache.close()
+
+    cache = EmbeddingCache(path, max_entries=2)
+    assert cache.get("model", ["text 1"]) == [[1.0]]
+
+    cache.put("model", ["text 3"], [[3.0]])
+    assert cache.get("model", ["text 1", "text 2", "text 3"]) == [[1.0], None, [3.0]]
@@ -2,11 +2,22 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Optional
-from unittest.mock import ANY, MagicMock, call
+import threading
+import time
+from collections import defaultdict
+from typing import List, Optional
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
-from airbyte_cdk.destinations.vector_db_based import ProcessingConfigModel, Writer
+from airbyte_cdk.destinations.vector_db_based import (
+    Chunk,
+    EmbeddingCache,
+    FakeEmbedder,
+    FakeEmbeddingConfigModel,
+    Indexer,
+    ProcessingConfigModel,
+    Writer,
+)
 from airbyte_cdk.models.airbyte_protocol import (
     AirbyteLogMessage,
     AirbyteMessage,
@@ -16,6 +27,14 @@ from airbyte_cdk.models.airbyte_protocol import (
     Level,
     Type,
 )
+from unit_tests.destinations.vector_db_based.embedder_test import FakeEncoding
+
+
+@pytest.fixture(autouse=True)
+def fake_encoding():
+    # the text splitter of the DocumentProcessor counts tokens with a tokenizer that has to be downloaded
+    with patch("tiktoken.get_encoding", return_value=FakeEncoding()):
+        yield
 
 
 def _generate_record_message(index: int, stream: str = "example_stream", namespace: Optional[str] = None):
@@ -170,3 +189,136 @@ def test_write_stream_namespace_split():
         ]
     )
     assert mock_embedder.embed_documents.call_count == 4
+
+
+class InMemoryIndexer(Indexer):
+    def __init__(self):
+        super().__init__(None)
+        self.records = defaultdict(list)
+        self.embeddings = {}
+
+    def index(self, document_chunks: List[Chunk], namespace: str, stream: str) -> None:
+        for chunk in document_chunks:
+            assert chunk.embedding is not None
+            self.records[(namespace, stream)].append(chunk.record.data["id"])
+            self.embeddings[chunk.record.data["id"]] = chunk.embedding
+
+    def delete(self, delete_ids: List[str], namespace: str, stream: str) -> None:
+        pass
+
+    def check(self) -> Optional[str]:
+        return None
+
+
+def test_write_embeds_batches_concurrently():
+    config_model = ProcessingConfigModel(
+        chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"], embedding_concurrency=2
+    )
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 2 + 5)]
+
+    both_batches_embedding = threading.Barrier(2, timeout=5)
+    embedder = generate_mock_embedder()
+
+    def embed_documents(documents):
+        if embedder.embed_documents.call_count <= 2:
+            # only returns if the second batch is embedded while the first one is still being embedded
+            both_batches_embedding.wait()
+        return [[0] * 1536] * len(documents)
+
+    embedder.embed_documents.side_effect = embed_documents
+    indexer = InMemoryIndexer()
+
+    writer = Writer(config_model, indexer, embedder, BATCH_SIZE, False)
+    list(writer.write(configured_catalog, input_messages))
+
+    assert embedder.embed_documents.call_count == 3
+    assert indexer.records[(None, "example_stream")] == list(range(BATCH_SIZE * 2 + 5))
+
+
+def test_write_emits_state_after_all_previous_batches_are_indexed():
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 3 + 5)]
+    state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage())
+    input_messages.append(state_message)
+    input_messages.extend([_generate_record_message(i) for i in range(BATCH_SIZE * 3 + 5, BATCH_SIZE * 3 + 10)])
+
+    class SlowFakeEmbedder(FakeEmbedder):
+        def embed_documents(self, documents):
+            time.sleep(0.05)
+            return super().embed_documents(documents)
+
+    indexer = InMemoryIndexer()
+    writer = Writer(
+        config_model, indexer, SlowFakeEmbedder(FakeEmbeddingConfigModel(mode="fake")), BATCH_SIZE, False, embedding_concurrency=2
+    )
+
+    output_messages = writer.write(configured_catalog, input_messages)
+    assert next(output_messages) == state_message
+    assert indexer.records[(None, "example_stream")] == list(range(BATCH_SIZE * 3 + 5))
+
+    assert list(output_messages) == []
+    assert indexer.records[(None, "example_stream")] == list(range(BATCH_SIZE * 3 + 10))
+
+
+def test_write_raises_embedding_errors():
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 4)]
+
+    embedder = generate_mock_embedder()
+    embedder.embed_documents.side_effect = ValueError("embedding failed")
+    indexer = InMemoryIndexer()
+
+    writer = Writer(config_model, indexer, embedder, BATCH_SIZE, False, embedding_concurrency=2)
+    with pytest.raises(ValueError, match="embedding failed"):
+        list(writer.write(configured_catalog, input_messages))
+
+    assert indexer.records == {}
+
+
+class CacheableFakeEmbedder(FakeEmbedder):
+    @property
+    def model_id(self) -> Optional[str]:
+        return "fake"
+
+
+def test_write_reuses_cached_embeddings():
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    embedder = CacheableFakeEmbedder(FakeEmbeddingConfigModel(mode="fake"))
+    embedder.embed_documents = MagicMock(wraps=embedder.embed_documents)
+    cache = EmbeddingCache()
+
+    first_indexer = InMemoryIndexer()
+    writer = Writer(config_model, first_indexer, embedder, BATCH_SIZE, False, embedding_cache=cache)
+    list(writer.write(configured_catalog, [_generate_record_message(i) for i in range(10)]))
+    assert sum(len(call_args[0][0]) for call_args in embedder.embed_documents.call_args_list) == 10
+
+    embedder.embed_documents.reset_mock()
+    second_indexer = InMemoryIndexer()
+    writer = Writer(config_model, second_indexer, embedder, BATCH_SIZE, False, embedding_cache=cache)
+    output_messages = list(writer.write(configured_catalog, [_generate_record_message(i) for i in range(5, 15)]))
+
+    # only the 5 new records are embedded
+    assert sum(len(call_args[0][0]) for call_args in embedder.embed_documents.call_args_list) == 5
+    assert all(second_indexer.embeddings[i] == first_indexer.embeddings[i] for i in range(5, 10))
+    # only the lookups of the second sync are reported
+    assert output_messages[0].log.message == "Embedding cache: 5 hits, 5 misses (50.0% hit rate)"
+
+
+def test_write_does_not_cache_embeddings_without_model_id():
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    # the fake embedder returns random embeddings, so they can't be reused
+    embedder = FakeEmbedder(FakeEmbeddingConfigModel(mode="fake"))
+    embedder.embed_documents = MagicMock(wraps=embedder.embed_documents)
+    cache = EmbeddingCache()
+
+    for _ in range(2):
+        writer = Writer(config_model, InMemoryIndexer(), embedder, BATCH_SIZE, False, embedding_cache=cache)
+        list(writer.write(configured_catalog, [_generate_record_message(i) for i in range(10)]))
+
+    assert sum(len(call_args[0][0]) for call_args in embedder.embed_documents.call_args_list) == 20
+    assert cache.hits == 0 and cache.misses == 0
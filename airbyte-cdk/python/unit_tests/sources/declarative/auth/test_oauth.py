@@ -3,6 +3,10 @@
 #
 import base64
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from unittest.mock import Mock
 
 import freezegun
@@ -275,6 +279,47 @@ class TestOauth2Authenticator:
             assert "access_token" == token
             assert oauth.get_token_expiry_date() == pendulum.parse(next_day)
 
+    def test_expired_token_is_refreshed_once_by_concurrent_requests(self, mocker):
+        oauth = DeclarativeOauth2Authenticator(
+            token_refresh_endpoint="{{ config['refresh_endpoint'] }}",
+            client_id="{{ config['client_id'] }}",
+            client_secret="{{ config['client_secret'] }}",
+            refresh_token="{{ parameters['refresh_token'] }}",
+            token_expiry_date="{{ config['token_expiry_date'] }}",
+            config=config,
+            parameters=parameters,
+        )
+        calls = []
+        lock = threading.Lock()
+
+        def refresh_access_token():
+            time.sleep(0.05)
+            with lock:
+                calls.append(1)
+                return f"access_token_{len(calls)}", 3600
+
+        mocker.patch.object(DeclarativeOauth2Authenticator, "refresh_access_token", side_effect=refresh_access_token)
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            access_tokens = set(executor.map(lambda _: oauth.get_access_token(), range(20)))
+
+        assert access_tokens == {"access_token_1"}
+        assert len(calls) == 1
+
+    def test_token_expiry_skew(self):
+        oauth = DeclarativeOauth2Authenticator(
+            token_refresh_endpoint="{{ config['refresh_endpoint'] }}",
+            client_id="{{ config['client_id'] }}",
+            client_secret="{{ config['client_secret'] }}",
+            refresh_token="{{ parameters['refresh_token'] }}",
+            token_expiry_date=pendulum.now().add(seconds=30).to_rfc3339_string(),
+            token_expiry_skew=timedelta(minutes=1),
+            config=config,
+            parameters=parameters,
+        )
+
+        assert oauth.token_has_expired()
+
     def test_error_handling(self, mocker):
         oauth = DeclarativeOauth2Authenticator(
             token_refresh_endpoint="{{ config['refresh_endpoint'] }}",
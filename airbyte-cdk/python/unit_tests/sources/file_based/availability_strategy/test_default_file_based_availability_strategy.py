@@ -46,7 +46,7 @@ class DefaultFileBasedAvailabilityStrategyTest(unittest.TestCase):
         example we've seen was for JSONL parser but the file extension was just `.json`. Note that there we more than one record extracted
         from this stream so it's not just that the file is one JSON object
         """
-        self._stream.get_files.return_value = [_FILE_WITH_UNKNOWN_EXTENSION]
+        self._stream.iter_files.return_value = [_FILE_WITH_UNKNOWN_EXTENSION]
         self._parser.parse_records.return_value = [{"a record": 1}]
 
         is_available, reason = self._strategy.check_availability_and_parsability(self._stream, Mock(), Mock())
@@ -57,7 +57,7 @@ class DefaultFileBasedAvailabilityStrategyTest(unittest.TestCase):
         """
         If no files are returned, then the stream is not available.
         """
-        self._stream.get_files.return_value = []
+        self._stream.iter_files.return_value = []
 
         is_available, reason = self._strategy.check_availability_and_parsability(self._stream, Mock(), Mock())
 
@@ -69,7 +69,7 @@ class DefaultFileBasedAvailabilityStrategyTest(unittest.TestCase):
         If the stream parser sets parser_max_n_files_for_parsability to 0, then we should not call parse_records on it
         """
         self._parser.parser_max_n_files_for_parsability = 0
-        self._stream.get_files.return_value = [_FILE_WITH_UNKNOWN_EXTENSION]
+        self._stream.iter_files.return_value = [_FILE_WITH_UNKNOWN_EXTENSION]
 
         is_available, reason = self._strategy.check_availability_and_parsability(self._stream, Mock(), Mock())
 
@@ -89,10 +89,10 @@ class DefaultFileBasedAvailabilityStrategyTest(unittest.TestCase):
     def test_catching_and_raising_custom_file_based_exception(self) -> None:
         """
         Test if the DefaultFileBasedAvailabilityStrategy correctly handles the CustomFileBasedException
-        by raising a CheckAvailabilityError when the get_files method is called.
+        by raising a CheckAvailabilityError when the iter_files method is called.
         """
-        # Mock the get_files method to raise CustomFileBasedException when called
-        self._stream.get_files.side_effect = CustomFileBasedException("Custom exception for testing.")
+        # Mock the iter_files method to raise CustomFileBasedException when called
+        self._stream.iter_files.side_effect = CustomFileBasedException("Custom exception for testing.")
 
         # Invoke the check_availability_and_parsability method and check if it correctly handles the exception
         is_available, error_message = self._strategy.check_availability_and_parsability(self._stream, Mock(), Mock())
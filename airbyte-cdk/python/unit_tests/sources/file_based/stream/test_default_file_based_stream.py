@@ -164,7 +164,7 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         self._stream.config.schemaless = None
         self._parser.infer_schema.return_value = {"data": {"type": "string"}}
         files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(10)]
-        self._stream_reader.get_matching_files.return_value = files
+        self._stream_reader.list_matching_files.return_value = files
 
         schema = self._stream.get_json_schema()
 
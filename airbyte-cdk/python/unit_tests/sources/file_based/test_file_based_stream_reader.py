@@ -2,8 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
 from io import IOBase
 from typing import Any, Iterable, List, Mapping, Optional, Set
+from unittest.mock import Mock
 
 import pytest
 from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
@@ -270,3 +272,37 @@ def test_globs_and_prefixes_from_globs(
     reader.config = TestSpec(**config)
     assert set([f.uri for f in reader.filter_files_by_globs_and_start_date(FILES, globs)]) == expected_matches
     assert set(reader.get_prefixes_from_globs(globs)) == expected_path_prefixes
+
+
+def test_list_matching_files_reuses_the_listing() -> None:
+    reader = TestStreamReader()
+    reader.config = TestSpec(**DEFAULT_CONFIG)
+    reader.get_matching_files = Mock(side_effect=lambda globs, prefix, logger: iter(FILES))  # type: ignore
+
+    first_listing = reader.list_matching_files(["**"], None, logging.getLogger("airbyte"))
+    second_listing = reader.list_matching_files(["**"], None, logging.getLogger("airbyte"))
+
+    assert first_listing == second_listing == FILES
+    assert reader.get_matching_files.call_count == 1
+    assert reader.listing_cache.metrics == {"hits": 1, "misses": 1}
+
+
+def test_iter_matching_files_lists_lazily_and_reuses_a_cached_listing() -> None:
+    reader = TestStreamReader()
+    reader.config = TestSpec(**DEFAULT_CONFIG)
+    listed_files: List[RemoteFile] = []
+
+    def get_matching_files(globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
+        for file in FILES:
+            listed_files.append(file)
+            yield file
+
+    reader.get_matching_files = Mock(side_effect=get_matching_files)  # type: ignore
+
+    assert next(iter(reader.iter_matching_files(["**"], None, logging.getLogger("airbyte")))) == FILES[0]
+    assert listed_files == FILES[:1]
+    assert reader.listing_cache.metrics == {"hits": 0, "misses": 0}
+
+    reader.list_matching_files(["**"], None, logging.getLogger("airbyte"))
+    assert list(reader.iter_matching_files(["**"], None, logging.getLogger("airbyte"))) == FILES
+    assert reader.get_matching_files.call_count == 2
@@ -0,0 +1,129 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.sources.file_based.file_listing_cache import FileListingCache
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from freezegun import freeze_time
+
+logger = logging.getLogger("airbyte")
+
+_FILES = [
+    RemoteFile(uri="a.csv", last_modified=datetime(2023, 6, 5, 3, 54, 7)),
+    RemoteFile(uri="b.csv", last_modified=datetime(2023, 6, 6)),
+]
+_KEY = {"namespace": "bucket", "globs": ["*.csv"], "prefix": None, "start_date": None}
+
+
+def test_listing_is_reused_within_a_process() -> None:
+    cache = FileListingCache()
+    list_files = Mock(return_value=iter(_FILES))
+
+    assert cache.get_or_list(_KEY, list_files, logger) == _FILES
+    assert cache.get_or_list(dict(_KEY), list_files, logger) == _FILES
+
+    assert list_files.call_count == 1
+    assert cache.metrics == {"hits": 1, "misses": 1}
+
+
+def test_different_globs_are_listed_separately() -> None:
+    cache = FileListingCache()
+    list_files = Mock(side_effect=lambda: iter(_FILES))
+
+    cache.get_or_list(_KEY, list_files, logger)
+    cache.get_or_list({**_KEY, "globs": ["**/*.csv"]}, list_files, logger)
+
+    assert list_files.call_count == 2
+    assert cache.metrics == {"hits": 0, "misses": 2}
+
+
+def test_listing_expires_after_ttl() -> None:
+    cache = FileListingCache(ttl=timedelta(minutes=5))
+    list_files = Mock(side_effect=lambda: iter(_FILES))
+
+    with freeze_time("2023-06-10T00:00:00") as frozen_time:
+        cache.get_or_list(_KEY, list_files, logger)
+        frozen_time.tick(timedelta(minutes=4))
+        cache.get_or_list(_KEY, list_files, logger)
+        assert list_files.call_count == 1
+
+        frozen_time.tick(timedelta(minutes=2))
+        cache.get_or_list(_KEY, list_files, logger)
+        assert list_files.call_count == 2
+
+
+def test_listing_is_persisted_between_invocations(tmp_path) -> None:
+    FileListingCache(cache_dir=str(tmp_path)).get_or_list(_KEY, lambda: iter(_FILES), logger)
+
+    list_files = Mock()
+    cache = FileListingCache(cache_dir=str(tmp_path))
+
+    assert cache.get_or_list(_KEY, list_files, logger) == _FILES
+    list_files.assert_not_called()
+    assert cache.metrics == {"hits": 1, "misses": 0}
+
+
+def test_corrupted_persisted_listing_is_ignored(tmp_path) -> None:
+    cache = FileListingCache(cache_dir=str(tmp_path))
+    cache.get_or_list(_KEY, lambda: iter(_FILES), logger)
+    for path in tmp_path.iterdir():
+        path.write_bytes(b"not a pickle")
+
+    assert FileListingCache(cache_dir=str(tmp_path)).get_or_list(_KEY, lambda: iter(_FILES[:1]), logger) == _FILES[:1]
+
+
+def test_errors_while_listing_are_not_cached() -> None:
+    cache = FileListingCache()
+    list_files = Mock(side_effect=[Exception("Error listing files"), iter(_FILES)])
+
+    with pytest.raises(Exception):
+        cache.get_or_list(_KEY, list_files, logger)
+
+    assert cache.get_or_list(_KEY, list_files, logger) == _FILES
+    assert list_files.call_count == 2
+
+
+def test_returned_listing_is_a_copy() -> None:
+    cache = FileListingCache()
+    cache.get_or_list(_KEY, lambda: iter(_FILES), logger).clear()
+    cache.get_or_list(_KEY, lambda: iter([]), logger).append(_FILES[0])
+
+    assert cache.get_or_list(_KEY, lambda: iter([]), logger) == _FILES
+    assert cache.get(_KEY, logger) == _FILES
+
+
+def test_different_keys_are_listed_concurrently() -> None:
+    cache = FileListingCache()
+    # fails unless both listings run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def list_files() -> List[RemoteFile]:
+        barrier.wait()
+        return _FILES
+
+    threads = [
+        threading.Thread(target=cache.get_or_list, args=({**_KEY, "globs": [glob]}, list_files, logger)) for glob in ["*.csv", "**/*.csv"]
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not barrier.broken
+    assert cache.metrics == {"hits": 0, "misses": 2}
+
+
+def test_get_does_not_list_files() -> None:
+    cache = FileListingCache()
+    assert cache.get(_KEY, logger) is None
+
+    cache.get_or_list(_KEY, lambda: iter(_FILES), logger)
+    assert cache.get(_KEY, logger) == _FILES
+    assert cache.metrics == {"hits": 1, "misses": 1}
@@ -4,7 +4,11 @@
 
 import json
 import logging
-from typing import Optional, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Mapping, Optional, Union
 from unittest.mock import Mock
 
 import freezegun
@@ -78,6 +82,33 @@ def test_multiple_token_authenticator():
     assert {"Authorization": "Bearer token1"} == header3
 
 
+class FakeTokenEndpoint:
+    """
+    Token endpoint issuing a new single use refresh token with each access token, slow enough for concurrent refreshes to overlap
+    """
+
+    def __init__(self, authenticator: Oauth2Authenticator, refresh_token: str):
+        self._authenticator = authenticator
+        self._refresh_token = refresh_token
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def __call__(self) -> Mapping[str, Any]:
+        refresh_token = self._authenticator.build_refresh_request_body()["refresh_token"]
+        time.sleep(0.05)
+        with self._lock:
+            if refresh_token != self._refresh_token:
+                raise Exception(f"Refresh token {refresh_token} was already used")
+            self.calls += 1
+            self._refresh_token = f"refresh_token_{self.calls}"
+            return {"access_token": f"access_token_{self.calls}", "expires_in": 3600, "refresh_token": self._refresh_token}
+
+
+def _get_access_tokens_concurrently(authenticator: Oauth2Authenticator, threads: int = 20) -> set:
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return set(executor.map(lambda _: authenticator.get_access_token(), range(threads)))
+
+
 class TestOauth2Authenticator:
     """
     Test class for OAuth2Authenticator.
@@ -289,6 +320,38 @@ class TestOauth2Authenticator:
             assert exc_info.value.message == error_message
             assert exc_info.value.failure_type == FailureType.config_error
 
+    def test_expired_token_is_refreshed_once_by_concurrent_requests(self):
+        oauth = Oauth2Authenticator(
+            token_refresh_endpoint=TestOauth2Authenticator.refresh_endpoint,
+            client_id=TestOauth2Authenticator.client_id,
+            client_secret=TestOauth2Authenticator.client_secret,
+            refresh_token=TestOauth2Authenticator.refresh_token,
+        )
+        token_endpoint = FakeTokenEndpoint(oauth, TestOauth2Authenticator.refresh_token)
+        oauth._get_refresh_access_token_response = token_endpoint
+
+        assert _get_access_tokens_concurrently(oauth) == {"access_token_1"}
+        assert token_endpoint.calls == 1
+
+    @pytest.mark.parametrize(
+        "token_expiry_skew, expired",
+        [
+            pytest.param(timedelta(0), False, id="test_token_expiring_soon_is_valid"),
+            pytest.param(timedelta(minutes=1), True, id="test_token_expiring_within_skew_is_refreshed"),
+        ],
+    )
+    def test_token_expiry_skew(self, token_expiry_skew, expired):
+        oauth = Oauth2Authenticator(
+            token_refresh_endpoint=TestOauth2Authenticator.refresh_endpoint,
+            client_id=TestOauth2Authenticator.client_id,
+            client_secret=TestOauth2Authenticator.client_secret,
+            refresh_token=TestOauth2Authenticator.refresh_token,
+            token_expiry_date=pendulum.now().add(seconds=30),
+            token_expiry_skew=token_expiry_skew,
+        )
+
+        assert oauth.token_has_expired() == expired
+
 
 class TestSingleUseRefreshTokenOauth2Authenticator:
     @pytest.fixture
@@ -416,6 +479,29 @@ class TestSingleUseRefreshTokenOauth2Authenticator:
         )
         assert authenticator.refresh_access_token() == ("new_access_token", "42", "new_refresh_token")
 
+    def test_single_use_refresh_token_is_used_once_by_concurrent_requests(self, connector_config):
+        message_repository = Mock()
+        authenticator = SingleUseRefreshTokenOauth2Authenticator(
+            connector_config,
+            token_refresh_endpoint="foobar",
+            message_repository=message_repository,
+        )
+        token_endpoint = FakeTokenEndpoint(authenticator, connector_config["credentials"]["refresh_token"])
+        authenticator._get_refresh_access_token_response = token_endpoint
+
+        assert _get_access_tokens_concurrently(authenticator) == {"access_token_1"}
+        assert token_endpoint.calls == 1
+        assert authenticator.get_refresh_token() == "refresh_token_1"
+        assert message_repository.emit_message.call_count == 1
+
+    def test_token_expiry_skew(self, connector_config):
+        connector_config["credentials"]["token_expiry_date"] = str(pendulum.now("UTC").add(seconds=30))
+        authenticator = SingleUseRefreshTokenOauth2Authenticator(
+            connector_config, token_refresh_endpoint="foobar", token_expiry_skew=timedelta(minutes=1)
+        )
+
+        assert authenticator.token_has_expired()
+
 
 def mock_request(method, url, data):
     if url == "refresh_end":
@@ -3,14 +3,20 @@
 #
 
 import logging
+from datetime import timedelta
 from typing import Any, Iterable, List, Mapping, Optional, Tuple
+from unittest.mock import MagicMock
 
 import pytest
 import requests
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
 from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.sources.utils.schema_helpers import InternalConfig
+from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
 from requests import HTTPError
 
 logger = logging.getLogger("airbyte")
@@ -178,3 +184,135 @@ def test_http_availability_strategy_on_empty_stream(mocker, records_as_list):
 
     assert stream_is_available
     assert empty_stream.read_records.called
+
+
+class MockPaginatedHttpStream(MockHttpStream):
+    def __init__(self, availability_strategy: Optional[AvailabilityStrategy] = None, pages: int = 3, **kwargs):
+        super().__init__(**kwargs)
+        self._availability_strategy = availability_strategy or HttpAvailabilityStrategy()
+        self.pages = pages
+
+    @property
+    def availability_strategy(self) -> Optional[AvailabilityStrategy]:
+        return self._availability_strategy
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return {"page": self.resp_counter} if self.resp_counter <= self.pages else None
+
+
+def _ok_response() -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    return response
+
+
+def _records(messages: Iterable[Any]) -> List[Mapping[str, Any]]:
+    # slices are logged as well if another test set the logger to debug
+    return [message for message in messages if isinstance(message, Mapping)]
+
+
+def test_full_refresh_read_continues_reads_of_availability_check(mocker):
+    mock_send = mocker.patch.object(requests.Session, "send", side_effect=lambda *args, **kwargs: _ok_response())
+    http_stream = MockPaginatedHttpStream()
+
+    assert http_stream.check_availability(logger) == (True, None)
+    assert mock_send.call_count == 1
+
+    records = _records(http_stream.read_full_refresh(None, logger, DebugSliceLogger()))
+
+    assert records == [{"data": 1}, {"data": 2}, {"data": 3}]
+    # the first page requested by the availability check is not requested again
+    assert mock_send.call_count == 3
+
+
+def test_full_refresh_read_with_other_cursor_field_reads_again(mocker):
+    mock_send = mocker.patch.object(requests.Session, "send", side_effect=lambda *args, **kwargs: _ok_response())
+    http_stream = MockPaginatedHttpStream(pages=1)
+
+    http_stream.check_availability(logger)
+    records = _records(http_stream.read_full_refresh(["updated_at"], logger, DebugSliceLogger()))
+
+    assert records == [{"data": 2}]
+    assert mock_send.call_count == 2
+
+
+def test_full_refresh_read_without_cursor_field_continues_reads_of_availability_check_with_own_cursor_field(mocker):
+    mock_send = mocker.patch.object(requests.Session, "send", side_effect=lambda *args, **kwargs: _ok_response())
+
+    class MockPaginatedHttpStreamWithCursor(MockPaginatedHttpStream):
+        cursor_field = "updated_at"
+
+    http_stream = MockPaginatedHttpStreamWithCursor(pages=1)
+
+    http_stream.check_availability(logger)
+    records = _records(http_stream.read_full_refresh([], logger, DebugSliceLogger()))
+
+    assert records == [{"data": 1}]
+    assert mock_send.call_count == 1
+
+
+def test_skipping_availability_checks_requires_a_cache_path():
+    with pytest.raises(ValueError):
+        HttpAvailabilityStrategy(skip_if_available_within=timedelta(minutes=10))
+
+
+def test_incremental_read_does_not_reuse_reads_of_availability_check(mocker):
+    mock_send = mocker.patch.object(requests.Session, "send", side_effect=lambda *args, **kwargs: _ok_response())
+    http_stream = MockPaginatedHttpStream(pages=1)
+
+    http_stream.check_availability(logger)
+    records = _records(http_stream.read_incremental(None, logger, DebugSliceLogger(), {}, MagicMock(), True, InternalConfig()))
+
+    assert records == [{"data": 2}]
+    assert mock_send.call_count == 2
+    assert _records(http_stream.read_full_refresh(None, logger, DebugSliceLogger())) == [{"data": 3}]
+
+
+def test_availability_check_is_skipped_for_streams_available_within(mocker, tmp_path):
+    mock_send = mocker.patch.object(requests.Session, "send", side_effect=lambda *args, **kwargs: _ok_response())
+    mock_time = mocker.patch("airbyte_cdk.sources.streams.http.availability_strategy.time.time", return_value=1000.0)
+    availability_strategy = HttpAvailabilityStrategy(
+        skip_if_available_within=timedelta(minutes=10), cache_path=str(tmp_path / "cache.json")
+    )
+
+    assert MockPaginatedHttpStream(availability_strategy, authenticator=TokenAuthenticator("token")).check_availability(logger) == (
+        True,
+        None,
+    )
+    assert mock_send.call_count == 1
+
+    mock_time.return_value = 1000.0 + 60
+    assert MockPaginatedHttpStream(availability_strategy, authenticator=TokenAuthenticator("token")).check_availability(logger) == (
+        True,
+        None,
+    )
+    assert mock_send.call_count == 1
+
+    # other credentials are checked again
+    assert MockPaginatedHttpStream(availability_strategy, authenticator=TokenAuthenticator("other")).check_availability(logger) == (
+        True,
+        None,
+    )
+    assert mock_send.call_count == 2
+
+    mock_time.return_value = 1000.0 + 11 * 60
+    assert MockPaginatedHttpStream(availability_strategy, authenticator=TokenAuthenticator("token")).check_availability(logger) == (
+        True,
+        None,
+    )
+    assert mock_send.call_count == 3
+
+
+def test_unavailable_streams_are_not_remembered(mocker, tmp_path):
+    response = requests.Response()
+    response.status_code = 403
+    response._content = b"{}"
+    mock_send = mocker.patch.object(requests.Session, "send", return_value=response)
+    availability_strategy = HttpAvailabilityStrategy(
+        skip_if_available_within=timedelta(minutes=10), cache_path=str(tmp_path / "cache.json")
+    )
+
+    for _ in range(2):
+        is_available, _ = MockPaginatedHttpStream(availability_strategy).check_availability(logger)
+        assert not is_available
+    assert mock_send.call_count == 2
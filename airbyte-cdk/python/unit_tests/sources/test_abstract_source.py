@@ -54,11 +54,13 @@ class MockSource(AbstractSource):
         per_stream: bool = True,
         message_repository: MessageRepository = None,
         exception_on_missing_stream: bool = True,
+        compact_state_messages: bool = False,
     ):
         self._streams = streams
         self.check_lambda = check_lambda
         self.per_stream = per_stream
         self.exception_on_missing_stream = exception_on_missing_stream
+        self.compact_state_messages = compact_state_messages
         self._message_repository = message_repository
 
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
@@ -79,6 +81,10 @@ class MockSource(AbstractSource):
     def per_stream_state_enabled(self) -> bool:
         return self.per_stream
 
+    @property
+    def compact_state_messages_enabled(self) -> bool:
+        return self.compact_state_messages
+
     @property
     def message_repository(self):
         return self._message_repository
@@ -1168,6 +1174,23 @@ def test_checkpoint_state_from_stream_instance():
     )
 
 
+def test_compact_state_messages_only_hold_the_state_of_their_stream(mocker):
+    stream_output = [{"k1": "v1"}]
+    stream_1 = MockStreamWithState([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name="s1")
+    stream_2 = MockStreamWithState([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name="s2")
+    mocker.patch.object(MockStreamWithState, "state", new_callable=mocker.PropertyMock, return_value={"cursor": "new_value"})
+    mocker.patch.object(MockStreamWithState, "get_json_schema", return_value={})
+    src = MockSource(streams=[stream_1, stream_2], compact_state_messages=True)
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(stream_1, SyncMode.incremental), _configured_stream(stream_2, SyncMode.incremental)]
+    )
+
+    state_messages = [message for message in src.read(logger, {}, catalog) if message.type == Type.STATE]
+
+    assert state_messages == [_as_state(None, "s1", {"cursor": "new_value"}), _as_state(None, "s2", {"cursor": "new_value"})]
+    assert all("data" not in message.state.dict(exclude_unset=True) for message in state_messages)
+
+
 def test_continue_sync_with_failed_streams(mocker):
     """
     Tests that running a sync for a connector with multiple streams and continue_sync_on_stream_failure enabled continues
@@ -590,3 +590,33 @@ def test_do_not_set_stream_descriptor_namespace_when_none():
     actual_state_message = state_manager.create_state_message(stream_name="episodes", namespace=None, send_per_stream_state=True)
 
     assert actual_state_message.state.stream.stream_descriptor.dict(exclude_unset=True) == expected_stream_state_descriptor
+
+
+def test_legacy_state_of_state_messages_is_kept_up_to_date():
+    state_manager = ConnectorStateManager({}, {"actors": {"id": "mckean_michael"}})
+
+    state_manager.update_state_for_stream("actresses", None, {"id": "seehorn_rhea"})
+    first_message = state_manager.create_state_message("actresses", None, send_per_stream_state=True)
+    state_manager.update_state_for_stream("actors", None, {"id": "odenkirk_bob"})
+    second_message = state_manager.create_state_message("actors", None, send_per_stream_state=True)
+
+    assert first_message.state.data == {"actors": {"id": "mckean_michael"}, "actresses": {"id": "seehorn_rhea"}}
+    assert second_message.state.data == {"actors": {"id": "odenkirk_bob"}, "actresses": {"id": "seehorn_rhea"}}
+    assert state_manager.create_state_message("actors", None, send_per_stream_state=False).state.data == second_message.state.data
+
+
+def test_compact_state_messages_only_hold_the_state_of_their_stream():
+    state_manager = ConnectorStateManager({}, {"actors": {"id": "mckean_michael"}}, compact_state_messages=True)
+
+    state_manager.update_state_for_stream("actresses", None, {"id": "seehorn_rhea"})
+    message = state_manager.create_state_message("actresses", None, send_per_stream_state=True)
+
+    assert message.state.dict(exclude_unset=True) == {
+        "type": AirbyteStateType.STREAM,
+        "stream": {"stream_descriptor": {"name": "actresses"}, "stream_state": {"id": "seehorn_rhea"}},
+    }
+    # legacy state messages always hold the state of all the streams
+    assert state_manager.create_state_message("actresses", None, send_per_stream_state=False).state.data == {
+        "actors": {"id": "mckean_michael"},
+        "actresses": {"id": "seehorn_rhea"},
+    }
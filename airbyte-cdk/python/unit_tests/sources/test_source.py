@@ -517,18 +517,18 @@ def test_read_default_http_availability_strategy_stream_available(catalog, mocke
     assert isinstance(http_stream.availability_strategy, HttpAvailabilityStrategy)
     assert non_http_stream.availability_strategy is None
 
-    # Add an extra record for the default HttpAvailabilityStrategy to pull from
-    # during the try: next(records) check, since we are mocking the return value
-    # and not re-creating the generator like we would during actual reading
+    # The default HttpAvailabilityStrategy reads the first record of the http stream, and the full refresh read
+    # continues the records of the check instead of reading the stream again, so that record is emitted too
     http_stream.read_records.return_value = iter([{"value": "test"}] + [{}] * 3)
     non_http_stream.read_records.return_value = iter([{}] * 3)
 
     source = MockAbstractSource(streams=streams)
     logger = logging.getLogger(f"airbyte.{getattr(abstract_source, 'name', '')}")
     records = [r for r in source.read(logger=logger, config={}, catalog=catalog, state={})]
-    # 3 for http stream, 3 for non http stream and 3 for stream status messages for each stream (2x)
-    assert len(records) == 3 + 3 + 3 + 3
-    assert http_stream.read_records.called
+    # 4 for http stream, 3 for non http stream and 3 for stream status messages for each stream (2x)
+    assert len(records) == 4 + 3 + 3 + 3
+    assert [r.record.data for r in records if r.type == Type.RECORD][0] == {"value": "test"}
+    assert http_stream.read_records.call_count == 1
     assert non_http_stream.read_records.called
 
 
@@ -15,7 +15,13 @@ from pathlib import Path
 import jsonref
 import pytest
 from airbyte_cdk.models.airbyte_protocol import ConnectorSpecification, FailureType
-from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, ResourceSchemaLoader, check_config_against_spec_or_exit
+from airbyte_cdk.sources.utils.schema_helpers import (
+    RESOLVED_SCHEMAS_FILENAME,
+    InternalConfig,
+    ResourceSchemaLoader,
+    check_config_against_spec_or_exit,
+    write_resolved_schemas,
+)
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from pytest import fixture
 from pytest import raises as pytest_raises
@@ -36,6 +42,24 @@ def create_and_teardown_schemas_dir():
     shutil.rmtree(SCHEMAS_ROOT)
 
 
+@fixture(autouse=True)
+def clear_schema_cache():
+    # tests write different schemas under the same name
+    ResourceSchemaLoader.clear_cache()
+    yield
+    ResourceSchemaLoader.clear_cache()
+
+
+@fixture
+def empty_schemas_dir():
+    # resolved schemas artifacts hold all the schemas of the package, including the ones left by other tests
+    for path in SCHEMAS_ROOT.glob("*.json"):
+        os.remove(path)
+    yield
+    for path in SCHEMAS_ROOT.glob("*.json"):
+        os.remove(path)
+
+
 def create_schema(name: str, content: Mapping):
     with open(SCHEMAS_ROOT / f"{name}.json", "w") as f:
         f.write(json.dumps(content))
@@ -191,6 +215,46 @@ class TestResourceSchemaLoader:
         assert json.dumps(actual_schema)
         assert jsonref.JsonRef.replace_refs(actual_schema)
 
+    @staticmethod
+    def test_resolved_schemas_are_cached_for_the_process(mocker):
+        create_schema("cached_schema", {"type": "object", "properties": {"obj": {"$ref": "shared_schema.json"}}})
+        create_schema("shared/shared_schema", {"type": "object"})
+        schema = ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema")
+
+        resolve = mocker.patch.object(ResourceSchemaLoader, "_resolve_schema_references")
+        other_schema = ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema")
+
+        resolve.assert_not_called()
+        assert other_schema == schema == {"type": "object", "properties": {"obj": {"type": "object"}}}
+        # callers get their own copy of the schema
+        other_schema["properties"]["new"] = {"type": "string"}
+        assert ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema") == schema
+
+    @staticmethod
+    @pytest.mark.usefixtures("empty_schemas_dir")
+    def test_resolved_schemas_artifact_is_used(mocker):
+        create_schema("artifact_schema", {"type": "object", "properties": {"obj": {"$ref": "shared_schema.json"}}})
+        create_schema("shared/shared_schema", {"type": "object"})
+        assert write_resolved_schemas(MODULE_NAME) == str(SCHEMAS_ROOT / RESOLVED_SCHEMAS_FILENAME)
+
+        resolve = mocker.patch.object(ResourceSchemaLoader, "_resolve_schema_references")
+        schema = ResourceSchemaLoader(MODULE_NAME).get_schema("artifact_schema")
+
+        resolve.assert_not_called()
+        assert schema == {"type": "object", "properties": {"obj": {"type": "object"}}}
+
+    @staticmethod
+    @pytest.mark.usefixtures("empty_schemas_dir")
+    def test_resolved_schemas_artifact_is_ignored_if_schemas_changed():
+        create_schema("artifact_schema", {"type": "object", "properties": {"obj": {"$ref": "shared_schema.json"}}})
+        create_schema("shared/shared_schema", {"type": "object"})
+        write_resolved_schemas(MODULE_NAME)
+        create_schema("shared/shared_schema", {"type": "string"})
+
+        schema = ResourceSchemaLoader(MODULE_NAME).get_schema("artifact_schema")
+
+        assert schema == {"type": "object", "properties": {"obj": {"type": "string"}}}
+
 
 @pytest.mark.parametrize(
     "limit, record_count, expected",
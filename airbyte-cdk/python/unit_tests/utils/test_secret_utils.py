@@ -2,6 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+
 import pytest
 from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets, get_secret_paths, get_secrets, update_secrets
 
@@ -121,3 +123,23 @@ def test_secret_filtering():
     update_secrets([SECRET_STRING_VALUE, SECRET_STRING_2_VALUE])
     filtered = filter_secrets(sensitive_str)
     assert filtered == f"**** {NOT_SECRET_VALUE} **** ****"
+
+
+@pytest.mark.parametrize(
+    ["secrets", "string", "expected"],
+    [
+        pytest.param(["x", "xk"], "a xk b x", "a **** b ****", id="test_secret_containing_another_secret"),
+        pytest.param(["xk", "x"], "a xk b x", "a **** b ****", id="test_secret_containing_another_secret_in_other_order"),
+        pytest.param(["abc", "cde"], "abcde", "****", id="test_overlapping_secrets"),
+        pytest.param(["abc", "def"], "abcdef abc", "**** ****", id="test_adjacent_secrets"),
+        pytest.param(["aa"], "aaa", "****", id="test_overlapping_occurrences"),
+        pytest.param([1337], '{"port": 1337}', '{"port": ****}', id="test_int_secret"),
+        pytest.param(['pa"ss\\'], json.dumps({"password": 'pa"ss\\'}), '{"password": "****"}', id="test_json_escaped_secret"),
+        pytest.param(["pässword"], json.dumps({"password": "pässword"}), '{"password": "****"}', id="test_json_escaped_unicode_secret"),
+        pytest.param(["long_secret"], "short", "short", id="test_string_shorter_than_secrets"),
+    ],
+)
+def test_secret_filtering_masks_every_occurrence_of_every_secret(secrets, string, expected):
+    update_secrets(secrets)
+    assert filter_secrets(string) == expected
+    update_secrets([])
@@ -2,10 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import functools
 import json
 import logging
+import os
 import re
+import time
 from collections import Counter, defaultdict
 from functools import reduce
 from logging import Logger
@@ -40,7 +41,14 @@ from connector_acceptance_test.config import (
     NoPrimaryKeyConfiguration,
     SpecTestConfig,
 )
-from connector_acceptance_test.utils import ConnectorRunner, SecretDict, delete_fields, filter_output, make_hashable, verify_records_schema
+from connector_acceptance_test.utils import (
+    ConnectorRunner,
+    SecretDict,
+    delete_fields,
+    diff_records,
+    filter_output,
+    verify_records_schema,
+)
 from connector_acceptance_test.utils.backward_compatibility import CatalogDiffChecker, SpecDiffChecker, validate_previous_configs
 from connector_acceptance_test.utils.common import (
     build_configured_catalog_from_custom_catalog,
@@ -844,7 +852,11 @@ class TestBasicRead(BaseTest):
         """
         TestBasicRead._validate_records_structure(records, configured_catalog)
         bar = "-" * 80
-        streams_errors = verify_records_schema(records, configured_catalog, fail_on_extra_columns)
+        # validating the records of connectors with large outputs can be spread over several processes
+        workers = int(os.environ.get("SCHEMA_VALIDATION_WORKERS", 1))
+        start = time.perf_counter()
+        streams_errors = verify_records_schema(records, configured_catalog, fail_on_extra_columns, workers=workers)
+        logging.info(f"Validated {len(records)} records against the stream schemas in {time.perf_counter() - start:.2f}s")
         for stream_name, errors in streams_errors.items():
             errors = map(str, errors.values())
             str_errors = f"\n{bar}\n".join(errors)
@@ -1108,32 +1120,26 @@ class TestBasicRead(BaseTest):
                 equals = r1 == r2
                 assert equals, f"Stream {stream_name}: Mismatch of record order or values\nDiff actual vs expected:{complete_diff}"
         else:
-            _make_hashable = functools.partial(make_hashable, exclude_fields=ignored_fields) if ignored_fields else make_hashable
-            expected = set(map(_make_hashable, expected))
-            actual = set(map(_make_hashable, actual))
-            missing_expected = set(expected) - set(actual)
+            missing_expected, extra_actual = diff_records(expected, actual, exclude_fields=ignored_fields)
+            detailed_logger.info(
+                f"Stream {stream_name}: {len(missing_expected)} of {len(expected)} expected records missing, "
+                f"{len(extra_actual)} of {len(actual)} actual records not expected"
+            )
 
             if missing_expected:
-                extra = set(actual) - set(expected)
                 msg = f"Stream {stream_name}: All expected records must be produced"
                 detailed_logger.info(msg)
                 detailed_logger.info("missing:")
                 detailed_logger.log_json_list(sorted(missing_expected, key=lambda record: str(record.get("ID", "0"))))
-                detailed_logger.info("expected:")
-                detailed_logger.log_json_list(sorted(expected, key=lambda record: str(record.get("ID", "0"))))
-                detailed_logger.info("actual:")
-                detailed_logger.log_json_list(sorted(actual, key=lambda record: str(record.get("ID", "0"))))
                 detailed_logger.info("extra:")
-                detailed_logger.log_json_list(sorted(extra, key=lambda record: str(record.get("ID", "0"))))
+                detailed_logger.log_json_list(sorted(extra_actual, key=lambda record: str(record.get("ID", "0"))))
                 pytest.fail(msg)
 
-            if not extra_records:
-                extra_actual = set(actual) - set(expected)
-                if extra_actual:
-                    msg = f"Stream {stream_name}: There are more records than expected, but extra_records is off"
-                    detailed_logger.info(msg)
-                    detailed_logger.log_json_list(extra_actual)
-                    pytest.fail(msg)
+            if not extra_records and extra_actual:
+                msg = f"Stream {stream_name}: There are more records than expected, but extra_records is off"
+                detailed_logger.info(msg)
+                detailed_logger.log_json_list(extra_actual)
+                pytest.fail(msg)
 
     @staticmethod
     def group_by_stream(records: List[AirbyteRecordMessage]) -> MutableMapping[str, List[MutableMapping]]:
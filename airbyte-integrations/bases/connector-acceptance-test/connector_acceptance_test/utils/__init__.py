@@ -12,7 +12,7 @@ from .common import (
     load_config,
     load_yaml_or_json_path,
 )
-from .compare import delete_fields, diff_dicts, make_hashable
+from .compare import delete_fields, diff_dicts, diff_records, make_hashable, record_fingerprint
 from .connector_runner import ConnectorRunner
 from .json_schema_helper import JsonSchemaHelper
 
@@ -27,6 +27,8 @@ __all__ = [
     "ConnectorRunner",
     "diff_dicts",
     "make_hashable",
+    "record_fingerprint",
+    "diff_records",
     "verify_records_schema",
     "build_configured_catalog_from_custom_catalog",
     "build_configured_catalog_from_discovered_catalog_and_empty_streams",
@@ -3,10 +3,11 @@
 #
 
 import copy
+import functools
 import logging
 import re
-from collections import defaultdict
-from typing import Any, Dict, List, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 import dpath.util
 import pendulum
@@ -26,8 +27,13 @@ strict_integer_type_checker = Draft7Validator.TYPE_CHECKER.redefine("integer", l
 Draft7ValidatorWithStrictInteger = validators.extend(Draft7Validator, type_checker=strict_integer_type_checker)
 
 
+# Records of a stream validated by a single task when the validation runs in parallel
+VALIDATION_CHUNK_SIZE = 10_000
+
+
 class CustomFormatChecker(FormatChecker):
     @staticmethod
+    @functools.lru_cache(maxsize=10_000)
     def check_datetime(value: str) -> bool:
         valid_format = timestamp_regex.match(value)
         try:
@@ -57,29 +63,123 @@ def _enforce_no_additional_top_level_properties(json_schema: Dict[str, Any]):
     return enforced_schema
 
 
+def _without_failing_keyword(schema: Dict[str, Any], error: ValidationError) -> Optional[Dict[str, Any]]:
+    """Copy the schema without the keyword failing in a validation error, so that records are no longer checked against it.
+    Returns None when the keyword can't be found at the schema path of the error, e.g. behind a `$ref`.
+    """
+    *parent_path, keyword = error.schema_path or [None]
+    if keyword != error.validator:
+        return None
+    pruned_schema = copy.deepcopy(schema)
+    parent = pruned_schema
+    for key in parent_path:
+        try:
+            parent = parent[key]
+        except (IndexError, KeyError, TypeError):
+            return None
+    if not isinstance(parent, dict) or keyword not in parent:
+        return None
+    del parent[keyword]
+    return pruned_schema
+
+
+def _iter_first_errors(validator: Draft7Validator, records: List[Mapping[str, Any]]) -> Iterator[Tuple[int, ValidationError]]:
+    """Validate records, yielding the first error of each schema path with the position of its record.
+    The keyword of a yielded schema path is removed from the schema the next records are validated against.
+    """
+    schema_paths = set()
+    for position, record in enumerate(records):
+        new_errors = [error for error in validator.iter_errors(record) if str(error.schema_path) not in schema_paths]
+        if not new_errors:
+            continue
+        schema = validator.schema
+        for error in new_errors:
+            if str(error.schema_path) in schema_paths:
+                continue
+            schema_paths.add(str(error.schema_path))
+            schema = _without_failing_keyword(schema, error) or schema
+            yield position, error
+        validator = validator.evolve(schema=schema)
+
+
+def _first_errors(validator: Draft7Validator, records: List[Mapping[str, Any]]) -> Dict[str, ValidationError]:
+    """Validate records, keeping the first error of each schema path."""
+    return {str(error.schema_path): error for _, error in _iter_first_errors(validator, records)}
+
+
+def _first_error_positions(schema: Dict[str, Any], records: List[Mapping[str, Any]]) -> Dict[str, int]:
+    """Validate records in a worker process, returning the position of the first record with an error for each schema path.
+    Validation errors can't be pickled, they are rebuilt from these records by the calling process.
+    """
+    validator = Draft7ValidatorWithStrictInteger(schema, format_checker=CustomFormatChecker())
+    return {str(error.schema_path): position for position, error in _iter_first_errors(validator, records)}
+
+
 def verify_records_schema(
-    records: List[AirbyteRecordMessage], catalog: ConfiguredAirbyteCatalog, fail_on_extra_columns: bool
+    records: List[AirbyteRecordMessage], catalog: ConfiguredAirbyteCatalog, fail_on_extra_columns: bool, workers: Optional[int] = None
 ) -> Mapping[str, Mapping[str, ValidationError]]:
     """Check records against their schemas from the catalog, yield error messages.
-    Only first record with error will be yielded for each stream.
+    Only first record with error will be yielded for each stream and schema path.
+
+    Args:
+        records (List[AirbyteRecordMessage]): The records to validate.
+        catalog (ConfiguredAirbyteCatalog): The catalog with the schemas of the streams.
+        fail_on_extra_columns (bool): Whether records may not have top-level properties not declared in the schema.
+        workers (Optional[int], optional): Number of processes validating chunks of records in parallel. Defaults to validating in the
+            calling process.
+
+    Returns:
+        Mapping[str, Mapping[str, ValidationError]]: The first error of each schema path, by stream.
     """
-    stream_validators = {}
+    stream_schemas = {}
     for stream in catalog.streams:
         schema_to_validate_against = stream.stream.json_schema
         if fail_on_extra_columns:
             schema_to_validate_against = _enforce_no_additional_top_level_properties(schema_to_validate_against)
-        stream_validators[stream.stream.name] = Draft7ValidatorWithStrictInteger(
-            schema_to_validate_against, format_checker=CustomFormatChecker()
-        )
-    stream_errors = defaultdict(dict)
+        stream_schemas[stream.stream.name] = schema_to_validate_against
+
+    records_by_stream: Dict[str, List[Mapping[str, Any]]] = {}
     for record in records:
-        validator = stream_validators.get(record.stream)
-        if not validator:
+        if record.stream not in stream_schemas:
             logging.error(f"Received record from the `{record.stream}` stream, which is not in the catalog.")
             continue
+        records_by_stream.setdefault(record.stream, []).append(record.data)
 
-        errors = list(validator.iter_errors(record.data))
-        for error in errors:
-            stream_errors[record.stream][str(error.schema_path)] = error
+    stream_errors = {}
+    for stream, stream_records in records_by_stream.items():
+        validator = Draft7ValidatorWithStrictInteger(stream_schemas[stream], format_checker=CustomFormatChecker())
+        if workers and workers > 1 and len(stream_records) > VALIDATION_CHUNK_SIZE:
+            errors = _first_errors_in_parallel(validator, stream_schemas[stream], stream_records, workers)
+        else:
+            errors = _first_errors(validator, stream_records)
+        if errors:
+            stream_errors[stream] = errors
 
     return stream_errors
+
+
+def _first_errors_in_parallel(
+    validator: Draft7Validator, schema: Dict[str, Any], records: List[Mapping[str, Any]], workers: int
+) -> Dict[str, ValidationError]:
+    """Validate chunks of records in worker processes, then rebuild the first error of each schema path from the records having it."""
+    chunk_starts = range(0, len(records), VALIDATION_CHUNK_SIZE)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk_positions = list(
+            executor.map(
+                _first_error_positions,
+                [schema] * len(chunk_starts),
+                [records[start : start + VALIDATION_CHUNK_SIZE] for start in chunk_starts],
+            )
+        )
+    first_positions: Dict[str, int] = {}
+    for start, positions in zip(chunk_starts, chunk_positions):
+        for schema_path, position in positions.items():
+            first_positions.setdefault(schema_path, start + position)
+
+    errors = {}
+    for position in sorted(set(first_positions.values())):
+        for schema_path, error in _first_errors(validator, [records[position]]).items():
+            if first_positions.get(schema_path) == position:
+                errors[schema_path] = error
+    # keep the order of the errors found by a sequential validation
+    return {schema_path: errors[schema_path] for schema_path in sorted(errors, key=lambda schema_path: first_positions[schema_path])}
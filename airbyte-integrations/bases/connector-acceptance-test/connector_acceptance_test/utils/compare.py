@@ -3,11 +3,15 @@
 #
 
 import functools
-from typing import List, Mapping, Optional
+import hashlib
+import json
+from collections import defaultdict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import dpath.exceptions
 import dpath.util
 import icdiff
+import orjson
 import py
 from pprintpp import pformat
 
@@ -16,6 +20,12 @@ MARGIN_LEFT = 20
 GUTTER = 3
 MARGINS = MARGIN_LEFT + GUTTER + 1
 
+# characters making a dpath path a glob
+GLOB_CHARACTERS = frozenset("*?[]")
+
+# values that are already in their canonical form
+_SCALAR_TYPES = (str, int, bool, type(None))
+
 
 def diff_dicts(left, right, use_markup) -> Optional[List[str]]:
     half_cols = MAX_COLS / 2 - MARGINS
@@ -79,8 +89,32 @@ class ListWithHashMixin(HashMixin, list):
     pass
 
 
+def _delete_field(obj: Mapping, path: str) -> bool:
+    """
+    Delete a field without dpath when its path is not a glob and only goes through dicts, which is much faster.
+    Return False if the field has to be deleted with dpath.
+    """
+    if not GLOB_CHARACTERS.isdisjoint(path):
+        return False
+    *parents, name = path.lstrip("/").split("/")
+    if not name or "" in parents:
+        return False
+    for parent in parents:
+        if not isinstance(obj, dict):
+            return False
+        if parent not in obj:
+            return True
+        obj = obj[parent]
+    if not isinstance(obj, dict):
+        return False
+    obj.pop(name, None)
+    return True
+
+
 def delete_fields(obj: Mapping, path_list: List[str]) -> None:
     for path in path_list:
+        if _delete_field(obj, path):
+            continue
         try:
             dpath.util.delete(obj, path)
         except dpath.exceptions.PathNotFound:
@@ -101,3 +135,62 @@ def make_hashable(obj, exclude_fields: List[str] = None) -> str:
     if isinstance(obj, List):
         return ListWithHashMixin(obj)
     return obj
+
+
+def _canonical(obj: Any) -> Any:
+    """
+    Get the canonical form of a value: lists are sorted and numbers with a zero fractional part are integers,
+    so that values equal regardless of the order of their lists are serialized the same way.
+    """
+    # records are made of dicts and lists, which are checked first as checking the abstract types is slower
+    if isinstance(obj, dict):
+        return {key: value if type(value) in _SCALAR_TYPES else _canonical(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return sorted((value if type(value) in _SCALAR_TYPES else _canonical(value) for value in obj), key=_serialize)
+    if isinstance(obj, float) and obj.is_integer():
+        return int(obj)
+    if isinstance(obj, Mapping):
+        return _canonical(dict(obj))
+    return obj
+
+
+def _serialize(obj: Any) -> bytes:
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        # orjson doesn't serialize integers over 64 bits
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+
+
+def record_fingerprint(record: Mapping, exclude_fields: List[str] = None) -> bytes:
+    """
+    Fingerprint a record for comparison: records have the same fingerprint if they are equal regardless of the order of their keys and lists.
+    :param record record to fingerprint
+    :param exclude_fields fields deleted from the record before it is fingerprinted
+    """
+    if exclude_fields:
+        delete_fields(record, exclude_fields)
+    return hashlib.blake2b(_serialize(_canonical(record)), digest_size=16).digest()
+
+
+def diff_records(expected: List[Mapping], actual: List[Mapping], exclude_fields: List[str] = None) -> Tuple[List[Mapping], List[Mapping]]:
+    """
+    Compare records as multisets, fingerprinting each record once.
+    :param expected expected records
+    :param actual actual records
+    :param exclude_fields fields deleted from the records before they are compared
+    :return the expected records missing from the actual records, and the actual records that were not expected
+    """
+    expected_by_fingerprint: Dict[bytes, List[Mapping]] = defaultdict(list)
+    for record in expected:
+        expected_by_fingerprint[record_fingerprint(record, exclude_fields)].append(record)
+
+    extra = []
+    for record in actual:
+        matching_records = expected_by_fingerprint.get(record_fingerprint(record, exclude_fields))
+        if matching_records:
+            matching_records.pop()
+        else:
+            extra.append(record)
+    missing = [record for records in expected_by_fingerprint.values() for record in records]
+    return missing, extra
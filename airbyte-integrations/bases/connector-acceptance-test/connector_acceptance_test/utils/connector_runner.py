@@ -6,19 +6,29 @@
 import json
 import logging
 import os
+import re
+import time
 import uuid
 from pathlib import Path
 from typing import Any, List, Mapping, Optional, Union
 
 import dagger
 import docker
+import orjson
 import pytest
-from airbyte_protocol.models import AirbyteMessage, ConfiguredAirbyteCatalog, OrchestratorType
+from airbyte_protocol.models import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog, OrchestratorType
 from airbyte_protocol.models import Type as AirbyteMessageType
 from anyio import Path as AnyioPath
 from connector_acceptance_test.utils import SecretDict
 from pydantic import ValidationError
 
+# Fields of the RECORD messages that can be built without pydantic validation
+FAST_PATH_RECORD_FIELDS = {"namespace", "stream", "data", "emitted_at"}
+
+# orjson parses integers outside of the 64-bit range as floats. Lines with digit runs long enough to hold one are parsed with the json
+# module instead, which keeps integers exact.
+LONG_DIGIT_RUN = re.compile(r"\d{19,}")
+
 
 async def get_container_from_id(dagger_client: dagger.Client, container_id: str) -> dagger.Container:
     """Get a dagger container from its id.
@@ -120,6 +130,50 @@ async def get_connector_container(dagger_client: dagger.Client, image_name_with_
     return await get_container_from_dockerhub_image(dagger_client, image_name_with_tag)
 
 
+def _is_simple_record(record: Any) -> bool:
+    """Check that a record only has fields with the types expected by AirbyteRecordMessage, so that it doesn't need to be validated."""
+    return (
+        isinstance(record, dict)
+        and record.keys() <= FAST_PATH_RECORD_FIELDS
+        and isinstance(record.get("stream"), str)
+        and isinstance(record.get("data"), dict)
+        and isinstance(record.get("emitted_at"), (int, float))
+        and not isinstance(record["emitted_at"], bool)
+        and isinstance(record.get("namespace", ""), str)
+    )
+
+
+def _load_json(line: str) -> Any:
+    """Parse a line with orjson, falling back to the json module for the values orjson doesn't parse the same way."""
+    if LONG_DIGIT_RUN.search(line):
+        return json.loads(line)
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        # NaN and Infinity are not valid JSON, but the json module writes and reads them by default
+        return json.loads(line)
+
+
+def parse_airbyte_message(line: str) -> AirbyteMessage:
+    """Parse a line of a connector output into an AirbyteMessage.
+    RECORD messages make up most of the output of reads: the ones with the expected fields are built without going through the pydantic
+    validation. All other messages are validated.
+
+    Raises:
+        json.JSONDecodeError: if the line is not valid JSON.
+        ValidationError: if the line is not a valid AirbyteMessage.
+    """
+    message = _load_json(line)
+    if isinstance(message, dict) and message.get("type") == "RECORD" and message.keys() == {"type", "record"}:
+        record = message["record"]
+        if _is_simple_record(record):
+            return AirbyteMessage.construct(
+                type=AirbyteMessageType.RECORD,
+                record=AirbyteRecordMessage.construct(**{**record, "emitted_at": int(record["emitted_at"])}),
+            )
+    return AirbyteMessage.parse_obj(message)
+
+
 class ConnectorRunner:
     IN_CONTAINER_CONFIG_PATH = "/data/config.json"
     IN_CONTAINER_CATALOG_PATH = "/data/catalog.json"
@@ -262,7 +316,10 @@ class ConnectorRunner:
                     output = e.stdout + e.stderr
                 else:
                     pytest.fail(f"Failed to run command {airbyte_command} in container {self.image_tag} with error: {e}")
-        return self.parse_airbyte_messages_from_command_output(output)
+        start = time.perf_counter()
+        airbyte_messages = self.parse_airbyte_messages_from_command_output(output)
+        logging.info(f"Parsed {len(airbyte_messages)} messages from the {airbyte_command[0]} output in {time.perf_counter() - start:.2f}s")
+        return airbyte_messages
 
     async def _read_output_from_stdout(self, airbyte_command: list, container: dagger.Container) -> str:
         return await container.with_exec(airbyte_command).stdout()
@@ -284,11 +341,11 @@ class ConnectorRunner:
         airbyte_messages = []
         for line in command_output.splitlines():
             try:
-                airbyte_message = AirbyteMessage.parse_raw(line)
+                airbyte_message = parse_airbyte_message(line)
                 if airbyte_message.type is AirbyteMessageType.CONTROL and airbyte_message.control.type is OrchestratorType.CONNECTOR_CONFIG:
                     self._persist_new_configuration(airbyte_message.control.connectorConfig.config, int(airbyte_message.control.emitted_at))
                 airbyte_messages.append(airbyte_message)
-            except ValidationError as exc:
+            except (json.JSONDecodeError, ValidationError) as exc:
                 logging.warning("Unable to parse connector's output %s, error: %s", line, exc)
         return airbyte_messages
 
@@ -11,6 +11,7 @@ from airbyte_protocol.models import (
     DestinationSyncMode,
     SyncMode,
 )
+from connector_acceptance_test.utils import asserts
 from connector_acceptance_test.utils.asserts import verify_records_schema
 
 
@@ -87,6 +88,65 @@ def test_verify_records_schema(configured_catalog: ConfiguredAirbyteCatalog):
     ]
 
 
+def test_verify_records_schema_keeps_the_first_error_of_each_schema_path(configured_catalog: ConfiguredAirbyteCatalog):
+    records = [AirbyteRecordMessage(stream="my_stream", data={"text": value, "number": 1}, emitted_at=0) for value in [1, 2, None]]
+
+    streams_with_errors = verify_records_schema(records, configured_catalog, fail_on_extra_columns=False)
+
+    assert [error.message for error in streams_with_errors["my_stream"].values()] == ["1 is not of type 'string'"]
+
+
+@pytest.mark.parametrize(
+    "configured_catalog",
+    [{"type": "object", "properties": {"a": {"type": "string", "format": "date-time"}, "b": {"type": "string"}}}],
+    indirect=True,
+)
+def test_verify_records_schema_stops_checking_schema_paths_with_an_error(mocker, configured_catalog: ConfiguredAirbyteCatalog):
+    check = mocker.spy(asserts.CustomFormatChecker, "check")
+    records = [AirbyteRecordMessage(stream="my_stream", data={"a": f"not a date {i}", "b": "b"}, emitted_at=0) for i in range(10)]
+    records.append(AirbyteRecordMessage(stream="my_stream", data={"a": "still not a date", "b": 1}, emitted_at=0))
+
+    streams_with_errors = verify_records_schema(records, configured_catalog, fail_on_extra_columns=False)
+
+    assert [error.message for error in streams_with_errors["my_stream"].values()] == [
+        "not a date 0 has invalid datetime format",
+        "1 is not of type 'string'",
+    ]
+    assert check.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "configured_catalog", [{"type": "object", "properties": {"type": False, "text": {"type": "string"}}}], indirect=True
+)
+def test_verify_records_schema_keeps_the_first_error_of_false_schemas(configured_catalog: ConfiguredAirbyteCatalog):
+    records = [AirbyteRecordMessage(stream="my_stream", data={"type": i, "text": "text"}, emitted_at=0) for i in range(3)]
+
+    streams_with_errors = verify_records_schema(records, configured_catalog, fail_on_extra_columns=False)
+
+    assert [error.instance for error in streams_with_errors["my_stream"].values()] == [0]
+
+
+def test_verify_records_schema_in_parallel(mocker, configured_catalog: ConfiguredAirbyteCatalog):
+    mocker.patch.object(asserts, "VALIDATION_CHUNK_SIZE", 3)
+    data = [{"text": "text", "number": i} for i in range(10)]
+    data[4] = {"text": None, "number": "4"}
+    data[5] = {"text": "text", "number": None, "text_or_null": 5}
+    data[8] = {"text": 8, "number": 8, "text_or_null": 8}
+    records = [AirbyteRecordMessage(stream="my_stream", data=record, emitted_at=0) for record in data]
+
+    sequential_errors = verify_records_schema(records, configured_catalog, fail_on_extra_columns=False)
+    parallel_errors = verify_records_schema(records, configured_catalog, fail_on_extra_columns=False, workers=2)
+
+    assert [str(error) for error in parallel_errors["my_stream"].values()] == [
+        str(error) for error in sequential_errors["my_stream"].values()
+    ]
+    assert [error.message for error in parallel_errors["my_stream"].values()] == [
+        "None is not of type 'string'",
+        "'4' is not of type 'number'",
+        "5 is not of type 'null', 'string'",
+    ]
+
+
 @pytest.mark.parametrize(
     "record, configured_catalog, valid",
     [
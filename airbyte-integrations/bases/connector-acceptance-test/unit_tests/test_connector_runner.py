@@ -4,6 +4,7 @@
 
 
 import json
+import math
 import os
 from pathlib import Path
 
@@ -17,6 +18,7 @@ from airbyte_protocol.models import (
 )
 from airbyte_protocol.models import Type as AirbyteMessageType
 from connector_acceptance_test.utils import connector_runner
+from pydantic import ValidationError
 
 pytestmark = pytest.mark.anyio
 
@@ -71,6 +73,58 @@ class TestContainerRunner:
         runner._persist_new_configuration.assert_called_once_with(new_configuration, 1)
         mock_logging.warning.assert_called_once()
 
+    @pytest.mark.parametrize(
+        "line",
+        [
+            pytest.param('{"type": "RECORD", "record": {"stream": "s", "data": {"a": 1}, "emitted_at": 1}}', id="simple record"),
+            pytest.param(
+                '{"type": "RECORD", "record": {"stream": "s", "data": {}, "emitted_at": 1.5, "namespace": "n"}}', id="float emitted_at"
+            ),
+            pytest.param(
+                '{"type": "RECORD", "record": {"stream": "s", "data": {}, "emitted_at": 1, "meta": {"changes": []}}}', id="record with meta"
+            ),
+            pytest.param('{"type": "STATE", "state": {"data": {"cursor": 1}}}', id="state"),
+            pytest.param(
+                '{"type": "RECORD", "record": {"stream": "s", "data": {"a": 123456789012345678901234567890, "b": -9223372036854775809}, '
+                '"emitted_at": 1}}',
+                id="integers wider than 64 bits",
+            ),
+            pytest.param(
+                '{"type": "RECORD", "record": {"stream": "s", "data": {"a": 18446744073709551615, "b": "12345678901234567890"}, '
+                '"emitted_at": 1}}',
+                id="long digit runs",
+            ),
+            pytest.param(
+                '{"type": "RECORD", "record": {"stream": "s", "data": {"a": Infinity, "b": -Infinity}, "emitted_at": 1}}', id="infinity"
+            ),
+        ],
+    )
+    def test_parse_airbyte_message(self, line):
+        message = connector_runner.parse_airbyte_message(line)
+        assert message == AirbyteMessage.parse_raw(line)
+        assert message.record is None or message.record.data == json.loads(line)["record"]["data"]
+
+    def test_parse_airbyte_message_with_nan(self):
+        line = json.dumps({"type": "RECORD", "record": {"stream": "s", "data": {"a": float("nan")}, "emitted_at": 1}})
+
+        message = connector_runner.parse_airbyte_message(line)
+
+        assert message.record.stream == "s"
+        assert math.isnan(message.record.data["a"])
+
+    @pytest.mark.parametrize(
+        "line, expected_error",
+        [
+            pytest.param("not json", json.JSONDecodeError, id="invalid json"),
+            pytest.param('{"type": "RECORD", "record": {"data": {}, "emitted_at": 1}}', ValidationError, id="record without stream"),
+            pytest.param('{"type": "RECORD", "record": {"stream": "s", "data": "a", "emitted_at": 1}}', ValidationError, id="invalid data"),
+            pytest.param('{"type": "UNKNOWN"}', ValidationError, id="invalid type"),
+        ],
+    )
+    def test_parse_invalid_airbyte_message(self, line, expected_error):
+        with pytest.raises(expected_error):
+            connector_runner.parse_airbyte_message(line)
+
     @pytest.mark.parametrize(
         "pass_configuration_path, old_configuration, new_configuration, new_configuration_emitted_at, expect_new_configuration",
         [
@@ -121,7 +175,6 @@ class TestContainerRunner:
 
 
 async def test_get_connector_container(mocker):
-
     dagger_client = mocker.AsyncMock()
     os.environ["CONNECTOR_UNDER_TEST_IMAGE_TAR_PATH"] = "test_tarball_path"
 
@@ -12,12 +12,14 @@ from pathlib import Path
 from typing import Iterable
 from unittest.mock import Mock
 
+import dpath.exceptions
+import dpath.util
 import pytest
 import yaml
 from airbyte_protocol.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
 from connector_acceptance_test.config import EmptyStreamConfiguration
 from connector_acceptance_test.utils import common
-from connector_acceptance_test.utils.compare import make_hashable
+from connector_acceptance_test.utils.compare import delete_fields, diff_records, make_hashable, record_fingerprint
 
 
 def not_sorted_data():
@@ -178,6 +180,54 @@ def test_exclude_fields():
         assert "organization_id" not in item
 
 
+@pytest.mark.parametrize(
+    "obj1, obj2, is_same",
+    [
+        ({"a": 1, "b": 2}, {"b": 2, "a": 1}, True),
+        ({"a": 1, "b": 2, "c": {"d": [1, 2]}}, {"b": 2, "a": 1, "c": {"d": [2, 1]}}, True),
+        ({"a": [{"b": 1, "c": [3, 4]}, {"b": 2}]}, {"a": [{"b": 2}, {"c": [4, 3], "b": 1}]}, True),
+        ({"a": 1.0}, {"a": 1}, True),
+        ({"a": 2**70}, {"a": 2**70}, True),
+        ({"a": 1, "b": 2, "c": {"d": [1, 2]}}, {"b": 2, "a": 1, "c": {"d": [3, 4]}}, False),
+        ({"a": [1, 1, 2]}, {"a": [1, 2, 2]}, False),
+        ({"a": "1"}, {"a": 1}, False),
+        ({"a": None}, {}, False),
+    ],
+)
+def test_record_fingerprint(obj1, obj2, is_same):
+    assert (record_fingerprint(obj1) == record_fingerprint(obj2)) == is_same
+
+
+def test_diff_records():
+    expected = [{"id": 1, "tags": ["a", "b"]}, {"id": 2}, {"id": 2}, {"id": 3, "updated_at": "2023-01-01"}]
+    actual = [{"id": 2}, {"tags": ["b", "a"], "id": 1}, {"id": 3, "updated_at": "2023-12-01"}, {"id": 4}]
+
+    missing, extra = diff_records(expected, actual)
+    assert missing == [{"id": 2}, {"id": 3, "updated_at": "2023-01-01"}]
+    assert extra == [{"id": 3, "updated_at": "2023-12-01"}, {"id": 4}]
+
+    missing, extra = diff_records(expected, actual, exclude_fields=["updated_at"])
+    assert missing == [{"id": 2}]
+    assert extra == [{"id": 4}]
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["organization_id", "/organization_id", "nested/a", "nested/missing/a", "nested/list/0", "nested/list/*/b", "nested/*", "missing"],
+)
+def test_delete_fields_like_dpath(path):
+    record = {**sorted_data(), "nested": {"a": 1, "list": [{"b": 1}, {"b": 2}]}}
+    expected = json.loads(json.dumps(record))
+    try:
+        dpath.util.delete(expected, path)
+    except dpath.exceptions.PathNotFound:
+        pass
+
+    delete_fields(record, [path])
+
+    assert record == expected
+
+
 class MockContainer:
     def __init__(self, status: dict, iter_logs: Iterable):
         self.wait = Mock(return_value=status)
@@ -142,9 +142,17 @@ class AwsHandler:
             boto3_session=self._session,
             partition_cols=partition_cols,
             compression=self._get_compression_type(self._config.compression_codec),
+            pyarrow_additional_kwargs=self._get_pyarrow_additional_kwargs(),
             dtype=dtype,
         )
 
+    def _get_pyarrow_additional_kwargs(self) -> Optional[Dict[str, Any]]:
+        if not self._config.row_group_size:
+            return None
+
+        # awswrangler pops the write_table arguments, a new dict is needed for every write
+        return {"write_table_args": {"row_group_size": self._config.row_group_size}}
+
     def _write_json(
         self,
         df: pd.DataFrame,
@@ -108,6 +108,7 @@ class ConnectorConfig:
 
         self.format_type = OutputFormat.from_string(format.get("format_type", OutputFormat.PARQUET.value))
         self.compression_codec = CompressionCodec.from_config(format.get("compression_codec", CompressionCodec.UNCOMPRESSED.value))
+        self.row_group_size = format.get("row_group_size")
 
         self.partitioning = PartitionOptions.from_string(partitioning)
 
@@ -19,8 +19,9 @@ from .stream_writer import StreamWriter
 
 logger = logging.getLogger("airbyte")
 
-# Flush records every 25000 records to limit memory consumption
+# Flush records every 25000 records or 64MiB of buffered records to limit memory consumption
 RECORD_FLUSH_INTERVAL = 25000
+BUFFER_FLUSH_BYTES = 64 * 1024 * 1024
 
 
 class DestinationAwsDatalake(Destination):
@@ -96,9 +97,9 @@ class DestinationAwsDatalake(Destination):
                 stream = message.record.stream
                 streams[stream].append_message(data)
 
-                # Flush records every RECORD_FLUSH_INTERVAL records to limit memory consumption
-                # Records will either get flushed when a state message is received or when hitting the RECORD_FLUSH_INTERVAL
-                if len(streams[stream]._messages) > RECORD_FLUSH_INTERVAL:
+                # Flush records every RECORD_FLUSH_INTERVAL records or BUFFER_FLUSH_BYTES to limit memory consumption
+                # Records will either get flushed when a state message is received or when hitting one of the limits
+                if streams[stream].buffered_records > RECORD_FLUSH_INTERVAL or streams[stream].buffer_size_bytes > BUFFER_FLUSH_BYTES:
                     logger.debug(f"Reached size limit: flushing records for {stream}")
                     streams[stream].flush(partial=True)
 
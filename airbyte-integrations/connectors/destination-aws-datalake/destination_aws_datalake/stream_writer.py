@@ -6,7 +6,7 @@ import json
 import logging
 from datetime import date, datetime
 from decimal import Decimal, getcontext
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from airbyte_cdk.models import ConfiguredAirbyteStream, DestinationSyncMode
@@ -20,6 +20,9 @@ from .constants import EMPTY_VALUES, GLUE_TYPE_MAPPING_DECIMAL, GLUE_TYPE_MAPPIN
 getcontext().prec = 25
 logger = logging.getLogger("airbyte")
 
+# The serialized size of every Nth record is measured to estimate the size of the buffer
+RECORD_SIZE_SAMPLE_INTERVAL = 100
+
 
 class DictEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -48,7 +51,17 @@ class StreamWriter:
         self._table: str = configured_stream.stream.name
         self._database: str = self._configured_stream.stream.namespace or self._config.lakeformation_database_name
 
-        self._messages = []
+        # Records are buffered column by column, the casts and types of every column are derived once from the schema
+        self._column_casts: Dict[str, Callable[[Any], Any]] = self._get_column_casts()
+        self._pandas_dtypes: Dict[str, str] = self._get_pandas_dtypes_from_json_schema(pd.DataFrame(columns=list(self._schema)))
+        self._glue_dtypes, self._json_casts = self._get_glue_dtypes_from_json_schema(self._schema)
+        self._date_columns: List[str] = self._get_date_columns()
+        self._datetime_columns: List[str] = [col for col in self._date_columns if self._schema[col].get("format") == "date-time"]
+
+        self._columns: Dict[str, List[Any]] = self._empty_columns()
+        self._buffered_records = 0
+        self._sampled_records = 0
+        self._sampled_bytes = 0
         self._partial_flush_count = 0
 
         logger.info(f"Creating StreamWriter for {self._database}:{self._table}")
@@ -98,21 +111,6 @@ class StreamWriter:
 
         return fields
 
-    def _drop_additional_top_level_properties(self, record: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Helper that removes any unexpected top-level properties from the record.
-        Since the json schema is used to build the table and cast types correctly,
-        we need to remove any unexpected properties that can't be casted accurately.
-        """
-        schema_keys = self._schema.keys()
-        records_keys = record.keys()
-        difference = list(set(records_keys).difference(set(schema_keys)))
-
-        for key in difference:
-            del record[key]
-
-        return record
-
     def _json_schema_cast_value(self, value, schema_entry) -> Any:
         typ = schema_entry.get("type")
         typ = self._get_json_schema_type(typ)
@@ -159,20 +157,6 @@ class StreamWriter:
 
         return value
 
-    def _json_schema_cast(self, record: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Helper that fixes obvious type violations in a record's top level keys that may
-        cause issues when casting data to pyarrow types. Such as:
-        - Objects having empty strings or " " or "-" as value instead of null or {}
-        - Arrays having empty strings or " " or "-" as value instead of null or []
-        """
-        for key, schema_type in self._schema.items():
-            typ = self._schema[key].get("type")
-            typ = self._get_json_schema_type(typ)
-            record[key] = self._json_schema_cast_value(record.get(key), schema_type)
-
-        return record
-
     def _get_non_null_json_schema_types(self, typ: Union[str, List[str]]) -> Union[str, List[str]]:
         if isinstance(typ, list):
             return list(filter(lambda x: x != "null", typ))
@@ -363,14 +347,52 @@ class StreamWriter:
 
         return column_types, json_columns
 
+    def _get_column_casts(self) -> Dict[str, Callable[[Any], Any]]:
+        """
+        Helper that builds the cast applied to the values of each top-level column.
+        Timestamp columns are kept as received and parsed all at once when flushing.
+        """
+        casts = {}
+        for col, schema_entry in self._schema.items():
+            typ = self._get_json_schema_type(schema_entry.get("type"))
+            if typ == "string" and schema_entry.get("format") == "date-time":
+                casts[col] = lambda value: value
+            else:
+                casts[col] = lambda value, schema_entry=schema_entry: self._json_schema_cast_value(value, schema_entry)
+
+        return casts
+
+    def _empty_columns(self) -> Dict[str, List[Any]]:
+        return {col: [] for col in self._schema}
+
     @property
     def _cursor_fields(self) -> Optional[List[str]]:
         return self._configured_stream.cursor_field
 
+    @property
+    def buffered_records(self) -> int:
+        return self._buffered_records
+
+    @property
+    def buffer_size_bytes(self) -> int:
+        """
+        Estimated size of the buffered records, based on the serialized size of a sample of the records.
+        """
+        if not self._sampled_records:
+            return 0
+
+        return self._buffered_records * self._sampled_bytes // self._sampled_records
+
     def append_message(self, message: Dict[str, Any]):
-        clean_message = self._drop_additional_top_level_properties(message)
-        clean_message = self._json_schema_cast(clean_message)
-        self._messages.append(clean_message)
+        if self._buffered_records % RECORD_SIZE_SAMPLE_INTERVAL == 0:
+            self._sampled_records += 1
+            self._sampled_bytes += len(json.dumps(message, default=str))
+
+        # unexpected top-level properties are dropped since they can't be casted accurately
+        for col, cast in self._column_casts.items():
+            self._columns[col].append(cast(message.get(col)))
+
+        self._buffered_records += 1
 
     def reset(self):
         logger.info(f"Deleting table {self._database}:{self._table}")
@@ -379,38 +401,46 @@ class StreamWriter:
         if not success:
             logger.warning(f"Failed to reset table {self._database}:{self._table}")
 
-    def flush(self, partial: bool = False):
-        logger.debug(f"Flushing {len(self._messages)} messages to table {self._database}:{self._table}")
+    def _build_dataframe(self) -> pd.DataFrame:
+        """
+        Helper that converts the buffered columns to a dataframe and releases the buffer.
+        """
+        columns, self._columns = self._columns, self._empty_columns()
+
+        # Make sure complex types that can't be converted
+        # to a struct or array are converted to a json string
+        # so they can be queried with json_extract
+        for col in self._json_casts:
+            columns[col] = [json.dumps(value, cls=DictEncoder) for value in columns[col]]
+
+        for col in self._date_columns:
+            # all timestamps are parsed at once instead of record by record
+            errors = "coerce" if col in self._datetime_columns else "raise"
+            columns[col] = pd.to_datetime(pd.Series(columns[col], dtype=object), format="mixed", utc=True, errors=errors)
 
-        df = pd.DataFrame(self._messages)
+        df = pd.DataFrame(columns)
         # best effort to convert pandas types
-        df = df.astype(self._get_pandas_dtypes_from_json_schema(df), errors="ignore")
+        return df.astype({col: typ for col, typ in self._pandas_dtypes.items() if col not in self._date_columns}, errors="ignore")
 
-        if len(df) < 1:
+    def flush(self, partial: bool = False):
+        logger.debug(f"Flushing {self._buffered_records} messages to table {self._database}:{self._table}")
+
+        if self._buffered_records < 1:
             logger.info(f"No messages to write to {self._database}:{self._table}")
             return
 
+        df = self._build_dataframe()
+        self._buffered_records = 0
+
         partition_fields = {}
-        date_columns = self._get_date_columns()
-        for col in date_columns:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], format="mixed", utc=True)
-
-                # Create date column for partitioning
-                if self._cursor_fields and col in self._cursor_fields:
-                    fields = self._add_partition_column(col, df)
-                    partition_fields.update(fields)
-
-        dtype, json_casts = self._get_glue_dtypes_from_json_schema(self._schema)
-        dtype = {**dtype, **partition_fields}
-        partition_fields = list(partition_fields.keys())
+        for col in self._date_columns:
+            # Create date column for partitioning
+            if self._cursor_fields and col in self._cursor_fields:
+                fields = self._add_partition_column(col, df)
+                partition_fields.update(fields)
 
-        # Make sure complex types that can't be converted
-        # to a struct or array are converted to a json string
-        # so they can be queried with json_extract
-        for col in json_casts:
-            if col in df.columns:
-                df[col] = df[col].apply(lambda x: json.dumps(x, cls=DictEncoder))
+        dtype = {**self._glue_dtypes, **partition_fields}
+        partition_fields = list(partition_fields.keys())
 
         if self._sync_mode == DestinationSyncMode.overwrite and self._partial_flush_count < 1:
             logger.debug(f"Overwriting {len(df)} records to {self._database}:{self._table}")
@@ -433,11 +463,9 @@ class StreamWriter:
             )
 
         else:
-            self._messages = []
             raise Exception(f"Unsupported sync mode: {self._sync_mode}")
 
         if partial:
             self._partial_flush_count += 1
 
         del df
-        self._messages.clear()
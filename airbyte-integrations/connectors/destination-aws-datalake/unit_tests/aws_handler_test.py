@@ -5,6 +5,8 @@
 import json
 from typing import Any, Mapping
 
+import awswrangler as wr
+import pandas as pd
 import pytest
 from destination_aws_datalake import DestinationAwsDatalake
 from destination_aws_datalake.aws import AwsHandler
@@ -53,3 +55,21 @@ def test_get_path_prefix(config_prefix: Mapping[str, Any]):
     tbl = "append_stream"
     db = conf.lakeformation_database_name
     assert aws_handler._get_s3_path(db, tbl) == "s3://datalake-bucket/prefix/test/append_stream/"
+
+
+def test_write_parquet_row_group_size(config: Mapping[str, Any], monkeypatch):
+    config["format"]["row_group_size"] = 1000
+    aws_handler = AwsHandler(ConnectorConfig(**config), DestinationAwsDatalake())
+    calls = []
+    monkeypatch.setattr(wr.s3, "to_parquet", lambda **kwargs: calls.append(kwargs))
+
+    aws_handler._write_parquet(
+        pd.DataFrame({"id": [1]}), "s3://datalake-bucket/test/append_stream/", "test", "append_stream", "append", None
+    )
+
+    assert calls[0]["pyarrow_additional_kwargs"] == {"write_table_args": {"row_group_size": 1000}}
+
+
+def test_write_parquet_default_row_group_size(config: Mapping[str, Any]):
+    aws_handler = AwsHandler(ConnectorConfig(**config), DestinationAwsDatalake())
+    assert aws_handler._get_pyarrow_additional_kwargs() is None
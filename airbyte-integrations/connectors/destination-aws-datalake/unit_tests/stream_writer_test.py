@@ -315,9 +315,92 @@ def test_get_date_columns():
 def test_append_messsage():
     writer = get_writer(get_config())
     message = {"string_col": "test", "int_col": 1, "datetime_col": "2021-01-01T00:00:00Z", "date_col": "2021-01-01"}
-    writer.append_message(message)
-    assert len(writer._messages) == 1
-    assert writer._messages[0] == message
+    writer.append_message({**message, "unexpected_col": "value"})
+    assert writer.buffered_records == 1
+    assert writer._columns == {
+        "string_col": ["test"],
+        "int_col": [1],
+        "datetime_col": ["2021-01-01T00:00:00Z"],
+        "date_col": ["2021-01-01"],
+    }
+
+
+def test_buffer_size_bytes():
+    writer = get_writer(get_config())
+    assert writer.buffer_size_bytes == 0
+
+    message = {"string_col": "test", "int_col": 1, "datetime_col": "2021-01-01T00:00:00Z", "date_col": "2021-01-01"}
+    for _ in range(250):
+        writer.append_message(dict(message))
+
+    assert writer.buffer_size_bytes == 250 * len(json.dumps(message))
+
+
+class FakeAwsHandler:
+    """
+    Local stand-in for the S3 and Glue writes.
+    """
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, df, database, table, dtype, partition_cols):
+        self.writes.append(("overwrite", df, dtype, partition_cols))
+
+    def append(self, df, database, table, dtype, partition_cols):
+        self.writes.append(("append", df, dtype, partition_cols))
+
+
+def test_flush_writes_buffered_columns():
+    config = get_config()
+    config["partitioning"] = "YEAR"
+    aws_handler = FakeAwsHandler()
+    writer = StreamWriter(aws_handler, ConnectorConfig(**config), get_configured_stream())
+
+    writer.append_message({"string_col": "a", "int_col": 1, "datetime_col": "2021-01-01T00:00:00-02:00", "date_col": "2021-01-01"})
+    writer.append_message({"string_col": "b", "int_col": None, "datetime_col": "not a date", "date_col": None})
+    writer.flush(partial=True)
+
+    [(mode, df, dtype, partition_cols)] = aws_handler.writes
+    assert mode == "append"
+    assert partition_cols == ["datetime_col_year"]
+    assert dtype == {
+        "string_col": "string",
+        "int_col": "bigint",
+        "datetime_col": "timestamp",
+        "date_col": "date",
+        "datetime_col_year": "bigint",
+    }
+    assert list(df.columns) == ["string_col", "int_col", "datetime_col", "date_col", "datetime_col_year"]
+    assert str(df["int_col"].dtype) == "Int64"
+    assert df["datetime_col"][0] == pd.Timestamp("2021-01-01T02:00:00Z")
+    assert pd.isna(df["datetime_col"][1])
+    assert list(df["datetime_col_year"]) == [2021, 0]
+    assert df["date_col"][0] == pd.Timestamp("2021-01-01", tz="UTC")
+
+    assert writer.buffered_records == 0
+    assert writer._columns == {"string_col": [], "int_col": [], "datetime_col": [], "date_col": []}
+
+
+def test_flush_casts_complex_columns_to_json():
+    aws_handler = FakeAwsHandler()
+    writer = StreamWriter(aws_handler, ConnectorConfig(**get_config()), get_big_schema_configured_stream())
+
+    writer.append_message({"nested_bad_object": {"city": {"name": "Paris"}}, "sentAt": "2023-08-01T23:32:11Z"})
+    writer.flush()
+
+    [(_, df, _, _)] = aws_handler.writes
+    assert df["nested_bad_object"][0] == '{"city": {"name": "Paris"}}'
+    assert df["sentAt"][0] == pd.Timestamp("2023-08-01T23:32:11Z")
+
+
+def test_flush_without_messages():
+    aws_handler = FakeAwsHandler()
+    writer = StreamWriter(aws_handler, ConnectorConfig(**get_config()), get_configured_stream())
+
+    writer.flush()
+
+    assert aws_handler.writes == []
 
 
 def test_get_cursor_field():
@@ -459,6 +542,11 @@ def test_has_objects_with_no_properties_nested_bad():
     )
 
 
+def _buffered_row(writer: StreamWriter, message: Dict[str, Any]) -> Dict[str, Any]:
+    writer.append_message(message)
+    return {col: values[-1] for col, values in writer._columns.items()}
+
+
 def test_json_schema_cast_value():
     writer = get_big_schema_writer(get_config())
     assert (
@@ -488,7 +576,8 @@ def test_json_schema_cast_decimal():
     aws_handler = AwsHandler(connector_config, DestinationAwsDatalake())
     writer = StreamWriter(aws_handler, connector_config, get_camelcase_configured_stream())
 
-    assert writer._json_schema_cast(
+    assert _buffered_row(
+        writer,
         {
             "Adjustment": False,
             "domain": "QBO",
@@ -514,7 +603,7 @@ def test_json_schema_cast_decimal():
                 },
             ],
             "airbyte_cursor": "2023-06-15T16:08:39-07:00",
-        }
+        },
     ) == {
         "Adjustment": False,
         "CurrencyRef": {"name": "United States Dollar", "value": "USD"},
@@ -617,7 +706,7 @@ def test_json_schema_cast():
         "sparse": False,
     }
 
-    assert writer._json_schema_cast(input) == expected
+    assert _buffered_row(writer, input) == expected
 
 
 def test_json_schema_cast_empty_values():
@@ -662,7 +751,7 @@ def test_json_schema_cast_empty_values():
         "sparse": False,
     }
 
-    result = writer._json_schema_cast(input)
+    result = _buffered_row(writer, input)
     exchange_rate = result.pop("ExchangeRate")
     created_time = result["MetaData"].pop("CreateTime")
     line_amount = result["Line"][0].pop("Amount")
@@ -718,7 +807,7 @@ def test_json_schema_cast_bad_values():
         "sparse": True,
     }
 
-    result = writer._json_schema_cast(input)
+    result = _buffered_row(writer, input)
     exchange_rate = result.pop("ExchangeRate")
     created_time = result["MetaData"].pop("CreateTime")
     line_amount = result["Line"][0].pop("Amount")
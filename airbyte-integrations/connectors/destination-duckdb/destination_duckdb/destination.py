@@ -2,14 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import csv
 import datetime
 import json
 import os
 import re
+import tempfile
 import uuid
-from collections import defaultdict
 from logging import getLogger
-from typing import Any, Iterable, Mapping
+from typing import Any, Dict, Iterable, Mapping
 
 import duckdb
 from airbyte_cdk import AirbyteLogger
@@ -21,6 +22,14 @@ logger = getLogger("airbyte")
 CONFIG_MOTHERDUCK_API_KEY = "motherduck_api_key"
 CONFIG_DEFAULT_SCHEMA = "main"
 
+# Buffered records are loaded once they reach this size, even if no state message was received
+BUFFER_FLUSH_BYTES = 32 * 1024 * 1024
+
+# Default maximum size of a line read by DuckDB's read_csv
+DEFAULT_MAX_LINE_SIZE = 2 * 1024 * 1024
+# Upper bound of the bytes taken by the id, the timestamp, the delimiters and the quotes around the data in a staged line
+STAGED_LINE_OVERHEAD = 128
+
 
 def validated_sql_name(sql_name: Any) -> str:
     """Return the input if it is a valid SQL name, otherwise raise an exception."""
@@ -32,6 +41,64 @@ def validated_sql_name(sql_name: Any) -> str:
     raise ValueError(f"Invalid SQL name: {sql_name}")
 
 
+class StreamBuffer:
+    """
+    Stages the records of a stream in a CSV file, so that they are loaded by DuckDB's columnar reader
+    with a single INSERT ... SELECT instead of being inserted one row at a time.
+    """
+
+    def __init__(self, staging_dir: str, schema_name: str, table_name: str):
+        self.schema_name = schema_name
+        self.table_name = table_name
+        self.path = os.path.join(staging_dir, f"{uuid.uuid4().hex}.csv")
+        self.records = 0
+        self.max_line_size = 0
+        self._file = open(self.path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file, lineterminator="\n")
+
+    def append(self, data: Mapping[str, Any]) -> int:
+        """
+        Stage a record and return the size of its serialized data.
+        """
+        serialized_data = json.dumps(data)
+        self._writer.writerow((str(uuid.uuid4()), datetime.datetime.now().isoformat(), serialized_data))
+        self.records += 1
+        # json.dumps escapes non-ASCII characters so the length is the size in bytes; quotes are doubled in the CSV line
+        self.max_line_size = max(self.max_line_size, len(serialized_data) + serialized_data.count('"') + STAGED_LINE_OVERHEAD)
+        return len(serialized_data)
+
+    def flush(self, con: duckdb.DuckDBPyConnection) -> None:
+        if not self.records:
+            return
+
+        logger.info(f"Loading {self.records} records into {self.schema_name}.{self.table_name}")
+        self._file.flush()
+        path = self.path.replace("'", "''")
+        query = f"""
+        INSERT INTO {self.schema_name}.{self.table_name}
+          (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
+        SELECT * FROM read_csv(
+          '{path}',
+          header=false,
+          auto_detect=false,
+          delim=',',
+          quote='"',
+          escape='"',
+          columns={{'_airbyte_ab_id': 'VARCHAR', '_airbyte_emitted_at': 'TIMESTAMP', '_airbyte_data': 'VARCHAR'}},
+          max_line_size={max(self.max_line_size, DEFAULT_MAX_LINE_SIZE)}
+        )
+        """
+        con.execute(query)
+
+        self._file.seek(0)
+        self._file.truncate()
+        self.records = 0
+        self.max_line_size = 0
+
+    def close(self) -> None:
+        self._file.close()
+
+
 class DestinationDuckdb(Destination):
     @staticmethod
     def _get_destination_path(destination_path: str) -> str:
@@ -107,53 +174,50 @@ class DestinationDuckdb(Destination):
 
             con.execute(query)
 
-        buffer = defaultdict(list)
-
-        for message in input_messages:
-            if message.type == Type.STATE:
-                # flush the buffer
-                for stream_name in buffer.keys():
-                    logger.info(f"flushing buffer for state: {message}")
-                    table_name = f"_airbyte_raw_{stream_name}"
-                    query = f"""
-                    INSERT INTO {schema_name}.{table_name}
-                      (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
-                    VALUES (?,?,?)
-                    """
-                    con.executemany(query, buffer[stream_name])
-
+        with tempfile.TemporaryDirectory() as staging_dir:
+            buffers: Dict[str, StreamBuffer] = {}
+            buffered_size = 0
+            try:
+                for message in input_messages:
+                    if message.type == Type.STATE:
+                        # flush the buffer
+                        logger.info(f"flushing buffer for state: {message}")
+                        for stream_buffer in buffers.values():
+                            stream_buffer.flush(con)
+
+                        con.commit()
+                        buffered_size = 0
+
+                        yield message
+                    elif message.type == Type.RECORD:
+                        data = message.record.data
+                        stream = message.record.stream
+                        if stream not in streams:
+                            logger.debug(f"Stream {stream} was not present in configured streams, skipping")
+                            continue
+
+                        # add to buffer
+                        if stream not in buffers:
+                            buffers[stream] = StreamBuffer(staging_dir, schema_name, f"_airbyte_raw_{stream}")
+                        buffered_size += buffers[stream].append(data)
+
+                        # records are also loaded when the buffers grow too large, independently of how often the source emits state
+                        if buffered_size > BUFFER_FLUSH_BYTES:
+                            logger.info("flushing buffer after reaching the size limit")
+                            for stream_buffer in buffers.values():
+                                stream_buffer.flush(con)
+                            con.commit()
+                            buffered_size = 0
+                    else:
+                        logger.info(f"Message type {message.type} not supported, skipping")
+
+                # flush any remaining messages
+                for stream_buffer in buffers.values():
+                    stream_buffer.flush(con)
                 con.commit()
-                buffer = defaultdict(list)
-
-                yield message
-            elif message.type == Type.RECORD:
-                data = message.record.data
-                stream = message.record.stream
-                if stream not in streams:
-                    logger.debug(f"Stream {stream} was not present in configured streams, skipping")
-                    continue
-
-                # add to buffer
-                buffer[stream].append(
-                    (
-                        str(uuid.uuid4()),
-                        datetime.datetime.now().isoformat(),
-                        json.dumps(data),
-                    )
-                )
-            else:
-                logger.info(f"Message type {message.type} not supported, skipping")
-
-        # flush any remaining messages
-        for stream_name in buffer.keys():
-            table_name = f"_airbyte_raw_{stream_name}"
-            query = f"""
-            INSERT INTO {schema_name}.{table_name}
-            VALUES (?,?,?)
-            """
-
-            con.executemany(query, buffer[stream_name])
-            con.commit()
+            finally:
+                for stream_buffer in buffers.values():
+                    stream_buffer.close()
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
@@ -0,0 +1,106 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Benchmark the rows/sec written to a local DuckDB file, comparing the staged CSV load of the destination with
+inserting the same records row by row with executemany.
+
+    python integration_tests/benchmark_write.py --records 200000 --state-every 10000
+"""
+
+import argparse
+import datetime
+import json
+import os
+import tempfile
+import time
+import uuid
+from typing import Iterable, List
+
+import duckdb
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from destination_duckdb import DestinationDuckdb
+
+STREAM_NAME = "benchmark"
+
+
+def configured_catalog() -> ConfiguredAirbyteCatalog:
+    stream = AirbyteStream(name=STREAM_NAME, json_schema={"type": "object"}, supported_sync_modes=[SyncMode.full_refresh])
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(stream=stream, sync_mode=SyncMode.full_refresh, destination_sync_mode=DestinationSyncMode.overwrite)
+        ]
+    )
+
+
+def messages(records: int, state_every: int) -> List[AirbyteMessage]:
+    result = []
+    for i in range(records):
+        data = {"id": i, "name": f"name {i}", "updated_at": "2023-12-01T00:00:00Z", "amount": i * 1.5, "tags": ["a", "b"]}
+        result.append(AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=STREAM_NAME, data=data, emitted_at=0)))
+        if (i + 1) % state_every == 0:
+            result.append(AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"id": i})))
+    return result
+
+
+def write_with_executemany(path: str, input_messages: Iterable[AirbyteMessage]) -> None:
+    con = duckdb.connect(database=path, read_only=False)
+    con.execute(
+        f"CREATE TABLE main._airbyte_raw_{STREAM_NAME} (_airbyte_ab_id TEXT PRIMARY KEY, _airbyte_emitted_at DATETIME, _airbyte_data JSON)"
+    )
+    query = f"INSERT INTO main._airbyte_raw_{STREAM_NAME} VALUES (?,?,?)"
+    buffer = []
+    for message in input_messages:
+        if message.type == Type.RECORD:
+            buffer.append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(message.record.data)))
+        elif buffer:
+            con.executemany(query, buffer)
+            con.commit()
+            buffer = []
+
+    if buffer:
+        con.executemany(query, buffer)
+        con.commit()
+    con.close()
+
+
+def write_with_destination(path: str, input_messages: Iterable[AirbyteMessage]) -> None:
+    for _ in DestinationDuckdb().write({"destination_path": path}, configured_catalog(), input_messages):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--state-every", type=int, default=10000)
+    args = parser.parse_args()
+
+    # the destination only writes under /local when running in a container
+    DestinationDuckdb._get_destination_path = staticmethod(lambda path: path)
+    input_messages = messages(args.records, args.state_every)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, write in [("executemany", write_with_executemany), ("staged CSV", write_with_destination)]:
+            path = os.path.join(tmp_dir, f"{name.replace(' ', '_')}.duckdb")
+            start = time.perf_counter()
+            write(path, input_messages)
+            elapsed = time.perf_counter() - start
+
+            with duckdb.connect(database=path, read_only=True) as con:
+                written = con.execute(f"SELECT count(*) FROM main._airbyte_raw_{STREAM_NAME}").fetchone()[0]
+            print(f"{name}: wrote {written} rows in {elapsed:.2f}s: {written / elapsed:.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,7 @@ from airbyte_cdk.models import (
     Type,
 )
 from destination_duckdb import DestinationDuckdb
+from destination_duckdb import destination as destination_module
 
 CONFIG_PATH = "integration_tests/config.json"
 SECRETS_CONFIG_PATH = "secrets/config.json"  # Should contain a valid MotherDuck API token
@@ -191,3 +192,78 @@ def test_write(
     assert len(result) == 2
     assert result[0][2] == json.dumps(airbyte_message1.record.data)
     assert result[1][2] == json.dumps(airbyte_message2.record.data)
+
+
+def test_write_special_characters(
+    config: Dict[str, str],
+    request,
+    configured_catalogue: ConfiguredAirbyteCatalog,
+    test_table_name: str,
+    test_schema_name: str,
+):
+    data = {"key1": 'comma, "quotes"\nnew line \\ backslash', "key2": "unicode é 😀", "nested": {"list": [1, None, 2.5]}}
+    message = AirbyteMessage(
+        type=Type.RECORD,
+        record=AirbyteRecordMessage(stream=test_table_name, data=data, emitted_at=int(datetime.now().timestamp()) * 1000),
+    )
+
+    destination = DestinationDuckdb()
+    list(destination.write(config, configured_catalogue, [message, _state({"state": "1"})]))
+
+    con = duckdb.connect(database=config.get("destination_path"), read_only=False)
+    with con:
+        result = con.execute(f"SELECT _airbyte_data FROM {test_schema_name}._airbyte_raw_{test_table_name}").fetchall()
+
+    assert json.dumps(data) in [row[0] for row in result]
+
+
+def test_write_records_larger_than_the_default_csv_line_size(
+    config: Dict[str, str],
+    request,
+    configured_catalogue: ConfiguredAirbyteCatalog,
+    test_table_name: str,
+    test_schema_name: str,
+):
+    data = {"key1": '"quoted"' * (destination_module.DEFAULT_MAX_LINE_SIZE // 8), "key2": 1}
+    message = AirbyteMessage(
+        type=Type.RECORD,
+        record=AirbyteRecordMessage(stream=test_table_name, data=data, emitted_at=int(datetime.now().timestamp()) * 1000),
+    )
+
+    destination = DestinationDuckdb()
+    list(destination.write(config, configured_catalogue, [message, _state({"state": "1"})]))
+
+    con = duckdb.connect(database=config.get("destination_path"), read_only=False)
+    with con:
+        result = con.execute(f"SELECT _airbyte_data FROM {test_schema_name}._airbyte_raw_{test_table_name}").fetchall()
+
+    assert json.dumps(data) in [row[0] for row in result]
+
+
+def test_write_flushes_buffer_when_reaching_size_limit(
+    config: Dict[str, str],
+    request,
+    monkeypatch,
+    configured_catalogue: ConfiguredAirbyteCatalog,
+    airbyte_message1: AirbyteMessage,
+    airbyte_message2: AirbyteMessage,
+    test_table_name: str,
+    test_schema_name: str,
+):
+    monkeypatch.setattr(destination_module, "BUFFER_FLUSH_BYTES", len(json.dumps(airbyte_message1.record.data)))
+    table = f"{test_schema_name}._airbyte_raw_{test_table_name}"
+    loaded_before_state = []
+
+    def input_messages():
+        yield airbyte_message1
+        yield airbyte_message2
+        con = duckdb.connect(database=config.get("destination_path"), read_only=False)
+        loaded_before_state.append(con.execute(f"SELECT count(*) FROM {table}").fetchone()[0])
+        yield _state({"state": "1"})
+
+    destination = DestinationDuckdb()
+    assert len(list(destination.write(config, configured_catalogue, input_messages()))) == 1
+
+    con = duckdb.connect(database=config.get("destination_path"), read_only=False)
+    with con:
+        assert loaded_before_state == [con.execute(f"SELECT count(*) FROM {table}").fetchone()[0]]
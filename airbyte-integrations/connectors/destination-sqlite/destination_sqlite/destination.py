@@ -6,15 +6,18 @@ import datetime
 import json
 import os
 import sqlite3
-import uuid
 from asyncio.log import logger
 from collections import defaultdict
 from typing import Any, Iterable, Mapping
+from uuid import uuid4
 
 from airbyte_cdk import AirbyteLogger
 from airbyte_cdk.destinations import Destination
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
 
+# Records of a stream are inserted once this many are buffered, even if no state message was received
+DEFAULT_BATCH_SIZE = 10000
+
 
 class DestinationSqlite(Destination):
     @staticmethod
@@ -34,6 +37,10 @@ class DestinationSqlite(Destination):
 
         return destination_path
 
+    @staticmethod
+    def _create_ab_id_index(con: sqlite3.Connection, table_name: str):
+        con.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {table_name}_airbyte_ab_id ON {table_name} (_airbyte_ab_id)")
+
     def write(
         self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
     ) -> Iterable[AirbyteMessage]:
@@ -55,12 +62,22 @@ class DestinationSqlite(Destination):
         streams = {s.stream.name for s in configured_catalog.streams}
         path = config.get("destination_path")
         path = self._get_destination_path(path)
+        batch_size = config.get("batch_size", DEFAULT_BATCH_SIZE)
         con = sqlite3.connect(path)
+        if config.get("high_throughput", False):
+            # WAL with synchronous=NORMAL only syncs the journal at checkpoints; the database can't get corrupted
+            # but a power loss can roll back the last committed transactions
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+
         with con:
+            insert_queries = {}
+            deferred_indexes = []
             # create the tables if needed
             for configured_stream in configured_catalog.streams:
                 name = configured_stream.stream.name
                 table_name = f"_airbyte_raw_{name}"
+                primary_key = "PRIMARY KEY"
                 if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
                     # delete the tables
                     query = """
@@ -69,61 +86,76 @@ class DestinationSqlite(Destination):
                         table_name
                     )
                     con.execute(query)
+
+                    if config.get("deferred_index_creation", False):
+                        # the new table is filled faster without maintaining the index, which is built once all records are loaded
+                        primary_key = ""
+                        deferred_indexes.append(table_name)
                 # create the table if needed
                 query = """
                 CREATE TABLE IF NOT EXISTS {table_name} (
-                    _airbyte_ab_id TEXT PRIMARY KEY,
+                    _airbyte_ab_id TEXT {primary_key},
                     _airbyte_emitted_at TEXT,
                     _airbyte_data TEXT
                 )
                 """.format(
-                    table_name=table_name
+                    table_name=table_name, primary_key=primary_key
                 )
                 con.execute(query)
+                if table_name not in deferred_indexes and not con.execute(f"PRAGMA index_list({table_name})").fetchall():
+                    # the table was created by a sync with deferred index creation that was killed before building the index
+                    self._create_ab_id_index(con, table_name)
 
-            buffer = defaultdict(list)
-
-            for message in input_messages:
-                if message.type == Type.STATE:
-                    # flush the buffer
-                    for stream_name in buffer.keys():
-
-                        query = """
-                        INSERT INTO {table_name}
-                        VALUES (?,?,?)
-                        """.format(
-                            table_name=f"_airbyte_raw_{stream_name}"
-                        )
-
-                        con.executemany(query, buffer[stream_name])
-
-                    con.commit()
-                    buffer = defaultdict(list)
-
-                    yield message
-                elif message.type == Type.RECORD:
-                    data = message.record.data
-                    stream = message.record.stream
-                    if stream not in streams:
-                        logger.debug(f"Stream {stream} was not present in configured streams, skipping")
-                        continue
-
-                    # add to buffer
-                    buffer[stream].append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(data)))
-
-            # flush any remaining messages
-            for stream_name in buffer.keys():
-
-                query = """
+                insert_queries[name] = """
                 INSERT INTO {table_name}
                 VALUES (?,?,?)
                 """.format(
-                    table_name=f"_airbyte_raw_{stream_name}"
+                    table_name=table_name
                 )
 
-                con.executemany(query, buffer[stream_name])
-
-            con.commit()
+            try:
+                buffer = defaultdict(list)
+                # records of a batch share the same emitted_at
+                emitted_at = datetime.datetime.now().isoformat()
+
+                for message in input_messages:
+                    if message.type == Type.STATE:
+                        # flush the buffer
+                        for stream_name in buffer.keys():
+                            con.executemany(insert_queries[stream_name], buffer[stream_name])
+
+                        con.commit()
+                        buffer = defaultdict(list)
+                        emitted_at = datetime.datetime.now().isoformat()
+
+                        yield message
+                    elif message.type == Type.RECORD:
+                        data = message.record.data
+                        stream = message.record.stream
+                        if stream not in streams:
+                            logger.debug(f"Stream {stream} was not present in configured streams, skipping")
+                            continue
+
+                        # add to buffer
+                        buffer[stream].append((str(uuid4()), emitted_at, json.dumps(data)))
+
+                        # full batches are inserted right away but only committed with the next state message
+                        if len(buffer[stream]) >= batch_size:
+                            con.executemany(insert_queries[stream], buffer.pop(stream))
+                            emitted_at = datetime.datetime.now().isoformat()
+
+                # flush any remaining messages
+                for stream_name in buffer.keys():
+                    con.executemany(insert_queries[stream_name], buffer[stream_name])
+
+                con.commit()
+            finally:
+                # the records of a failed sync that were not committed are discarded before building the deferred indexes,
+                # so that the tables get their index whether the sync succeeds or not
+                con.rollback()
+                for table_name in deferred_indexes:
+                    self._create_ab_id_index(con, table_name)
+                con.commit()
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
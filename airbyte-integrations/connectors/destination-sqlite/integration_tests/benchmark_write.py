@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Benchmark the rows/sec written to a local SQLite file by an overwrite sync with the default settings and with the
+high throughput options.
+
+    python integration_tests/benchmark_write.py --records 10000000 --state-every 100000
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from typing import Any, Iterable, Mapping
+
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from destination_sqlite import DestinationSqlite
+
+STREAM_NAME = "benchmark"
+
+
+def configured_catalog() -> ConfiguredAirbyteCatalog:
+    stream = AirbyteStream(name=STREAM_NAME, json_schema={"type": "object"}, supported_sync_modes=[SyncMode.full_refresh])
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(stream=stream, sync_mode=SyncMode.full_refresh, destination_sync_mode=DestinationSyncMode.overwrite)
+        ]
+    )
+
+
+def messages(records: int, state_every: int) -> Iterable[AirbyteMessage]:
+    # messages are built without validation so that the benchmark measures the destination rather than pydantic
+    for i in range(records):
+        data = {"id": i, "name": f"name {i}", "updated_at": "2023-12-01T00:00:00Z", "amount": i * 1.5, "tags": ["a", "b"]}
+        yield AirbyteMessage.construct(type=Type.RECORD, record=AirbyteRecordMessage.construct(stream=STREAM_NAME, data=data, emitted_at=0))
+        if (i + 1) % state_every == 0:
+            yield AirbyteMessage.construct(type=Type.STATE, state=AirbyteStateMessage.construct(data={"id": i}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=10_000_000)
+    parser.add_argument("--state-every", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    # the destination only writes under /local when running in a container
+    DestinationSqlite._get_destination_path = staticmethod(lambda path: path)
+    settings: Mapping[str, Mapping[str, Any]] = {
+        "default": {},
+        "high throughput": {"high_throughput": True, "batch_size": args.batch_size},
+        "high throughput, deferred index": {"high_throughput": True, "batch_size": args.batch_size, "deferred_index_creation": True},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, options in settings.items():
+            path = os.path.join(tmp_dir, f"{name.replace(' ', '_').replace(',', '')}.db")
+            start = time.perf_counter()
+            for _ in DestinationSqlite().write(
+                {"destination_path": path, **options}, configured_catalog(), messages(args.records, args.state_every)
+            ):
+                pass
+            elapsed = time.perf_counter() - start
+
+            con = sqlite3.connect(path)
+            written = con.execute(f"SELECT count(*) FROM _airbyte_raw_{STREAM_NAME}").fetchone()[0]
+            con.close()
+            print(f"{name}: wrote {written} rows in {elapsed:.2f}s: {written / elapsed:.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ import pytest
 from airbyte_cdk.models import (
     AirbyteMessage,
     AirbyteRecordMessage,
+    AirbyteStateMessage,
     AirbyteStream,
     ConfiguredAirbyteCatalog,
     ConfiguredAirbyteStream,
@@ -135,3 +136,108 @@ def test_write(
     assert len(result) == 2
     assert result[0][2] == json.dumps(airbyte_message1.record.data)
     assert result[1][2] == json.dumps(airbyte_message2.record.data)
+
+
+@pytest.mark.parametrize("config", ["local_file_config"])
+def test_write_in_batches(
+    config: Dict[str, str],
+    request,
+    configured_catalogue: ConfiguredAirbyteCatalog,
+    airbyte_message1: AirbyteMessage,
+    airbyte_message2: AirbyteMessage,
+    test_table_name: str,
+):
+    config = {**request.getfixturevalue(config), "batch_size": 1}
+    destination = DestinationSqlite()
+    list(destination.write(config=config, configured_catalog=configured_catalogue, input_messages=[airbyte_message1, airbyte_message2]))
+
+    con = sqlite3.connect(config.get("destination_path"))
+    with con:
+        result = con.execute(f"SELECT _airbyte_emitted_at, _airbyte_data FROM _airbyte_raw_{test_table_name}").fetchall()
+
+    assert json.dumps(airbyte_message1.record.data) in [row[1] for row in result]
+    assert json.dumps(airbyte_message2.record.data) in [row[1] for row in result]
+    assert all(datetime.fromisoformat(row[0]) for row in result)
+
+
+def test_write_high_throughput_with_deferred_index(
+    airbyte_message1: AirbyteMessage,
+    airbyte_message2: AirbyteMessage,
+    test_table_name: str,
+    table_schema: str,
+):
+    overwrite_stream = ConfiguredAirbyteStream(
+        stream=AirbyteStream(name=test_table_name, json_schema=table_schema, supported_sync_modes=[SyncMode.full_refresh]),
+        sync_mode=SyncMode.full_refresh,
+        destination_sync_mode=DestinationSyncMode.overwrite,
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = {"destination_path": f"{tmp_dir}/sqlite.db", "high_throughput": True, "deferred_index_creation": True}
+        destination = DestinationSqlite()
+        list(destination.write(config, ConfiguredAirbyteCatalog(streams=[overwrite_stream]), [airbyte_message1, airbyte_message2]))
+
+        con = sqlite3.connect(config["destination_path"])
+        with con:
+            assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert con.execute(f"SELECT count(*) FROM _airbyte_raw_{test_table_name}").fetchone()[0] == 2
+            indexes = con.execute(f"PRAGMA index_list(_airbyte_raw_{test_table_name})").fetchall()
+        con.close()
+
+    assert [(index[1], index[2]) for index in indexes] == [(f"_airbyte_raw_{test_table_name}_airbyte_ab_id", 1)]
+
+
+def test_write_with_deferred_index_creates_the_index_when_the_sync_fails(
+    airbyte_message1: AirbyteMessage,
+    test_table_name: str,
+    table_schema: str,
+):
+    overwrite_stream = ConfiguredAirbyteStream(
+        stream=AirbyteStream(name=test_table_name, json_schema=table_schema, supported_sync_modes=[SyncMode.full_refresh]),
+        sync_mode=SyncMode.full_refresh,
+        destination_sync_mode=DestinationSyncMode.overwrite,
+    )
+    state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": 1}))
+
+    def failing_messages():
+        yield airbyte_message1
+        yield state_message
+        yield airbyte_message1
+        raise RuntimeError("source failed")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = {"destination_path": f"{tmp_dir}/sqlite.db", "deferred_index_creation": True}
+        destination = DestinationSqlite()
+        with pytest.raises(RuntimeError):
+            list(destination.write(config, ConfiguredAirbyteCatalog(streams=[overwrite_stream]), failing_messages()))
+
+        con = sqlite3.connect(config["destination_path"])
+        with con:
+            assert con.execute(f"SELECT count(*) FROM _airbyte_raw_{test_table_name}").fetchone()[0] == 1
+            indexes = con.execute(f"PRAGMA index_list(_airbyte_raw_{test_table_name})").fetchall()
+        con.close()
+
+    assert [(index[1], index[2]) for index in indexes] == [(f"_airbyte_raw_{test_table_name}_airbyte_ab_id", 1)]
+
+
+def test_write_creates_the_missing_index_of_an_existing_table(
+    configured_catalogue: ConfiguredAirbyteCatalog,
+    airbyte_message1: AirbyteMessage,
+    test_table_name: str,
+):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = {"destination_path": f"{tmp_dir}/sqlite.db"}
+        con = sqlite3.connect(config["destination_path"])
+        with con:
+            # left by a sync with deferred index creation that was killed before building the index
+            con.execute(f"CREATE TABLE _airbyte_raw_{test_table_name} (_airbyte_ab_id TEXT, _airbyte_emitted_at TEXT, _airbyte_data TEXT)")
+        con.close()
+
+        destination = DestinationSqlite()
+        list(destination.write(config, configured_catalogue, [airbyte_message1]))
+
+        con = sqlite3.connect(config["destination_path"])
+        with con:
+            indexes = con.execute(f"PRAGMA index_list(_airbyte_raw_{test_table_name})").fetchall()
+        con.close()
+
+    assert [(index[1], index[2]) for index in indexes] == [(f"_airbyte_raw_{test_table_name}_airbyte_ab_id", 1)]
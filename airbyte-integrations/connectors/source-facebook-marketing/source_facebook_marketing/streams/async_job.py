@@ -120,6 +120,10 @@ class AsyncJob(ABC):
     def get_result(self) -> Iterator[Any]:
         """Retrieve result of the finished job."""
 
+    @abstractmethod
+    def prefetch_result(self):
+        """Download the whole result of the finished job, so that get_result returns it without calling the API."""
+
     @abstractmethod
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones"""
@@ -166,6 +170,11 @@ class ParentAsyncJob(AsyncJob):
         for job in self._jobs:
             yield from job.get_result()
 
+    def prefetch_result(self):
+        """Download the whole result of each job in the group."""
+        for job in self._jobs:
+            job.prefetch_result()
+
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones."""
         new_jobs = []
@@ -212,6 +221,7 @@ class InsightAsyncJob(AsyncJob):
         self._start_time = None
         self._finish_time = None
         self._failed = False
+        self._result: Optional[List[Any]] = None
 
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones grouped by ParentAsyncJob class."""
@@ -279,6 +289,7 @@ class InsightAsyncJob(AsyncJob):
         self._failed = False
         self._start_time = None
         self._finish_time = None
+        self._result = None
         self.start()
         logger.info(f"{self}: restarted.")
 
@@ -362,8 +373,14 @@ class InsightAsyncJob(AsyncJob):
         """Retrieve result of the finished job."""
         if not self._job or self.failed:
             raise RuntimeError(f"{self}: Incorrect usage of get_result - the job is not started or failed")
+        if self._result is not None:
+            return self._result
         return self._job.get_result(params={"limit": self.page_size})
 
+    def prefetch_result(self):
+        """Read all pages of the result, keeping them in memory until the job is consumed."""
+        self._result = list(self.get_result())
+
     def __str__(self) -> str:
         """String representation of the job wrapper."""
         job_id = self._job["report_run_id"] if self._job else "<None>"
@@ -3,9 +3,14 @@
 #
 
 import logging
+import statistics
 import time
-from typing import TYPE_CHECKING, Iterator, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, List
 
+import pendulum
 from source_facebook_marketing.streams.common import JobException
 
 from .async_job import AsyncJob, ParentAsyncJob, update_in_batch
@@ -21,16 +26,23 @@ class InsightAsyncJobManager:
     Class for managing Ads Insights async jobs. Before running next job it
     checks current insight throttle value and if it greater than THROTTLE_LIMIT variable, no new jobs added.
     To consume completed jobs use completed_job generator, jobs will be returned in the order they finished.
+    Results of completed jobs are downloaded by background workers while the other jobs are still running.
     """
 
     # When current insights throttle hit this value no new jobs added.
     THROTTLE_LIMIT = 70
     MAX_NUMBER_OF_ATTEMPTS = 20
-    # Time to wait before checking job status update again.
+    # Bounds of the time to wait before checking job status update again. The time is estimated
+    # from how long the already completed jobs took.
+    MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS = 5
     JOB_STATUS_UPDATE_SLEEP_SECONDS = 30
+    # Number of the last completed jobs used to estimate the duration of the running ones.
+    JOB_DURATION_SAMPLES = 20
     # Maximum of concurrent jobs that could be scheduled. Since throttling
     # limit is not reliable indicator of async workload capability we still have to use this parameter.
     MAX_JOBS_IN_QUEUE = 100
+    # Maximum of completed jobs whose results are downloaded ahead of consumption, their results are kept in memory.
+    MAX_PREFETCHED_RESULTS = 3
 
     def __init__(self, api: "API", jobs: Iterator[AsyncJob]):
         """Init
@@ -40,13 +52,30 @@ class InsightAsyncJobManager:
         """
         self._api = api
         self._jobs = iter(jobs)
+        self._empty = False
         self._running_jobs = []
+        self._completed_jobs: Deque[AsyncJob] = deque()
+        self._downloads: Dict[AsyncJob, Future] = {}
+        self._download_executor = ThreadPoolExecutor(max_workers=self.MAX_PREFETCHED_RESULTS, thread_name_prefix="insights-result")
+        self._start_times: Dict[AsyncJob, pendulum.DateTime] = {}
+        self._job_durations: Deque[float] = deque(maxlen=self.JOB_DURATION_SAMPLES)
+        self._polls_without_completed_jobs = 0
 
     def _start_jobs(self):
-        """Enqueue new jobs."""
+        """Enqueue new jobs, waiting for the throttle to go down."""
 
         self._update_api_throttle_limit()
         self._wait_throttle_limit_down()
+        self._enqueue_jobs()
+
+    def _refill_jobs(self):
+        """Enqueue new jobs if the throttle allows it, without waiting."""
+        if self._empty or len(self._running_jobs) >= self.MAX_JOBS_IN_QUEUE:
+            return
+        self._update_api_throttle_limit()
+        self._enqueue_jobs()
+
+    def _enqueue_jobs(self):
         prev_jobs_count = len(self._running_jobs)
         while self._get_current_throttle_value() < self.THROTTLE_LIMIT and len(self._running_jobs) < self.MAX_JOBS_IN_QUEUE:
             job = next(self._jobs, None)
@@ -54,6 +83,7 @@ class InsightAsyncJobManager:
                 self._empty = True
                 break
             job.start()
+            self._start_times[job] = pendulum.now()
             self._running_jobs.append(job)
 
         logger.info(
@@ -64,22 +94,65 @@ class InsightAsyncJobManager:
 
     def completed_jobs(self) -> Iterator[AsyncJob]:
         """Wait until job is ready and return it. If job
-            failed try to restart it for FAILED_JOBS_RESTART_COUNT times. After job
-            is completed new jobs added according to current throttling limit.
+            failed try to restart it for FAILED_JOBS_RESTART_COUNT times. New jobs are added
+            as soon as the throttling limit allows it, and results of the completed jobs are
+            downloaded in background while waiting for the others.
 
         :yield: completed jobs
         """
-        if not self._running_jobs:
-            self._start_jobs()
-
-        while self._running_jobs:
-            completed_jobs = self._check_jobs_status_and_restart()
-            while not completed_jobs:
-                logger.info(f"No jobs ready to be consumed, wait for {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
-                time.sleep(self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
-                completed_jobs = self._check_jobs_status_and_restart()
-            yield from completed_jobs
-            self._start_jobs()
+        while True:
+            if not self._running_jobs and not self._completed_jobs:
+                if not self._empty:
+                    self._start_jobs()
+                if not self._running_jobs:
+                    break
+
+            if self._running_jobs:
+                self._completed_jobs.extend(self._check_jobs_status_and_restart())
+                self._refill_jobs()
+            self._prefetch_results()
+
+            if not self._completed_jobs:
+                sleep_seconds = self._get_sleep_seconds()
+                logger.info(f"No jobs ready to be consumed, wait for {sleep_seconds} seconds")
+                time.sleep(sleep_seconds)
+                continue
+
+            # wait for the result of the first completed job, checking the status of the running jobs meanwhile
+            job = self._completed_jobs[0]
+            download = self._downloads[job]
+            wait([download], timeout=self._get_sleep_seconds() if self._running_jobs else None)
+            if not download.done():
+                continue
+            self._completed_jobs.popleft()
+            del self._downloads[job]
+            if download.exception():
+                # the result will be read again by the consumer
+                logger.warning(f"{job}: failed to download the result in advance: {download.exception()}")
+            yield job
+
+        self._download_executor.shutdown(wait=False)
+
+    def _prefetch_results(self):
+        """Start downloading the results of the first completed jobs."""
+        for job in islice(self._completed_jobs, self.MAX_PREFETCHED_RESULTS):
+            if job not in self._downloads:
+                self._downloads[job] = self._download_executor.submit(job.prefetch_result)
+
+    def _get_sleep_seconds(self) -> float:
+        """Estimate the time until the next running job completes from the durations of the completed ones.
+        Until any job completes, the time doubles on every poll."""
+        if self._job_durations:
+            expected_duration = statistics.median(self._job_durations)
+            now = pendulum.now()
+            sleep_seconds = (
+                min(expected_duration - (now - self._start_times.get(job, now)).total_seconds() for job in self._running_jobs)
+                if self._running_jobs
+                else expected_duration
+            )
+        else:
+            sleep_seconds = self.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS * 2**self._polls_without_completed_jobs
+        return max(self.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS, min(sleep_seconds, self.JOB_STATUS_UPDATE_SLEEP_SECONDS))
 
     def _check_jobs_status_and_restart(self) -> List[AsyncJob]:
         """Checks jobs status in advance and restart if some failed.
@@ -108,17 +181,24 @@ class InsightAsyncJobManager:
                     grouped_jobs = ParentAsyncJob(api=self._api.api, jobs=smaller_jobs, interval=job.interval)
                     running_jobs.append(grouped_jobs)
                     grouped_jobs.start()
+                    self._start_times.pop(job, None)
+                    self._start_times[grouped_jobs] = pendulum.now()
                 else:
                     logger.info("%s: failed, restarting", job)
                     job.restart()
+                    self._start_times[job] = pendulum.now()
                     running_jobs.append(job)
                 failed_num += 1
             elif job.completed:
                 completed_jobs.append(job)
+                start_time = self._start_times.pop(job, None)
+                if start_time:
+                    self._job_durations.append((pendulum.now() - start_time).total_seconds())
             else:
                 running_jobs.append(job)
 
         self._running_jobs = running_jobs
+        self._polls_without_completed_jobs = 0 if completed_jobs else self._polls_without_completed_jobs + 1
         logger.info(f"Completed jobs: {len(completed_jobs)}, Failed jobs: {failed_num}, Running jobs: {len(self._running_jobs)}")
 
         return completed_jobs
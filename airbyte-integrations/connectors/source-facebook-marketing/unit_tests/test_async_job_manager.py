@@ -2,10 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
+
+import pendulum
 import pytest
 from facebook_business.api import FacebookAdsApiBatch
 from source_facebook_marketing.api import MyFacebookAdsApi
-from source_facebook_marketing.streams.async_job import InsightAsyncJob, ParentAsyncJob
+from source_facebook_marketing.streams.async_job import AsyncJob, InsightAsyncJob, ParentAsyncJob
 from source_facebook_marketing.streams.async_job_manager import InsightAsyncJobManager
 from source_facebook_marketing.streams.common import JobException
 
@@ -28,6 +31,48 @@ def update_job_mock_fixture(mocker):
     return mocker.patch("source_facebook_marketing.streams.async_job_manager.update_in_batch")
 
 
+class FakeInsightJob(AsyncJob):
+    """Fake Ads API report run which completes after the given number of status updates"""
+
+    def __init__(self, name, updates_to_complete, result):
+        super().__init__(api=None, interval=None)
+        self.name = name
+        self._updates_left = updates_to_complete
+        self._result = result
+        self.started = False
+        self.download_thread = None
+
+    def start(self):
+        self.started = True
+        self._attempt_number += 1
+
+    def restart(self):
+        raise AssertionError("Fake jobs never fail")
+
+    @property
+    def completed(self) -> bool:
+        return self._updates_left <= 0
+
+    @property
+    def failed(self) -> bool:
+        return False
+
+    def update_job(self, batch=None):
+        self._updates_left -= 1
+
+    def get_result(self):
+        return self._result
+
+    def prefetch_result(self):
+        self.download_thread = threading.current_thread()
+
+    def split_job(self):
+        raise AssertionError("Fake jobs never fail")
+
+    def __str__(self):
+        return self.name
+
+
 class TestInsightAsyncManager:
     def test_jobs_empty(self, api):
         """Should work event without jobs"""
@@ -69,7 +114,7 @@ class TestInsightAsyncManager:
 
         job = next(manager.completed_jobs(), None)
         assert job == jobs[0]
-        time_mock.sleep.assert_called_with(InsightAsyncJobManager.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+        time_mock.sleep.assert_called_with(InsightAsyncJobManager.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS)
 
         job = next(manager.completed_jobs(), None)
         assert job is None
@@ -174,3 +219,51 @@ class TestInsightAsyncManager:
 
         with pytest.raises(JobException):
             next(manager.completed_jobs(), None)
+
+    def test_results_are_downloaded_while_other_jobs_are_running(self, api, time_mock):
+        fast_job = FakeInsightJob("fast", updates_to_complete=1, result=[1])
+        slow_job = FakeInsightJob("slow", updates_to_complete=4, result=[2])
+        manager = InsightAsyncJobManager(api=api, jobs=[fast_job, slow_job])
+
+        completed_jobs = manager.completed_jobs()
+
+        assert next(completed_jobs) is fast_job
+        assert fast_job.download_thread is not threading.current_thread()
+        assert not slow_job.completed
+        assert next(completed_jobs) is slow_job
+        assert slow_job.download_thread is not None
+        assert next(completed_jobs, None) is None
+
+    def test_queue_is_refilled_before_completed_job_is_consumed(self, api, time_mock):
+        jobs = [FakeInsightJob(f"job {i}", updates_to_complete=1, result=[i]) for i in range(3)]
+        manager = InsightAsyncJobManager(api=api, jobs=jobs)
+        manager.MAX_JOBS_IN_QUEUE = 1
+
+        completed_jobs = manager.completed_jobs()
+
+        assert next(completed_jobs) is jobs[0]
+        assert jobs[1].started
+        assert [list(job.get_result()) for job in completed_jobs] == [[1], [2]]
+
+    def test_sleep_time_doubles_until_a_job_completes(self, api):
+        manager = InsightAsyncJobManager(api=api, jobs=[])
+
+        sleep_times = []
+        for polls in range(4):
+            manager._polls_without_completed_jobs = polls
+            sleep_times.append(manager._get_sleep_seconds())
+
+        assert sleep_times == [5, 10, 20, 30]
+
+    def test_sleep_time_is_estimated_from_completed_jobs_durations(self, api):
+        job = FakeInsightJob("running", updates_to_complete=10, result=[])
+        manager = InsightAsyncJobManager(api=api, jobs=[])
+        manager._job_durations.extend([10, 20, 60])
+        manager._running_jobs = [job]
+
+        manager._start_times[job] = pendulum.now().subtract(seconds=8)
+        assert 10 <= manager._get_sleep_seconds() <= 12
+        manager._start_times[job] = pendulum.now().subtract(seconds=18)
+        assert manager._get_sleep_seconds() == InsightAsyncJobManager.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS
+        manager._job_durations.extend([600, 600])
+        assert manager._get_sleep_seconds() == InsightAsyncJobManager.JOB_STATUS_UPDATE_SLEEP_SECONDS
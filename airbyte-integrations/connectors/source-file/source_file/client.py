@@ -3,14 +3,16 @@
 #
 
 
+import io
 import json
 import logging
+import shutil
 import sys
 import tempfile
 import traceback
 import urllib
 from os import environ
-from typing import Iterable
+from typing import Iterable, Tuple
 from urllib.parse import urlparse
 from zipfile import BadZipFile
 
@@ -18,8 +20,11 @@ import backoff
 import boto3
 import botocore
 import google
-import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.feather as pa_feather
+import pyarrow.parquet as pa_parquet
 import smart_open
 import smart_open.ssh
 from airbyte_cdk.entrypoint import logger
@@ -252,7 +257,17 @@ class Client:
     """Class that manages reading and parsing data from streams"""
 
     CSV_CHUNK_SIZE = 10_000
+    CACHE_CHUNK_SIZE = 8 * 1024 * 1024
+    ARROW_BLOCK_SIZE = 8 * 1024 * 1024
     binary_formats = {"excel", "excel_binary", "feather", "parquet", "orc", "pickle"}
+    # formats that can be read in record batches with `"engine": "pyarrow"` in the reader options
+    arrow_formats = {"csv", "feather", "parquet"}
+    # reader options of each format that are translated to pyarrow options, any other option is rejected with the pyarrow engine
+    arrow_options = {
+        "csv": {"engine", "sep", "delimiter", "quotechar", "header", "names", "skiprows", "usecols", "encoding"},
+        "feather": {"engine", "columns"},
+        "parquet": {"engine", "columns"},
+    }
 
     def __init__(self, dataset_name: str, url: str, provider: dict, format: str = None, reader_options: dict = None):
         self._dataset_name = dataset_name
@@ -343,7 +358,9 @@ class Client:
 
         reader_options = {**self._reader_options}
         try:
-            if self._reader_format == "csv":
+            if reader_options.get("engine") == "pyarrow" and self._reader_format in self.arrow_formats:
+                yield from self._load_arrow_dataframes(fp, reader_options, skip_data=skip_data, read_sample_chunk=read_sample_chunk)
+            elif self._reader_format == "csv":
                 bytes_read = 0
                 reader_options["chunksize"] = self.CSV_CHUNK_SIZE
                 if skip_data:
@@ -365,7 +382,7 @@ class Client:
                     yield reader(fp, **reader_options)
             else:
                 yield reader(fp, **reader_options)
-        except ParserError as err:
+        except (ParserError, pa.ArrowInvalid) as err:
             error_msg = f"File {fp} can not be parsed. Please check your reader_options. https://pandas.pydata.org/pandas-docs/stable/user_guide/io.html"
             logger.error(f"{error_msg}\n{traceback.format_exc()}")
             raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error) from err
@@ -377,6 +394,116 @@ class Client:
             logger.error(f"{error_msg}\n{traceback.format_exc()}")
             raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error) from err
 
+    def _load_arrow_dataframes(self, fp, reader_options: dict, skip_data: bool = False, read_sample_chunk: bool = False) -> Iterable:
+        """Read the file with pyarrow one record batch at a time, so only one batch is held in memory as a dataframe"""
+        unsupported_options = set(reader_options) - self.arrow_options[self._reader_format]
+        if unsupported_options:
+            error_msg = (
+                f"Reader options {sorted(unsupported_options)} are not supported with the pyarrow engine for {self._reader_format} files."
+            )
+            raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error)
+
+        if self._reader_format == "csv":
+            schema, batches = self._open_arrow_csv(fp, reader_options)
+        elif self._reader_format == "parquet":
+            schema, batches = self._open_arrow_parquet(fp, reader_options.get("columns"))
+        else:
+            schema, batches = self._open_arrow_feather(fp, reader_options.get("columns"))
+
+        # like pandas, number the columns when the csv file has no header row and no names are provided
+        numbered_columns = (
+            self._reader_format == "csv" and reader_options.get("header", "infer") is None and not reader_options.get("names")
+        )
+        if skip_data:
+            batches = [schema.empty_table()]
+        for batch in batches:
+            df = batch.to_pandas()
+            if numbered_columns:
+                df.columns = [int(column[1:]) for column in df.columns]
+            yield df
+            if read_sample_chunk:
+                return
+
+    def _open_arrow_csv(self, fp, reader_options: dict) -> Tuple[pa.Schema, Iterable[pa.RecordBatch]]:
+        header = reader_options.get("header", "infer")
+        names = reader_options.get("names")
+        skiprows = reader_options.get("skiprows") or 0
+        if not isinstance(skiprows, int) or isinstance(skiprows, bool) or skiprows < 0:
+            error_msg = f"Reader option skiprows={skiprows!r} is not supported with the pyarrow engine, only a number of rows to skip is."
+            raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error)
+        # rows skipped before the header row, or before the first record when there is no header row
+        skip_rows = skiprows + (header if isinstance(header, int) else 0)
+        if names and isinstance(header, int):
+            # the header row is replaced by the provided names
+            skip_rows += 1
+        autogenerate_column_names = header is None and not names
+        usecols = reader_options.get("usecols")
+        if autogenerate_column_names and usecols:
+            # pandas selects the columns of a file without header by position, pyarrow names them f0, f1...
+            usecols = [f"f{column}" if isinstance(column, int) else column for column in usecols]
+        read_options = pa_csv.ReadOptions(
+            block_size=self.ARROW_BLOCK_SIZE,
+            skip_rows=skip_rows,
+            column_names=names,
+            autogenerate_column_names=autogenerate_column_names,
+            encoding=reader_options.get("encoding") or "utf8",
+        )
+        parse_options = pa_csv.ParseOptions(
+            delimiter=reader_options.get("sep") or reader_options.get("delimiter") or ",",
+            quote_char=reader_options.get("quotechar", '"'),
+        )
+        convert_options = pa_csv.ConvertOptions(include_columns=usecols)
+        if isinstance(fp, io.TextIOBase):
+            # pyarrow decodes the bytes itself according to the encoding of the read options
+            fp = fp.buffer
+        reader = pa_csv.open_csv(fp, read_options=read_options, parse_options=parse_options, convert_options=convert_options)
+        return reader.schema, reader
+
+    def _open_arrow_parquet(self, fp, columns: list = None) -> Tuple[pa.Schema, Iterable[pa.RecordBatch]]:
+        parquet_file = pa_parquet.ParquetFile(fp)
+        schema = parquet_file.schema_arrow
+        if columns:
+            schema = pa.schema([schema.field(column) for column in columns])
+        return schema, parquet_file.iter_batches(batch_size=self.CSV_CHUNK_SIZE, columns=columns)
+
+    @staticmethod
+    def _open_arrow_feather(fp, columns: list = None) -> Tuple[pa.Schema, Iterable[pa.RecordBatch]]:
+        try:
+            reader = pa.ipc.open_file(fp)
+        except pa.ArrowInvalid:
+            # Feather V1 files can't be read in batches
+            if hasattr(fp, "seek"):
+                fp.seek(0)
+            table = pa_feather.read_table(fp, columns=columns)
+            return table.schema, table.to_batches()
+        schema = reader.schema
+        if columns:
+            schema = pa.schema([schema.field(column) for column in columns])
+
+        def batches():
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                yield pa.RecordBatch.from_arrays([batch.column(column) for column in columns], schema=schema) if columns else batch
+
+        return schema, batches()
+
+    @staticmethod
+    def dataframe_to_records(df: pd.DataFrame, columns: list) -> Iterable[dict]:
+        """Convert a dataframe to records, replacing missing values (NaN, NaT) with None.
+
+        Columns are converted to python objects one at a time and only the columns containing missing values are scanned for them,
+        which is much cheaper than replacing values in the whole dataframe before calling `to_dict`.
+        """
+        values = []
+        for column in columns:
+            series = df[column]
+            column_values = series.tolist()
+            if series.hasnans:
+                column_values = [None if is_null else value for value, is_null in zip(column_values, series.isna().tolist())]
+            values.append(column_values)
+        for row in zip(*values):
+            yield dict(zip(columns, row))
+
     @staticmethod
     def dtype_to_json_type(current_type: str, dtype) -> str:
         """Convert Pandas Dataframe types to Airbyte Types.
@@ -414,16 +541,14 @@ class Client:
                     fields = set(fields) if fields else None
                     df = self.load_yaml(fp)
                     columns = fields.intersection(set(df.columns)) if fields else df.columns
-                    df = df.where(pd.notnull(df), None)
-                    yield from df[columns].to_dict(orient="records")
+                    yield from self.dataframe_to_records(df, list(columns))
                 else:
                     fields = set(fields) if fields else None
                     if self.binary_source:
                         fp = self._cache_stream(fp)
                     for df in self.load_dataframes(fp):
                         columns = fields.intersection(set(df.columns)) if fields else df.columns
-                        df.replace({np.nan: None}, inplace=True)
-                        yield from df[list(columns)].to_dict(orient="records")
+                        yield from self.dataframe_to_records(df, list(columns))
             except ConnectionResetError:
                 logger.info(f"Catched `connection reset error - 104`, stream: {self.stream_name} ({self.reader.full_url})")
                 raise ConnectionResetError
@@ -437,7 +562,7 @@ class Client:
     def _cache_stream(self, fp):
         """cache stream to file"""
         fp_tmp = tempfile.TemporaryFile(mode="w+b")
-        fp_tmp.write(fp.read())
+        shutil.copyfileobj(fp, fp_tmp, self.CACHE_CHUNK_SIZE)
         fp_tmp.seek(0)
         fp.close()
         return fp_tmp
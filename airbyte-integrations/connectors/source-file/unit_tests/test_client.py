@@ -2,9 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-
+import io
 from unittest.mock import patch, sentinel
 
+import numpy as np
+import pandas as pd
 import pytest
 from airbyte_cdk.utils import AirbyteTracedException
 from pandas import read_csv, read_excel
@@ -189,3 +191,109 @@ def test_urlfile_open_backoff_sftp(monkeypatch, mocker):
     assert call_count == 7
 
     assert sleep_mock.call_count == 5
+
+
+def test_dataframe_to_records_replaces_missing_values_with_none():
+    df = pd.DataFrame(
+        {
+            "text": ["a", np.nan, "c"],
+            "number": [1.5, np.nan, 3.0],
+            "integer": [1, 2, 3],
+            "date": pd.to_datetime(["2023-01-01", None, "2023-01-03"]),
+        }
+    )
+
+    records = list(Client.dataframe_to_records(df, ["text", "number", "integer", "date"]))
+
+    assert records == [
+        {"text": "a", "number": 1.5, "integer": 1, "date": pd.Timestamp("2023-01-01")},
+        {"text": None, "number": None, "integer": 2, "date": None},
+        {"text": "c", "number": 3.0, "integer": 3, "date": pd.Timestamp("2023-01-03")},
+    ]
+    assert type(records[0]["integer"]) is int
+
+
+def test_cache_stream_copies_in_chunks(client):
+    content = b"x" * (3 * 1024 + 10)
+    client.CACHE_CHUNK_SIZE = 1024
+    fp = io.BytesIO(content)
+
+    with patch.object(fp, "read", wraps=fp.read) as read:
+        cached = client._cache_stream(fp)
+
+    assert cached.read() == content
+    assert all(call.args == (1024,) for call in read.call_args_list)
+
+
+@pytest.mark.parametrize(
+    "reader_options, expected_columns, expected_first_record",
+    [
+        ({"engine": "pyarrow"}, ["a", "b"], {"a": 1, "b": "x"}),
+        ({"engine": "pyarrow", "sep": ";"}, ["a,b"], {"a,b": "1,x"}),
+        ({"engine": "pyarrow", "names": ["c1", "c2"]}, ["c1", "c2"], {"c1": "a", "c2": "b"}),
+        ({"engine": "pyarrow", "header": 0, "names": ["c1", "c2"]}, ["c1", "c2"], {"c1": 1, "c2": "x"}),
+        ({"engine": "pyarrow", "usecols": ["b"]}, ["b"], {"b": "x"}),
+        ({"engine": "pyarrow", "skiprows": 1, "header": None}, [0, 1], {0: 1, 1: "x"}),
+        ({"engine": "pyarrow", "header": None, "usecols": [1]}, [1], {1: "b"}),
+    ],
+)
+def test_load_dataframes_with_pyarrow_engine(tmp_path, reader_options, expected_columns, expected_first_record):
+    f = tmp_path / "test.csv"
+    f.write_text("a,b\n1,x\n,y\n3,\n")
+    client = Client(dataset_name="test", url=str(f), provider={"storage": "local"}, format="csv", reader_options=reader_options)
+
+    with open(f) as fp:
+        df = pd.concat(client.load_dataframes(fp))
+
+    assert list(df.columns) == expected_columns
+    assert next(client.dataframe_to_records(df, list(df.columns))) == expected_first_record
+
+
+def test_load_dataframes_with_pyarrow_engine_reads_csv_in_batches(tmp_path):
+    f = tmp_path / "test.csv"
+    f.write_text("a,b\n" + "".join(f"{i},value {i}\n" for i in range(10_000)))
+    client = Client(dataset_name="test", url=str(f), provider={"storage": "local"}, format="csv", reader_options={"engine": "pyarrow"})
+    client.ARROW_BLOCK_SIZE = 1024
+
+    dataframes = list(client.load_dataframes(str(f)))
+
+    assert len(dataframes) > 1
+    assert sum(len(df) for df in dataframes) == 10_000
+    assert len(list(client.load_dataframes(str(f), read_sample_chunk=True))) == 1
+    empty_dataframes = list(client.load_dataframes(str(f), skip_data=True))
+    assert len(empty_dataframes) == 1
+    assert list(empty_dataframes[0].columns) == ["a", "b"] and empty_dataframes[0].empty
+
+
+@pytest.mark.parametrize(
+    "file_format, reader_options",
+    [
+        ("csv", {"engine": "pyarrow", "dtype": "str"}),
+        ("csv", {"engine": "pyarrow", "skiprows": [1]}),
+        ("parquet", {"engine": "pyarrow", "filters": [("a", "=", 1)]}),
+        ("feather", {"engine": "pyarrow", "use_threads": False}),
+    ],
+)
+def test_load_dataframes_with_pyarrow_engine_rejects_unsupported_options(tmp_path, file_format, reader_options):
+    f = tmp_path / f"test.{file_format}"
+    f.write_text("a,b\n1,x\n")
+    client = Client(dataset_name="test", url=str(f), provider={"storage": "local"}, format=file_format, reader_options=reader_options)
+
+    with pytest.raises(AirbyteTracedException):
+        next(client.load_dataframes(str(f)))
+
+
+@pytest.mark.parametrize("file_format, pandas_reader", [("parquet", pd.read_parquet), ("feather", pd.read_feather)])
+def test_load_dataframes_with_pyarrow_engine_binary_formats(absolute_path, test_files, file_format, pandas_reader):
+    f = f"{absolute_path}/{test_files}/formats/{file_format}/demo.{file_format}"
+    client = Client(dataset_name="test", url=f, provider={"storage": "local"}, format=file_format, reader_options={"engine": "pyarrow"})
+
+    with open(f, "rb") as fp:
+        df = pd.concat(client.load_dataframes(fp), ignore_index=True)
+
+    assert df.equals(pandas_reader(f))
+
+    with open(f, "rb") as fp:
+        empty_dataframes = list(client.load_dataframes(fp, skip_data=True))
+    assert len(empty_dataframes) == 1
+    assert empty_dataframes[0].empty and list(empty_dataframes[0].columns) == list(df.columns)
@@ -7,6 +7,7 @@ import logging
 import sys
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from functools import cached_property, lru_cache, reduce
 from http import HTTPStatus
@@ -333,6 +334,8 @@ class Stream(HttpStream, ABC):
     granted_scopes: Set = None
     properties_scopes: Set = None
     unnest_fields: Optional[List[str]] = None
+    # number of property chunks of a page requested at the same time when the properties do not fit in one request
+    property_chunks_concurrency: int = 4
 
     @cached_property
     def record_unnester(self):
@@ -460,6 +463,32 @@ class Stream(HttpStream, ABC):
 
         return response
 
+    def _request_property_chunks(
+        self,
+        chunks: List[Any],
+        max_workers: int,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+        next_page_token: Mapping[str, Any] = None,
+    ) -> Iterable[requests.Response]:
+        """Request the property chunks of a page, in a thread pool when there are several workers, and yield the responses in order"""
+
+        def request(chunk):
+            return self.handle_request(
+                stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token, properties=chunk
+            )
+
+        if max_workers == 1:
+            yield from map(request, chunks)
+            return
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{self.name}-properties")
+        try:
+            futures = [executor.submit(request, chunk) for chunk in chunks]
+            for future in futures:
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _read_stream_records(
         self,
         stream_slice: Mapping[str, Any] = None,
@@ -476,14 +505,21 @@ class Stream(HttpStream, ABC):
         post_processor: IRecordPostProcessor = GroupByKey(self.primary_key) if group_by_pk else StoreAsIs()
         response = None
 
-        properties = self._property_wrapper
-        for chunk in properties.split():
-            response = self.handle_request(
-                stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token, properties=chunk
-            )
+        # the chunks of the page are requested concurrently and merged in order as soon as each of them is received
+        chunks = list(self._property_wrapper.split())
+        max_workers = 1 if self.use_cache else max(1, min(self.property_chunks_concurrency, len(chunks)))
+        started_at = time.perf_counter()
+        merge_seconds = 0.0
+        for response in self._request_property_chunks(chunks, max_workers, stream_slice, stream_state, next_page_token):
+            merge_started_at = time.perf_counter()
             for record in self._transform(self.parse_response(response, stream_state=stream_state)):
                 post_processor.add_record(record)
+            merge_seconds += time.perf_counter() - merge_started_at
 
+        logger.debug(
+            f"Read a page of {self.name} in {len(chunks)} property chunks with {max_workers} workers in "
+            f"{time.perf_counter() - started_at:.3f}s, merging the chunks took {merge_seconds:.3f}s"
+        )
         return post_processor.flat, response
 
     def read_records(
@@ -1069,6 +1105,10 @@ class CRMSearchStream(IncrementalStream, ABC):
     updated_at_field = "updatedAt"
     last_modified_field: str = None
     associations: List[str] = None
+    # maximum number of inputs of the batch read associations endpoint
+    associations_batch_size = 1000
+    # number of association types read at the same time
+    associations_concurrency = 4
     fully_qualified_name: str = None
 
     @property
@@ -1123,23 +1163,40 @@ class CRMSearchStream(IncrementalStream, ABC):
 
         return list(stream_records.values()), raw_response
 
-    def _read_associations(self, records: Iterable) -> Iterable[Mapping[str, Any]]:
-        records_by_pk = {record[self.primary_key]: record for record in records}
-        identifiers = list(map(lambda x: x[self.primary_key], records))
-        associations_stream = AssociationsStream(
-            api=self._api, start_date=self._start_date, credentials=self._credentials, parent_stream=self, identifiers=identifiers
+    @cached_property
+    def _associations_stream(self) -> AssociationsStream:
+        return AssociationsStream(
+            api=self._api, start_date=self._start_date, credentials=self._credentials, parent_stream=self, identifiers=[]
         )
-        slices = associations_stream.stream_slices(sync_mode=SyncMode.full_refresh)
 
-        for _slice in slices:
+    def _read_associations(self, records: Iterable) -> Iterable[Mapping[str, Any]]:
+        """
+        Attach the associations to the records. Associations are read for up to `associations_batch_size` records at once,
+        the association types concurrently.
+        """
+        records = list(records)
+        records_by_pk = {}
+        for record in records:
+            # the same object can be returned by several search pages
+            records_by_pk.setdefault(record[self.primary_key], []).append(record)
+        identifiers = list(records_by_pk)
+        associations_stream = self._associations_stream
+        slices = list(associations_stream.stream_slices(sync_mode=SyncMode.full_refresh))
+
+        def read_slice(_slice: str) -> List[Mapping[str, Any]]:
             logger.info(f"Reading {_slice} associations of {self.entity}")
-            associations = associations_stream.read_records(stream_slice=_slice, sync_mode=SyncMode.full_refresh)
-            for group in associations:
-                current_record = records_by_pk[group["from"]["id"]]
-                associations_list = current_record.get(_slice, [])
-                associations_list.extend(association["toObjectId"] for association in group["to"])
-                current_record[_slice] = associations_list
-        return records_by_pk.values()
+            return list(associations_stream.read_records(stream_slice=_slice, sync_mode=SyncMode.full_refresh))
+
+        with ThreadPoolExecutor(max_workers=self.associations_concurrency, thread_name_prefix=f"{self.name}-associations") as executor:
+            for batch_start in range(0, len(identifiers), self.associations_batch_size):
+                associations_stream.identifiers = identifiers[batch_start : batch_start + self.associations_batch_size]
+                for _slice, associations in zip(slices, executor.map(read_slice, slices)):
+                    for group in associations:
+                        for current_record in records_by_pk.get(group["from"]["id"], []):
+                            associations_list = current_record.get(_slice, [])
+                            associations_list.extend(association["toObjectId"] for association in group["to"])
+                            current_record[_slice] = associations_list
+        return records
 
     def read_records(
         self,
@@ -1153,6 +1210,8 @@ class CRMSearchStream(IncrementalStream, ABC):
         next_page_token = None
 
         latest_cursor = None
+        # records of the search pages waiting for their associations
+        pending_records = []
         while not pagination_complete:
             if self.state:
                 records, raw_response = self._process_search(
@@ -1160,7 +1219,6 @@ class CRMSearchStream(IncrementalStream, ABC):
                     stream_state=stream_state,
                     stream_slice=stream_slice,
                 )
-                records = self._read_associations(records)
             else:
                 records, raw_response = self._read_stream_records(
                     stream_slice=stream_slice,
@@ -1168,6 +1226,15 @@ class CRMSearchStream(IncrementalStream, ABC):
                     next_page_token=next_page_token,
                 )
                 records = self._flat_associations(records)
+
+            next_page_token = self.next_page_token(raw_response)
+            restart_search = bool(self.state and next_page_token and next_page_token["payload"]["after"] >= 10000)
+            if self.state:
+                # associations are read at once for the records of several pages
+                pending_records.extend(records)
+                if next_page_token and not restart_search and len(pending_records) < self.associations_batch_size:
+                    continue
+                records, pending_records = self._read_associations(pending_records), []
             records = self._filter_old_records(records)
             records = self.record_unnester.unnest(records)
 
@@ -1176,10 +1243,9 @@ class CRMSearchStream(IncrementalStream, ABC):
                 latest_cursor = max(cursor, latest_cursor) if latest_cursor else cursor
                 yield record
 
-            next_page_token = self.next_page_token(raw_response)
             if not next_page_token:
                 pagination_complete = True
-            elif self.state and next_page_token["payload"]["after"] >= 10000:
+            elif restart_search:
                 # Hubspot documentation states that the search endpoints are limited to 10,000 total results
                 # for any given query. Attempting to page beyond 10,000 will result in a 400 error.
                 # https://developers.hubspot.com/docs/api/crm/search. We stop getting data at 10,000 and
@@ -2393,7 +2459,6 @@ class WebAnalyticsStream(IncrementalMixin, HttpSubStream, Stream):
     ) -> Iterable[Optional[Mapping[str, Any]]]:
         now = pendulum.now(tz="UTC")
         for parent_slice in super().stream_slices(sync_mode, cursor_field, stream_state):
-
             object_id = parent_slice["parent"][self.object_id_field]
 
             # Take the initial datetime either form config or from state depending whichever value is higher
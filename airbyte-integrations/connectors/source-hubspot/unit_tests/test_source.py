@@ -4,6 +4,7 @@
 
 
 import logging
+import threading
 from datetime import timedelta
 from http import HTTPStatus
 from unittest.mock import MagicMock
@@ -82,7 +83,6 @@ def test_check_connection_invalid_start_date_exception(config_invalid_date):
 
 @mock.patch("source_hubspot.source.SourceHubspot.get_custom_object_streams")
 def test_streams(requests_mock, config):
-
     streams = SourceHubspot().streams(config)
 
     assert len(streams) == 32
@@ -90,23 +90,16 @@ def test_streams(requests_mock, config):
 
 @mock.patch("source_hubspot.source.SourceHubspot.get_custom_object_streams")
 def test_streams(requests_mock, config_experimental):
-
     streams = SourceHubspot().streams(config_experimental)
 
     assert len(streams) == 44
 
 
 def test_custom_streams(config_experimental):
-    custom_object_stream_instances = [
-        MagicMock()
-    ]
+    custom_object_stream_instances = [MagicMock()]
     streams = SourceHubspot().get_web_analytics_custom_objects_stream(
         custom_object_stream_instances=custom_object_stream_instances,
-        common_params={
-            "api": MagicMock(),
-            "start_date": "2021-01-01T00:00:00Z",
-            "credentials": config_experimental["credentials"]
-        }
+        common_params={"api": MagicMock(), "start_date": "2021-01-01T00:00:00Z", "credentials": config_experimental["credentials"]},
     )
     assert len(list(streams)) == 1
 
@@ -391,6 +384,61 @@ class TestSplittingPropertiesFunctionality:
 
         assert len(stream_records) == 6
 
+    def test_stream_with_splitting_properties_requests_chunks_concurrently(self, requests_mock, common_params, api, fake_properties_list):
+        """
+        Check that the property chunks of a page are requested at the same time and merged by record id
+        """
+
+        parsed_properties = list(APIv3Property(fake_properties_list).split())
+        self.set_mock_properties(requests_mock, "/properties/v2/product/properties", fake_properties_list)
+
+        test_stream = Products(**common_params)
+        test_stream.property_chunks_concurrency = len(parsed_properties)
+        # every chunk request waits for the others, so the read fails if the chunks are requested one by one
+        all_chunks_requested = threading.Barrier(len(parsed_properties), timeout=5)
+
+        def chunk_response(properties):
+            def callback(request, context):
+                all_chunks_requested.wait()
+                return {
+                    "results": [
+                        {**self.BASE_OBJECT_BODY, **{"id": id, "properties": {p: "fake_data" for p in properties}}}
+                        for id in ["6043593519", "1092593519"]
+                    ],
+                    "paging": {},
+                }
+
+            return callback
+
+        for property_slice in parsed_properties:
+            prop_key, prop_val = next(iter(property_slice.as_url_param().items()))
+            requests_mock.register_uri("GET", f"{test_stream.url}?{prop_key}={prop_val}", json=chunk_response(property_slice.properties))
+
+        stream_records = list(test_stream.read_records(sync_mode=SyncMode.incremental))
+
+        assert [record["id"] for record in stream_records] == ["6043593519", "1092593519"]
+        for record in stream_records:
+            assert len(record["properties"]) == NUMBER_OF_PROPERTIES
+
+    def test_stream_with_one_properties_chunk_does_not_start_threads(self, requests_mock, common_params, api):
+        """
+        Check that a page requested in a single chunk is requested without a thread pool
+        """
+
+        self.set_mock_properties(requests_mock, "/properties/v2/product/properties", ["name"])
+        test_stream = Products(**common_params)
+        requests_mock.register_uri(
+            "GET",
+            test_stream.url,
+            json={"results": [{**self.BASE_OBJECT_BODY, "id": "6043593519", "properties": {"name": "a"}}], "paging": {}},
+        )
+
+        with mock.patch("source_hubspot.streams.ThreadPoolExecutor") as executor:
+            stream_records = list(test_stream.read_records(sync_mode=SyncMode.incremental))
+
+        assert [record["id"] for record in stream_records] == ["6043593519"]
+        executor.assert_not_called()
+
 
 @pytest.fixture(name="configured_catalog")
 def configured_catalog_fixture():
@@ -481,7 +529,7 @@ def test_search_based_stream_should_not_attempt_to_get_more_than_10k_records(req
     requests_mock.register_uri(
         "POST",
         "/crm/v4/associations/company/contacts/batch/read",
-        [{"status_code": 200, "json": {"results": [{"from": {"id": "1"}, "to": [{"toObjectId": "2"}]}]}}]
+        [{"status_code": 200, "json": {"results": [{"from": {"id": "1"}, "to": [{"toObjectId": "2"}]}]}}],
     )
 
     records, _ = read_incremental(test_stream, {})
@@ -491,6 +539,64 @@ def test_search_based_stream_should_not_attempt_to_get_more_than_10k_records(req
     assert test_stream.state["updatedAt"] == test_stream._init_sync.to_iso8601_string()
 
 
+def test_search_based_stream_reads_associations_of_several_pages_at_once(requests_mock, common_params, fake_properties_list):
+    responses = [
+        {
+            "json": {
+                "results": [{"id": f"{page * 100 + y}", "updatedAt": "2022-02-25T16:43:11Z"} for y in range(100)],
+                "paging": {"next": {"after": f"{(page + 1) * 100}"}} if page < 2 else {},
+            },
+            "status_code": 200,
+        }
+        for page in range(3)
+    ]
+    properties_response = [
+        {
+            "json": [
+                {"name": property_name, "type": "string", "updatedAt": 1571085954360, "createdAt": 1565059306048}
+                for property_name in fake_properties_list
+            ],
+            "status_code": 200,
+        }
+    ]
+
+    test_stream = Deals(**common_params)
+    test_stream._init_sync = pendulum.parse("2022-02-24T16:43:11Z")
+    test_stream.state = {"updatedAt": "2022-02-24T16:43:11Z"}
+    test_stream.associations_batch_size = 250
+
+    test_stream._sync_mode = SyncMode.incremental
+    requests_mock.register_uri("POST", test_stream.url, responses)
+    test_stream._sync_mode = None
+    requests_mock.register_uri("GET", "/properties/v2/deal/properties", properties_response)
+
+    def associations_response(association):
+        def callback(request, context):
+            inputs = request.json()["inputs"]
+            return {
+                "results": [{"from": {"id": input_["id"]}, "to": [{"toObjectId": f"{association}_{input_['id']}"}]} for input_ in inputs]
+            }
+
+        return callback
+
+    association_requests = {
+        association: requests_mock.register_uri(
+            "POST", f"/crm/v4/associations/deal/{association}/batch/read", json=associations_response(association)
+        )
+        for association in test_stream.associations
+    }
+
+    records, _ = read_incremental(test_stream, {})
+
+    assert len(records) == 300
+    for record in records:
+        for association in test_stream.associations:
+            assert record[association] == [f"{association}_{record['id']}"]
+    for association_request in association_requests.values():
+        # the 3 pages are read in 2 batches of 250 and 50 records
+        assert [len(request.json()["inputs"]) for request in association_request.request_history] == [250, 50]
+
+
 def test_engagements_stream_pagination_works(requests_mock, common_params):
     """
     Tests the engagements stream handles pagination correctly, for both
@@ -709,13 +815,13 @@ def test_pagination_marketing_emails_stream(requests_mock, common_params):
 def test_get_granted_scopes(requests_mock, mocker):
     authenticator = mocker.Mock()
     authenticator.get_access_token.return_value = "the-token"
-    
+
     expected_scopes = ["a", "b", "c"]
     response = [
         {"json": {"scopes": expected_scopes}, "status_code": 200},
     ]
     requests_mock.register_uri("GET", "https://api.hubapi.com/oauth/v1/access-tokens/the-token", response)
-    
+
     actual_scopes = SourceHubspot().get_granted_scopes(authenticator)
 
     assert expected_scopes == actual_scopes
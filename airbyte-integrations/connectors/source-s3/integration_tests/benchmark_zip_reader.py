@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Benchmark reading a zipped CSV with many members the way the CSV parser does: peek at the header line, seek back to the
+start of the member and read every line.
+
+    python integration_tests/benchmark_zip_reader.py --members 16 --member-size-mb 128
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+import zipfile
+from datetime import datetime
+
+from source_s3.v4.zip_reader import (
+    BUFFER_SIZE_DEFAULT,
+    DECOMPRESSED_WINDOW_SIZE_DEFAULT,
+    DecompressedStream,
+    RemoteFileInsideArchive,
+    ZipContentReader,
+)
+
+
+def write_archive(path: str, members: int, member_size: int) -> None:
+    row = b"1234567890,some text value,2023-12-01T00:00:00Z,12.5\n"
+    block = row * (BUFFER_SIZE_DEFAULT // len(row))
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for member in range(members):
+            with archive.open(f"member_{member}.csv", "w", force_zip64=True) as f:
+                f.write(b"id,name,updated_at,amount\n")
+                written = 0
+                while written < member_size:
+                    f.write(block)
+                    written += len(block)
+
+
+def read_archive(path: str, buffer_size: int, window_size: int) -> int:
+    n_lines = 0
+    with open(path, "rb") as f:
+        infos = zipfile.ZipFile(f).infolist()
+    for info in infos:
+        file_info = RemoteFileInsideArchive(
+            uri=f"{path}#{info.filename}",
+            last_modified=datetime(*info.date_time),
+            start_offset=info.header_offset,
+            compressed_size=info.compress_size,
+            uncompressed_size=info.file_size,
+            compression_method=info.compress_type,
+        )
+        with ZipContentReader(DecompressedStream(open(path, "rb"), file_info, buffer_size, window_size), "utf-8", buffer_size) as reader:
+            reader.readline()
+            reader.seek(0)
+            for _ in reader:
+                n_lines += 1
+    return n_lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=16)
+    parser.add_argument("--member-size-mb", type=int, default=128)
+    parser.add_argument("--buffer-size", type=int, default=BUFFER_SIZE_DEFAULT)
+    parser.add_argument("--window-size", type=int, default=DECOMPRESSED_WINDOW_SIZE_DEFAULT)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "benchmark.zip")
+        write_archive(path, args.members, args.member_size_mb * 1024 * 1024)
+        uncompressed_size = sum(info.file_size for info in zipfile.ZipFile(path).infolist())
+
+        start = time.perf_counter()
+        n_lines = read_archive(path, args.buffer_size, args.window_size)
+        elapsed = time.perf_counter() - start
+
+    print(
+        f"Read {n_lines} lines ({uncompressed_size / 1024 / 1024:.0f} MiB uncompressed) from {args.members} members "
+        f"in {elapsed:.2f}s: {uncompressed_size / 1024 / 1024 / elapsed:.1f} MiB/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
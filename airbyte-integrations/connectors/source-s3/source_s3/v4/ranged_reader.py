@@ -0,0 +1,162 @@
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+
+import io
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+
+DEFAULT_PART_SIZE: int = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY: int = 4
+
+
+class RangedPartsReader(io.RawIOBase):
+    """
+    A seekable, read-only stream over an S3 object that downloads it as byte-range parts fetched in parallel.
+
+    Parts are kept in a bounded ring buffer holding at most `max_concurrency` parts: the part currently being read and
+    the parts prefetched after it. The number of prefetched parts starts at zero and grows by one each time the reader
+    moves on to the next part, so sequential readers (CSV, JSONL) quickly get `max_concurrency` parallel connections,
+    while readers jumping around the file (e.g. Parquet, which reads the footer first) only download what they read.
+    """
+
+    def __init__(
+        self,
+        s3_client: BaseClient,
+        bucket: str,
+        key: str,
+        logger: logging.Logger,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """
+        Initialize a RangedPartsReader.
+
+        :param s3_client: The AWS S3 client.
+        :param bucket: The bucket containing the object.
+        :param key: The key of the object.
+        :param logger: Logger used to report the read throughput when the stream is closed.
+        :param part_size: Size in bytes of each ranged request.
+        :param max_concurrency: Maximum number of parts being downloaded or held in memory at once.
+        """
+        if part_size <= 0 or max_concurrency <= 0:
+            raise ValueError("part_size and max_concurrency must be positive.")
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._logger = logger
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self._size: Optional[int] = None
+        self._position = 0
+        self._parts: Dict[int, Future] = {}
+        self._current_part: Optional[int] = None
+        self._readahead = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="s3-ranged-reader")
+        self._metrics_lock = threading.Lock()
+        self._opened_at = time.monotonic()
+        # Read throughput metrics
+        self.bytes_downloaded = 0
+        self.parts_downloaded = 0
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the object. Known after the first part is downloaded; otherwise it is requested from S3.
+        """
+        if self._size is None:
+            self._size = self._s3_client.head_object(Bucket=self._bucket, Key=self._key)["ContentLength"]
+        return self._size
+
+    def _fetch_part(self, index: int) -> bytes:
+        start = index * self.part_size
+        try:
+            response = self._s3_client.get_object(Bucket=self._bucket, Key=self._key, Range=f"bytes={start}-{start + self.part_size - 1}")
+        except ClientError as exc:
+            # S3 answers a range starting at or after the end of the object with 416 InvalidRange
+            if exc.response["Error"]["Code"] == "InvalidRange":
+                if index == 0:
+                    self._size = 0
+                return b""
+            raise
+        data = response["Body"].read()
+        if self._size is None and response.get("ContentRange"):
+            # ContentRange looks like "bytes 0-8388607/21474836480"
+            self._size = int(response["ContentRange"].rsplit("/", 1)[1])
+        with self._metrics_lock:
+            self.bytes_downloaded += len(data)
+            self.parts_downloaded += 1
+        return data
+
+    def _get_part(self, index: int) -> bytes:
+        """
+        Return the content of the part `index`, scheduling the download of the next parts in the ring buffer.
+        """
+        if self._current_part is not None and index == self._current_part + 1:
+            self._readahead = min(self._readahead + 1, self.max_concurrency - 1)
+        elif index != self._current_part:
+            self._readahead = 0
+        self._current_part = index
+
+        last_index = index + self._readahead
+        if self._size is not None:
+            last_index = min(last_index, max(index, (self._size - 1) // self.part_size))
+
+        for part_index in list(self._parts):
+            if part_index < index or part_index > last_index:
+                self._parts.pop(part_index).cancel()
+        for part_index in range(index, last_index + 1):
+            if part_index not in self._parts:
+                self._parts[part_index] = self._executor.submit(self._fetch_part, part_index)
+
+        return self._parts[index].result()
+
+    def readinto(self, buffer: memoryview) -> int:  # type: ignore[override]
+        if self._size is not None and self._position >= self._size:
+            return 0
+        index, offset = divmod(self._position, self.part_size)
+        data = self._get_part(index)[offset : offset + len(buffer)]
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        if not self.closed:
+            for part in self._parts.values():
+                part.cancel()
+            self._parts.clear()
+            self._executor.shutdown(wait=False)
+            elapsed = time.monotonic() - self._opened_at
+            throughput = self.bytes_downloaded / elapsed / (1024 * 1024) if elapsed > 0 else 0.0
+            self._logger.debug(
+                f"Downloaded {self.bytes_downloaded} bytes of {self._key} in {self.parts_downloaded} parts "
+                f"over {elapsed:.2f}s ({throughput:.2f} MiB/s)."
+            )
+        super().close()
@@ -2,10 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import bz2
+import gzip
+import io
 import logging
+import os
 from datetime import datetime
 from io import IOBase
-from typing import Iterable, List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional, Set
 
 import boto3.session
 import pytz
@@ -18,13 +22,44 @@ from botocore.client import BaseClient
 from botocore.client import Config as ClientConfig
 from botocore.exceptions import ClientError
 from source_s3.v4.config import Config
-from source_s3.v4.zip_reader import DecompressedStream, RemoteFileInsideArchive, ZipContentReader, ZipFileHandler
+from source_s3.v4.ranged_reader import DEFAULT_PART_SIZE, RangedPartsReader
+from source_s3.v4.zip_reader import (
+    BUFFER_SIZE_DEFAULT,
+    DECOMPRESSED_WINDOW_SIZE_DEFAULT,
+    DecompressedStream,
+    RemoteFileInsideArchive,
+    ZipContentReader,
+    ZipFileHandler,
+)
+
+# Same extensions as the ones smart_open decompresses transparently
+_DECOMPRESSORS: Dict[str, Callable[[IOBase], IOBase]] = {
+    ".gz": lambda fileobj: gzip.GzipFile(fileobj=fileobj, mode="rb"),
+    ".bz2": lambda fileobj: bz2.BZ2File(fileobj, mode="rb"),
+}
 
 
 class SourceS3StreamReader(AbstractFileBasedStreamReader):
-    def __init__(self):
+    def __init__(
+        self,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = 1,
+        zip_buffer_size: int = BUFFER_SIZE_DEFAULT,
+        zip_window_size: int = DECOMPRESSED_WINDOW_SIZE_DEFAULT,
+    ):
+        """
+        :param part_size: Size in bytes of the byte-range parts used to download files when `max_concurrency` > 1.
+        :param max_concurrency: Number of parts of a single file downloaded in parallel. With 1, files are read
+            sequentially through smart_open.
+        :param zip_buffer_size: Size of the reads from files inside ZIP archives.
+        :param zip_window_size: Number of decompressed bytes kept to serve backward seeks in files inside ZIP archives.
+        """
         super().__init__()
         self._s3_client = None
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.zip_buffer_size = zip_buffer_size
+        self.zip_window_size = zip_window_size
 
     @property
     def config(self) -> Config:
@@ -85,6 +120,9 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         except Exception as exc:
             self._raise_error_listing_files(globs, exc)
 
+    def get_listing_cache_namespace(self) -> str:
+        return f"{self.config.endpoint or 's3'}/{self.config.bucket}"
+
     def _raise_error_listing_files(self, globs: List[str], exc: Optional[Exception] = None):
         """Helper method to raise the ErrorListingFiles exception."""
         raise ErrorListingFiles(
@@ -105,8 +143,10 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         try:
             if isinstance(file, RemoteFileInsideArchive):
                 s3_file_object = smart_open.open(f"s3://{self.config.bucket}/{file.uri.split('#')[0]}", transport_params=params, mode="rb")
-                decompressed_stream = DecompressedStream(s3_file_object, file)
-                result = ZipContentReader(decompressed_stream, encoding)
+                decompressed_stream = DecompressedStream(s3_file_object, file, self.zip_buffer_size, self.zip_window_size)
+                result = ZipContentReader(decompressed_stream, encoding, self.zip_buffer_size)
+            elif self.max_concurrency > 1:
+                result = self._open_ranged_file(file, mode, encoding, logger)
             else:
                 result = smart_open.open(
                     f"s3://{self.config.bucket}/{file.uri}", transport_params=params, mode=mode.value, encoding=encoding
@@ -120,6 +160,21 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         # we can simply return the result here as it is a context manager itself that will release all resources
         return result
 
+    def _open_ranged_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:
+        """
+        Open the file as a stream downloading byte ranges in parallel. The binary stream is seekable so that Parquet can read
+        the footer first; text streams and compressed files are read sequentially.
+        """
+        raw = RangedPartsReader(self.s3_client, self.config.bucket, file.uri, logger, self.part_size, self.max_concurrency)
+        buffered: IOBase = io.BufferedReader(raw, buffer_size=io.DEFAULT_BUFFER_SIZE)
+        # smart_open decompresses files based on their extension, so the ranged reads have to do the same
+        decompressor = _DECOMPRESSORS.get(os.path.splitext(file.uri)[1])
+        if decompressor:
+            buffered = decompressor(buffered)
+        if mode == FileReadMode.READ:
+            return io.TextIOWrapper(buffered, encoding=encoding)
+        return buffered
+
     @staticmethod
     def _is_folder(file) -> bool:
         return file["Key"].endswith("/")
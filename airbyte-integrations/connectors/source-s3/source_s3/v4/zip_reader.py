@@ -1,6 +1,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
 import io
+import re
 import struct
 import zipfile
 from typing import IO, List, Optional, Tuple, Union
@@ -12,6 +13,7 @@ from source_s3.v4.config import Config
 # Buffer constants
 BUFFER_SIZE_DEFAULT = 1024 * 1024
 MAX_BUFFER_SIZE_DEFAULT: int = 16 * BUFFER_SIZE_DEFAULT
+DECOMPRESSED_WINDOW_SIZE_DEFAULT: int = 8 * BUFFER_SIZE_DEFAULT
 
 
 class RemoteFileInsideArchive(RemoteFile):
@@ -143,26 +145,40 @@ class DecompressedStream(io.IOBase):
     """
     A custom stream class that handles decompression of data from a given file object.
     This class supports seeking, reading, and other basic file operations on compressed data.
+
+    The most recently decompressed bytes are kept in a window of `window_size` bytes so that seeking back within the
+    window (e.g. a parser peeking at the headers and seeking back to the start) doesn't decompress the same bytes again.
     """
 
     LOCAL_FILE_HEADER_SIZE: int = 30
     NAME_LENGTH_OFFSET: int = 26
 
-    def __init__(self, file_obj: IO[bytes], file_info: RemoteFileInsideArchive, buffer_size: int = BUFFER_SIZE_DEFAULT):
+    def __init__(
+        self,
+        file_obj: IO[bytes],
+        file_info: RemoteFileInsideArchive,
+        buffer_size: int = BUFFER_SIZE_DEFAULT,
+        window_size: int = DECOMPRESSED_WINDOW_SIZE_DEFAULT,
+    ):
         """
         Initialize a DecompressedStream.
 
         :param file_obj: Underlying file-like object.
         :param file_info: Meta information about the file inside the archive.
         :param buffer_size: Size of the buffer for reading data.
+        :param window_size: Number of already read decompressed bytes kept to serve backward seeks.
         """
         self._file = file_obj
         self.file_start = self._calculate_actual_start(file_info.start_offset)
         self.compressed_size = file_info.compressed_size
         self.uncompressed_size = file_info.uncompressed_size
         self.compression_method = file_info.compression_method
-        self._buffer = bytearray()
         self.buffer_size = buffer_size
+        self.window_size = window_size
+        # Decompressed bytes in [self._decompressed_end - len(self._window), self._decompressed_end)
+        self._window = bytearray()
+        self._decompressed_end = 0
+        self._compressed_position = 0
         self._reset_decompressor()
         self.position = 0  # Current position in uncompressed stream
         self._file.seek(self.file_start)
@@ -202,50 +218,58 @@ class DecompressedStream(io.IOBase):
             return chunk
         return self.decompressor.decompress(chunk)
 
+    @property
+    def _window_start(self) -> int:
+        return self._decompressed_end - len(self._window)
+
+    def _decompress_next_chunk(self) -> bool:
+        """
+        Decompress the next chunk of the underlying file into the window.
+
+        :return: False if the end of the compressed data was reached.
+        """
+        if self._compressed_position >= self.compressed_size:
+            return False
+        chunk = self._file.read(min(self.buffer_size, self.compressed_size - self._compressed_position))
+        if not chunk:
+            return False
+        self._compressed_position += len(chunk)
+        decompressed_data = self._decompress_chunk(chunk)
+        self._window += decompressed_data
+        self._decompressed_end += len(decompressed_data)
+        return True
+
+    def _trim_window(self) -> None:
+        """
+        Drop the bytes that are more than `window_size` bytes behind the current position. Trimming only happens once
+        a whole buffer can be dropped so that the window isn't shifted on every read.
+        """
+        excess = self.position - self._window_start - self.window_size
+        if excess >= self.buffer_size:
+            del self._window[:excess]
+
     def read(self, size: int = -1) -> bytes:
         """
         Read a specified number of bytes from the stream.
         """
         # Size not specified, read till end
-        if size == -1:
+        if size is None or size < 0:
             size = self.uncompressed_size - self.position
 
-        # If buffer already has enough data, return it directly
-        if size <= len(self._buffer):
-            data = self._buffer[:size]
-            self._buffer = self._buffer[size:]
-            self.position += len(data)
-            return data
-
-        data = self._buffer
-        self._buffer = bytearray()
-        while len(data) < size and self._file.tell() - self.file_start < self.compressed_size:
-            max_read_size = min(self.buffer_size, self.compressed_size + self.file_start - self._file.tell())
-            chunk = self._file.read(max_read_size)
-
-            if not chunk:
-                break
-
-            decompressed_data = self._decompress_chunk(chunk)
-
-            # Buffer excessive data for future reads
-            if len(data) + len(decompressed_data) > size:
-                desired_length = size - len(data)
-                data += decompressed_data[:desired_length]
-                self._buffer = decompressed_data[desired_length:]
-            else:
-                data += decompressed_data
+        while self._decompressed_end - self.position < size and self._decompress_next_chunk():
+            pass
 
+        start = self.position - self._window_start
+        data = bytes(self._window[start : start + size])
         self.position += len(data)
+        self._trim_window()
         return data
 
     def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
         """
         Seek to a specific position in the uncompressed stream.
         """
-        if whence == io.SEEK_SET:
-            self._buffer = bytearray()
-        elif whence == io.SEEK_CUR:
+        if whence == io.SEEK_CUR:
             offset = self.position + offset
         elif whence == io.SEEK_END:
             offset = self.uncompressed_size + offset
@@ -253,17 +277,26 @@ class DecompressedStream(io.IOBase):
         # Ensure the offset is within the file's boundaries
         offset = max(0, min(offset, self.uncompressed_size))
 
-        closest_offset = max(k for k in self.offset_map if k <= offset)
-        closest_position = self.offset_map[closest_offset]
+        # The offset was already decompressed and is still in the window
+        if self._window_start <= offset <= self._decompressed_end:
+            self.position = offset
+            return self.position
 
-        self._file.seek(closest_position)
-        self._reset_decompressor()
-        self.position = closest_offset
-
-        # Read till desired offset
+        closest_offset = max(k for k in self.offset_map if k <= offset)
+        if offset < self._window_start or closest_offset > self._decompressed_end:
+            closest_position = self.offset_map[closest_offset]
+            self._file.seek(closest_position)
+            self._reset_decompressor()
+            self._window = bytearray()
+            self._decompressed_end = closest_offset
+            self._compressed_position = closest_position - self.file_start
+
+        # Decompress forward from the end of the window till the desired offset
+        self.position = self._decompressed_end
+        self._trim_window()
         while self.position < offset:
-            read_size = min(self.buffer_size, offset - self.position)
-            self.read(read_size)
+            if not self.read(min(self.buffer_size, offset - self.position)):
+                break
 
         return self.position
 
@@ -298,6 +331,8 @@ class ZipContentReader:
     Supports reading lines, reading chunks, and iterating over the content.
     """
 
+    NEWLINE_PATTERN = re.compile(b"[\r\n]")
+
     def __init__(self, decompressed_stream: DecompressedStream, encoding: Optional[str] = None, buffer_size: int = BUFFER_SIZE_DEFAULT):
         """
         Initialize a ZipContentReader.
@@ -310,6 +345,8 @@ class ZipContentReader:
         self.encoding = encoding
         self.buffer_size = buffer_size
         self.buffer = bytearray()
+        # Position of the first unconsumed byte in the buffer
+        self._offset = 0
         self._closed = False
 
     def __iter__(self):
@@ -327,6 +364,26 @@ class ZipContentReader:
             raise StopIteration
         return line
 
+    def _fill_buffer(self) -> bool:
+        """
+        Append the next chunk of the decompressed stream to the buffer, dropping the bytes that were already consumed.
+
+        :return: False if the decompressed stream is exhausted.
+        """
+        chunk = self.raw.read(self.buffer_size)
+        if not chunk:
+            return False
+        if self._offset:
+            del self.buffer[: self._offset]
+            self._offset = 0
+        self.buffer += chunk
+        return True
+
+    def _consume(self, size: int) -> Union[str, bytes]:
+        data = bytes(self.buffer[self._offset : self._offset + size])
+        self._offset += len(data)
+        return data.decode(self.encoding) if self.encoding else data
+
     def readline(self, limit: int = -1) -> Union[str, bytes]:
         """
         Read a single line from the stream.
@@ -334,43 +391,46 @@ class ZipContentReader:
         if limit != -1:
             raise NotImplementedError("Limits other than -1 not implemented yet")
 
-        line = ""
+        scanned = 0  # Number of unconsumed bytes already known not to contain a newline
         while True:
-            char = self.read(1)
-            if not char:
-                break
-
-            line += char
-            if char in ["\n", "\r"]:
-                # Handling different types of newlines
-                next_char = self.read(1)
-                if char == "\r" and next_char == "\n":
-                    line += next_char
-                else:
-                    self.buffer = next_char.encode(self.encoding) + self.buffer
-                break
-        return line
+            match = self.NEWLINE_PATTERN.search(self.buffer, self._offset + scanned)
+            if match:
+                length = match.end() - self._offset
+                if match.group() == b"\r":
+                    # Handling different types of newlines: "\r" might be followed by "\n" in the next chunk
+                    if match.end() == len(self.buffer):
+                        self._fill_buffer()
+                    if self.buffer[self._offset + length : self._offset + length + 1] == b"\n":
+                        length += 1
+                return self._consume(length)
+
+            scanned = len(self.buffer) - self._offset
+            if not self._fill_buffer():
+                return self._consume(scanned)
 
     def read(self, size: int = -1) -> Union[str, bytes]:
         """
         Read a specified number of bytes/characters from the reader.
         """
-        while len(self.buffer) < size:
-            chunk = self.raw.read(self.buffer_size)
-            if not chunk:
-                break
-            self.buffer += chunk
+        if size is None or size < 0:
+            while self._fill_buffer():
+                pass
+            return self._consume(len(self.buffer) - self._offset)
 
-        data = self.buffer[:size]
-        self.buffer = self.buffer[size:]
+        while len(self.buffer) - self._offset < size:
+            if not self._fill_buffer():
+                break
 
-        return data.decode(self.encoding) if self.encoding else bytes(data)
+        return self._consume(size)
 
     def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
         """
         Seek to a specific position in the decompressed stream.
         """
+        if whence == io.SEEK_CUR:
+            offset, whence = self.tell() + offset, io.SEEK_SET
         self.buffer = bytearray()
+        self._offset = 0
         return self.raw.seek(offset, whence)
 
     def close(self):
@@ -384,7 +444,7 @@ class ZipContentReader:
         """
         Return the current position in the decompressed stream.
         """
-        return self.raw.tell()
+        return self.raw.tell() - (len(self.buffer) - self._offset)
 
     @property
     def closed(self) -> bool:
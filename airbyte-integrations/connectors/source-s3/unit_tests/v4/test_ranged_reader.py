@@ -0,0 +1,143 @@
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+
+import bz2
+import gzip
+import io
+import logging
+import re
+import threading
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from airbyte_cdk.sources.file_based.file_based_stream_reader import FileReadMode
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from botocore.exceptions import ClientError
+from source_s3.v4.config import Config
+from source_s3.v4.ranged_reader import RangedPartsReader
+from source_s3.v4.stream_reader import SourceS3StreamReader
+
+logger = logging.getLogger("airbyte")
+
+
+class FakeS3Client:
+    """
+    Local stand-in for the S3 ranged GET and HEAD requests.
+    """
+
+    def __init__(self, objects: Dict[str, bytes]):
+        self.objects = objects
+        self.ranges: List[str] = []
+        self.head_requests = 0
+        self._lock = threading.Lock()
+
+    def get_object(self, Bucket: str, Key: str, Range: str) -> Dict[str, Any]:
+        with self._lock:
+            self.ranges.append(Range)
+        content = self.objects[Key]
+        start, end = map(int, re.match(r"bytes=(\d+)-(\d+)", Range).groups())
+        if start >= len(content):
+            raise ClientError({"Error": {"Code": "InvalidRange", "Message": "The requested range is not satisfiable"}}, "GetObject")
+        end = min(end, len(content) - 1)
+        return {"Body": io.BytesIO(content[start : end + 1]), "ContentRange": f"bytes {start}-{end}/{len(content)}"}
+
+    def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        self.head_requests += 1
+        return {"ContentLength": len(self.objects[Key])}
+
+
+_CONTENT = bytes(range(256)) * 40
+
+
+@pytest.mark.parametrize("part_size,max_concurrency", [(100, 1), (100, 4), (1000, 3), (len(_CONTENT) * 2, 4)])
+def test_sequential_read_returns_the_whole_object(part_size, max_concurrency):
+    client = FakeS3Client({"key": _CONTENT})
+
+    with RangedPartsReader(client, "bucket", "key", logger, part_size, max_concurrency) as reader:
+        assert reader.read() == _CONTENT
+        assert reader.bytes_downloaded == len(_CONTENT)
+
+    assert len(client.ranges) == -(-len(_CONTENT) // part_size)
+
+
+def test_prefetched_parts_are_bounded_by_max_concurrency():
+    client = FakeS3Client({"key": _CONTENT})
+    reader = RangedPartsReader(client, "bucket", "key", logger, part_size=100, max_concurrency=3)
+
+    while reader.read(50):
+        assert len(reader._parts) <= 3
+
+    reader.close()
+
+
+def test_seek_from_end_reads_the_footer_without_downloading_the_whole_object():
+    client = FakeS3Client({"key": _CONTENT})
+    reader = RangedPartsReader(client, "bucket", "key", logger, part_size=100, max_concurrency=4)
+
+    reader.seek(-10, io.SEEK_END)
+
+    assert reader.read() == _CONTENT[-10:]
+    assert client.head_requests == 1
+    assert client.ranges == [f"bytes={len(_CONTENT) // 100 * 100}-{len(_CONTENT) // 100 * 100 + 99}"]
+
+
+def test_backward_seek_within_current_part_does_not_download_again():
+    client = FakeS3Client({"key": _CONTENT})
+    reader = RangedPartsReader(client, "bucket", "key", logger, part_size=1000, max_concurrency=2)
+
+    assert reader.read(10) == _CONTENT[:10]
+    reader.seek(2)
+
+    assert reader.read(10) == _CONTENT[2:12]
+    assert client.ranges == ["bytes=0-999"]
+
+
+def test_empty_object():
+    client = FakeS3Client({"key": b""})
+
+    with RangedPartsReader(client, "bucket", "key", logger, part_size=100, max_concurrency=4) as reader:
+        assert reader.read() == b""
+
+
+def _reader_with_fake_client(client: FakeS3Client) -> SourceS3StreamReader:
+    reader = SourceS3StreamReader(part_size=64, max_concurrency=4)
+    reader.config = Config(bucket="bucket", aws_access_key_id="test", aws_secret_access_key="test", streams=[])
+    reader._s3_client = client
+    return reader
+
+
+def test_open_file_in_text_mode_reads_lines_sequentially():
+    lines = [f"line {i},value {i}\n" for i in range(100)]
+    reader = _reader_with_fake_client(FakeS3Client({"file.csv": "".join(lines).encode("utf8")}))
+
+    with reader.open_file(RemoteFile(uri="file.csv", last_modified=datetime.now()), FileReadMode.READ, "utf8", logger) as fp:
+        assert list(fp) == lines
+
+
+def test_open_file_in_binary_mode_can_be_read_by_parquet():
+    table = pa.table({"id": list(range(1000)), "name": [f"name {i}" for i in range(1000)]})
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer)
+    reader = _reader_with_fake_client(FakeS3Client({"file.parquet": buffer.getvalue()}))
+
+    with reader.open_file(RemoteFile(uri="file.parquet", last_modified=datetime.now()), FileReadMode.READ_BINARY, None, logger) as fp:
+        assert pq.ParquetFile(fp).read().equals(table)
+
+
+@pytest.mark.parametrize(
+    "uri, compress",
+    [
+        pytest.param("file.csv.gz", gzip.compress, id="test_gzip"),
+        pytest.param("file.csv.bz2", bz2.compress, id="test_bz2"),
+    ],
+)
+def test_open_file_decompresses_files_based_on_their_extension(uri, compress):
+    lines = [f"line {i},value {i}\n" for i in range(1000)]
+    client = FakeS3Client({uri: compress("".join(lines).encode("utf8"))})
+    reader = _reader_with_fake_client(client)
+
+    with reader.open_file(RemoteFile(uri=uri, last_modified=datetime.now()), FileReadMode.READ, "utf8", logger) as fp:
+        assert list(fp) == lines
+    assert len(client.ranges) > 1
@@ -4,6 +4,7 @@ import datetime
 import io
 import struct
 import zipfile
+from typing import Tuple
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -138,3 +139,78 @@ def test_zip_content_reader_iteration():
 
     # Verify the lines extracted match expected values
     assert lines == ["line1\n", "line2\r", "line3\r\n", "line4\n"]
+
+
+def _zip_member(content: bytes, compression: int = zipfile.ZIP_DEFLATED) -> Tuple[io.BytesIO, RemoteFileInsideArchive]:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", compression=compression) as zf:
+        zf.writestr("other.csv", b"a,b\n1,2\n")
+        zf.writestr("data.csv", content)
+    info = zipfile.ZipFile(archive).getinfo("data.csv")
+    file_info = RemoteFileInsideArchive(
+        uri="archive.zip#data.csv",
+        last_modified=datetime.datetime(2022, 12, 28),
+        start_offset=info.header_offset,
+        compressed_size=info.compress_size,
+        uncompressed_size=info.file_size,
+        compression_method=info.compress_type,
+    )
+    return archive, file_info
+
+
+_CSV_CONTENT = b"id,name\n" + "".join(f"{i},néme {i}\r\n" for i in range(5000)).encode()
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_decompressed_stream_reads_the_member(compression):
+    archive, file_info = _zip_member(_CSV_CONTENT, compression)
+    stream = DecompressedStream(archive, file_info, buffer_size=1000)
+
+    assert stream.read() == _CSV_CONTENT
+
+
+def test_decompressed_stream_backward_seek_within_window_does_not_decompress_again():
+    archive, file_info = _zip_member(_CSV_CONTENT)
+    stream = DecompressedStream(archive, file_info, buffer_size=1000, window_size=10_000)
+    first_bytes = stream.read(5000)
+
+    with patch.object(stream, "_decompress_chunk", wraps=stream._decompress_chunk) as decompress_chunk:
+        stream.seek(0)
+        assert stream.read(5000) == first_bytes
+        stream.seek(-100, io.SEEK_CUR)
+        assert stream.read(100) == first_bytes[-100:]
+
+    decompress_chunk.assert_not_called()
+
+
+def test_decompressed_stream_backward_seek_outside_window_decompresses_from_start():
+    archive, file_info = _zip_member(_CSV_CONTENT)
+    stream = DecompressedStream(archive, file_info, buffer_size=1000, window_size=1000)
+    stream.read(len(_CSV_CONTENT) // 2)
+
+    assert stream.seek(10) == 10
+    assert stream.read(20) == _CSV_CONTENT[10:30]
+    assert stream.seek(-20, io.SEEK_END) == len(_CSV_CONTENT) - 20
+    assert stream.read() == _CSV_CONTENT[-20:]
+
+
+def test_zip_content_reader_peek_headers_then_read_lines():
+    archive, file_info = _zip_member(_CSV_CONTENT)
+    reader = ZipContentReader(DecompressedStream(archive, file_info, buffer_size=1000), encoding="utf-8", buffer_size=1000)
+
+    assert reader.readline() == "id,name\n"
+    reader.seek(0)
+    lines = list(reader)
+
+    assert "".join(lines).encode() == _CSV_CONTENT
+    assert lines[1] == "0,néme 0\r\n"
+    assert len(lines) == 5001
+
+
+def test_zip_content_reader_read_all_and_tell():
+    archive, file_info = _zip_member(_CSV_CONTENT)
+    reader = ZipContentReader(DecompressedStream(archive, file_info, buffer_size=1000), buffer_size=1000)
+
+    assert reader.read(8) == b"id,name\n"
+    assert reader.tell() == 8
+    assert reader.read() == _CSV_CONTENT[8:]
@@ -11,12 +11,13 @@ from typing import List
 from airbyte_cdk.entrypoint import AirbyteEntrypoint, launch
 from airbyte_cdk.models import AirbyteErrorTraceMessage, AirbyteMessage, AirbyteTraceMessage, TraceType, Type
 from source_s3.v4 import Config, Cursor, SourceS3, SourceS3StreamReader
+from source_s3.v4.ranged_reader import DEFAULT_MAX_CONCURRENCY
 
 
 def get_source(args: List[str]):
     catalog_path = AirbyteEntrypoint.extract_catalog(args)
     try:
-        return SourceS3(SourceS3StreamReader(), Config, catalog_path, cursor_cls=Cursor)
+        return SourceS3(SourceS3StreamReader(max_concurrency=DEFAULT_MAX_CONCURRENCY), Config, catalog_path, cursor_cls=Cursor)
     except Exception:
         print(
             AirbyteMessage(
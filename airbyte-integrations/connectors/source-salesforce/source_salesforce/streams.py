@@ -10,10 +10,12 @@ import time
 import urllib.parse
 import uuid
 from abc import ABC
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import closing
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
+from itertools import zip_longest
+from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
-import pandas as pd
 import pendulum
 import requests  # type: ignore[import]
 from airbyte_cdk.models import ConfiguredAirbyteCatalog, FailureType, SyncMode
@@ -22,7 +24,6 @@ from airbyte_cdk.sources.streams.core import Stream, StreamData
 from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from airbyte_cdk.utils import AirbyteTracedException
-from numpy import nan
 from pendulum import DateTime  # type: ignore[attr-defined]
 from requests import codes, exceptions
 from requests.models import PreparedRequest
@@ -37,6 +38,31 @@ CSV_FIELD_SIZE_LIMIT = int(ctypes.c_ulong(-1).value // 2)
 csv.field_size_limit(CSV_FIELD_SIZE_LIMIT)
 
 DEFAULT_ENCODING = "utf-8"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# values read as missing, the default NA values of pandas.read_csv used to parse the results before
+CSV_NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
 
 
 class SalesforceStream(HttpStream, ABC):
@@ -329,6 +355,14 @@ class BulkSalesforceStream(SalesforceStream):
     DEFAULT_WAIT_TIMEOUT_SECONDS = 86400  # 24-hour bulk job running time
     MAX_CHECK_INTERVAL_SECONDS = 2.0
     MAX_RETRY_NUMBER = 3
+    # number of bulk jobs of one stream running at the same time: the job of the slice being read and the jobs of the next slices
+    MAX_CONCURRENT_JOBS = 3
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._job_executor: Optional[ThreadPoolExecutor] = None
+        self._upcoming_slices: Deque[Optional[Mapping[str, Any]]] = deque()
+        self._pending_jobs: Dict[str, Future] = {}
 
     def path(self, next_page_token: Mapping[str, Any] = None, **kwargs: Any) -> str:
         return f"/services/data/{self.sf_api.version}/jobs/query"
@@ -457,10 +491,13 @@ class BulkSalesforceStream(SalesforceStream):
         self.logger.warning(f"Not wait the {self.name} data for {self.DEFAULT_WAIT_TIMEOUT_SECONDS} seconds, data: {job_info}!!")
         return job_status
 
-    def execute_job(self, query: str, url: str) -> Tuple[Optional[str], Optional[str]]:
+    def execute_job(self, query: str, url: str, job_id: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Runs the job until it is complete, recreating it if it gets stuck. `job_id` is the id of an already created job to wait for.
+        """
         job_status = "Failed"
         for i in range(0, self.MAX_RETRY_NUMBER):
-            job_id = self.create_stream_job(query=query, url=url)
+            job_id = job_id or self.create_stream_job(query=query, url=url)
             if not job_id:
                 return None, job_status
             job_full_url = f"{url}/{job_id}"
@@ -470,6 +507,7 @@ class BulkSalesforceStream(SalesforceStream):
             self.logger.error(f"Waiting error. Try to run this job again {i + 1}/{self.MAX_RETRY_NUMBER}...")
             self.abort_job(url=job_full_url)
             job_status = "Aborted"
+            job_id = None
 
         if job_status in ["Aborted", "Failed"]:
             self.delete_job(url=job_full_url)
@@ -504,11 +542,11 @@ class BulkSalesforceStream(SalesforceStream):
 
         return self.encoding
 
-    def download_data(self, url: str, chunk_size: int = 1024) -> tuple[str, str, dict]:
+    def download_data(self, url: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> tuple[str, str, dict]:
         """
         Retrieves binary data result from successfully `executed_job`, using chunks, to avoid local memory limitations.
         @ url: string - the url of the `executed_job`
-        @ chunk_size: int - the buffer size for each chunk to fetch from stream, in bytes, default: 1024 bytes
+        @ chunk_size: int - the buffer size for each chunk to fetch from stream, in bytes, default: 1 MiB
         Return the tuple containing string with file path of downloaded binary data (Saved temporarily) and file encoding.
         """
         # set filepath for binary data from response
@@ -526,23 +564,27 @@ class BulkSalesforceStream(SalesforceStream):
         else:
             raise TmpFileIOError(f"The IO/Error occured while verifying binary data. Stream: {self.name}, file {tmp_file} doesn't exist.")
 
-    def read_with_chunks(self, path: str, file_encoding: str, chunk_size: int = 100) -> Iterable[Tuple[int, Mapping[str, Any]]]:
+    def read_with_chunks(self, path: str, file_encoding: str) -> Iterable[Mapping[str, Any]]:
         """
-        Reads the downloaded binary data, using lines chunks, set by `chunk_size`.
+        Reads the downloaded binary data line by line. All values are kept as strings, empty and NA values (see `CSV_NA_VALUES`) are returned as `None`.
         @ path: string - the path to the downloaded temporarily binary data.
         @ file_encoding: string - encoding for binary data file according to Standard Encodings from codecs module
-        @ chunk_size: int - the number of lines to read at a time, default: 100 lines / time.
         """
         try:
-            with open(path, "r", encoding=file_encoding) as data:
-                chunks = pd.read_csv(data, chunksize=chunk_size, iterator=True, dialect="unix", dtype=object)
-                for chunk in chunks:
-                    chunk = chunk.replace({nan: None}).to_dict(orient="records")
-                    for row in chunk:
-                        yield row
-        except pd.errors.EmptyDataError as e:
-            self.logger.info(f"Empty data received. {e}")
-            yield from []
+            with open(path, "r", encoding=file_encoding, newline="") as data:
+                reader = csv.reader(data, dialect="unix")
+                fieldnames = next(reader, None)
+                if not fieldnames:
+                    self.logger.info(f"Empty data received. No columns to parse from file {path}")
+                    return
+                n_fields = len(fieldnames)
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) > n_fields:
+                        # like the CSV parser used before, leading values without a header are treated as the row index
+                        row = row[-n_fields:]
+                    yield {field: None if value in CSV_NA_VALUES else value for field, value in zip_longest(fieldnames, row)}
         except IOError as ioe:
             raise TmpFileIOError(f"The IO/Error occured while reading tmp data. Called: {path}. Stream: {self.name}", ioe)
         finally:
@@ -605,7 +647,7 @@ class BulkSalesforceStream(SalesforceStream):
 
         params = self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
         path = self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-        job_full_url, job_status = self.execute_job(query=params["q"], url=f"{self.url_base}{path}")
+        job_full_url, job_status = self._get_job_result(query=params["q"], url=f"{self.url_base}{path}", stream_state=stream_state)
         if not job_full_url:
             if job_status == "Failed":
                 # As rule as BULK logic returns unhandled error. For instance:
@@ -636,6 +678,70 @@ class BulkSalesforceStream(SalesforceStream):
             salesforce_bulk_api_locator = response_headers.get("Sforce-Locator")
         self.delete_job(url=job_full_url)
 
+    def prefetch_jobs(self, stream_slices: Iterable[Optional[Mapping[str, Any]]]) -> Iterable[Optional[Mapping[str, Any]]]:
+        """
+        Yields the given slices while keeping up to MAX_CONCURRENT_JOBS - 1 next slices aside. When the records of a slice are read,
+        bulk jobs are also started for the next slices, so that Salesforce prepares their results while the current one is
+        downloaded and parsed.
+        """
+        self._job_executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_JOBS, thread_name_prefix=f"{self.name}-bulk-job")
+        try:
+            for stream_slice in stream_slices:
+                self._upcoming_slices.append(stream_slice)
+                if len(self._upcoming_slices) < self.MAX_CONCURRENT_JOBS:
+                    continue
+                yield self._upcoming_slices[0]
+                self._upcoming_slices.popleft()
+            while self._upcoming_slices:
+                yield self._upcoming_slices[0]
+                self._upcoming_slices.popleft()
+        finally:
+            self._upcoming_slices.clear()
+            # the sync was interrupted before the results of these jobs were read
+            for future in self._pending_jobs.values():
+                if not future.cancel():
+                    future.add_done_callback(self._delete_unread_job)
+            self._pending_jobs.clear()
+            self._job_executor.shutdown(wait=False)
+            self._job_executor = None
+
+    def _start_job(self, query: str, url: str) -> Future:
+        """
+        Creates the job right away, so that jobs are created in the order of the slices, and waits for it in a worker thread.
+        """
+        try:
+            job_id = self.create_stream_job(query=query, url=url)
+        except Exception as error:
+            future: Future = Future()
+            future.set_exception(error)
+            return future
+        if not job_id:
+            future = Future()
+            future.set_result((None, "Failed"))
+            return future
+        return self._job_executor.submit(self.execute_job, query, url, job_id)
+
+    def _get_job_result(self, query: str, url: str, stream_state: Mapping[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        if self._job_executor is None:
+            return self.execute_job(query=query, url=url)
+
+        for upcoming_slice in self._upcoming_slices:
+            upcoming_query = self.request_params(stream_state=stream_state, stream_slice=upcoming_slice)["q"]
+            if upcoming_query not in self._pending_jobs:
+                self._pending_jobs[upcoming_query] = self._start_job(upcoming_query, url)
+        future = self._pending_jobs.pop(query, None) or self._start_job(query, url)
+        return future.result()
+
+    def _delete_unread_job(self, future: Future):
+        if future.cancelled() or future.exception():
+            return
+        job_full_url, _ = future.result()
+        if job_full_url:
+            try:
+                self.delete_job(url=job_full_url)
+            except Exception as error:
+                self.logger.warning(f"Unable to delete the unread job {job_full_url}: {error}")
+
     def get_standard_instance(self) -> SalesforceStream:
         """Returns a instance of standard logic(non-BULK) with same settings"""
         stream_kwargs = dict(
@@ -752,6 +858,19 @@ class IncrementalRestSalesforceStream(RestSalesforceStream, ABC):
 class BulkIncrementalSalesforceStream(BulkSalesforceStream, IncrementalRestSalesforceStream):
     state_checkpoint_interval = None
 
+    def stream_slices(
+        self, *, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        stream_slices = super().stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state)
+        if sync_mode == SyncMode.full_refresh:
+            # full refresh streams are read by the concurrent CDK which already reads slices in parallel
+            yield from stream_slices
+            return
+        for stream_slice in self.prefetch_jobs(stream_slices):
+            # slices are generated ahead of the one being read, the state is computed against the slice being read
+            self._slice = stream_slice
+            yield stream_slice
+
     def request_params(
         self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
     ) -> MutableMapping[str, Any]:
@@ -7,6 +7,8 @@ import csv
 import io
 import logging
 import re
+import threading
+import time
 from datetime import datetime
 from typing import List
 from unittest.mock import Mock
@@ -160,9 +162,6 @@ def test_bulk_sync_pagination(stream_config, stream_api, requests_mock):
     assert result_uri.request_history[2].query == "locator=somelocator_2"
 
 
-
-
-
 def _prepare_mock(m, stream):
     job_id = "fake_job_1"
     m.register_uri("POST", stream.path(), json={"id": job_id})
@@ -313,6 +312,22 @@ def test_read_with_chunks_should_return_null_value_when_no_data_is_provided(stre
         assert res == [{"IsDeleted": "false", "Age": None, "Name": "Airbyte"}]
 
 
+def test_read_with_chunks_should_return_null_value_for_na_values(stream_config, stream_api):
+    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+
+    with requests_mock.Mocker() as m:
+        m.register_uri(
+            "GET", job_full_url_results, content=b'"Name","Age","Country","State"\n"NA","null",NULL,"N/A"\n"NAB","nullable","",0\n'
+        )
+        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
+        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        assert res == [
+            {"Name": None, "Age": None, "Country": None, "State": None},
+            {"Name": "NAB", "Age": "nullable", "Country": None, "State": "0"},
+        ]
+
+
 @pytest.mark.parametrize(
     "chunk_size, content_type_header, content, expected_result",
     encoding_symbols_parameters(),
@@ -871,7 +886,6 @@ def test_bulk_stream_error_in_logs_on_create_job(requests_mock, stream_config, s
     ],
 )
 def test_bulk_stream_error_on_wait_for_job(requests_mock, stream_config, stream_api, status_code, response_json, error_message):
-
     stream = generate_stream("Account", stream_config, stream_api)
     url = f"{stream.sf_api.instance_url}/services/data/{stream.sf_api.version}/jobs/query/queryJobId"
     requests_mock.register_uri(
@@ -902,6 +916,7 @@ def test_bulk_stream_slices(stream_config_date_format, stream_api):
         start_date = start_date.add(days=stream.STREAM_SLICE_STEP)
     assert expected_slices == stream_slices
 
+
 @freezegun.freeze_time("2023-04-01")
 def test_bulk_stream_request_params_states(stream_config_date_format, stream_api, bulk_catalog, requests_mock):
     """Check that request params ignore records cursor and use start date from slice ONLY"""
@@ -961,16 +976,66 @@ def test_bulk_stream_request_params_states(stream_config_date_format, stream_api
     assert actual_state_values == expected_state_values
 
 
+@freezegun.freeze_time("2023-04-01")
+def test_bulk_jobs_of_next_slices_are_created_before_reading_the_current_one(stream_config_date_format, stream_api, requests_mock):
+    stream_config_date_format.update({"start_date": "2023-01-01"})
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config_date_format, stream_api)
+    stream.MAX_CONCURRENT_JOBS = 2
+
+    job_ids = ["fake_job_1", "fake_job_2", "fake_job_3"]
+    requests_mock.register_uri("POST", stream.path(), [{"json": {"id": job_id}} for job_id in job_ids])
+    for job_id in job_ids:
+        requests_mock.register_uri("GET", stream.path() + f"/{job_id}", json={"state": "JobComplete"})
+        requests_mock.register_uri("GET", stream.path() + f"/{job_id}/results", text=f"Field1,LastModifiedDate,ID\n{job_id},2023-01-15,1")
+        requests_mock.register_uri("DELETE", stream.path() + f"/{job_id}")
+
+    records = []
+    for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={}):
+        records.extend(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice, stream_state={}))
+        assert stream._slice == stream_slice
+
+    assert [record["Field1"] for record in records] == job_ids
+    requests = [(request.method, request.path.rsplit("/", 1)[-1]) for request in requests_mock.request_history]
+    # the job of the second slice is created before the results of the first one are downloaded
+    second_job_creation = [i for i, request in enumerate(requests) if request == ("POST", "query")][1]
+    assert second_job_creation < requests.index(("GET", "results"))
+
+
+@freezegun.freeze_time("2023-04-01")
+def test_unread_bulk_jobs_are_deleted_when_the_read_is_interrupted(stream_config_date_format, stream_api, requests_mock):
+    stream_config_date_format.update({"start_date": "2023-01-01"})
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config_date_format, stream_api)
+
+    job_ids = ["fake_job_1", "fake_job_2", "fake_job_3"]
+    requests_mock.register_uri("POST", stream.path(), [{"json": {"id": job_id}} for job_id in job_ids])
+    delete_requests = {}
+    for job_id in job_ids:
+        requests_mock.register_uri("GET", stream.path() + f"/{job_id}", json={"state": "JobComplete"})
+        requests_mock.register_uri("GET", stream.path() + f"/{job_id}/results", text="Field1,LastModifiedDate,ID\ntest,2023-01-15,1")
+        delete_requests[job_id] = requests_mock.register_uri("DELETE", stream.path() + f"/{job_id}")
+
+    stream_slices = stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={})
+    list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=next(stream_slices), stream_state={}))
+    stream_slices.close()
+
+    assert stream._pending_jobs == {}
+    # the jobs of the next slices are deleted by the worker threads once they are complete
+    deadline = time.monotonic() + 5
+    while not all(delete_request.called for delete_request in delete_requests.values()) and time.monotonic() < deadline:
+        threading.Event().wait(0.01)
+    assert all(delete_request.called for delete_request in delete_requests.values())
+
+
 def test_request_params_incremental(stream_config_date_format, stream_api):
     stream = generate_stream("ContentDocument", stream_config_date_format, stream_api)
-    params = stream.request_params(stream_state={}, stream_slice={'start_date': '2020', 'end_date': '2021'})
+    params = stream.request_params(stream_state={}, stream_slice={"start_date": "2020", "end_date": "2021"})
 
-    assert params == {'q': 'SELECT LastModifiedDate, Id FROM ContentDocument WHERE LastModifiedDate >= 2020 AND LastModifiedDate < 2021'}
+    assert params == {"q": "SELECT LastModifiedDate, Id FROM ContentDocument WHERE LastModifiedDate >= 2020 AND LastModifiedDate < 2021"}
 
 
 def test_request_params_substream(stream_config_date_format, stream_api):
     stream = generate_stream("ContentDocumentLink", stream_config_date_format, stream_api)
-    params = stream.request_params(stream_state={}, stream_slice={'parents': [{'Id': 1}, {'Id': 2}]})
+    params = stream.request_params(stream_state={}, stream_slice={"parents": [{"Id": 1}, {"Id": 2}]})
 
     assert params == {"q": "SELECT LastModifiedDate, Id FROM ContentDocumentLink WHERE ContentDocumentId IN ('1','2')"}
 
@@ -985,20 +1050,27 @@ def test_stream_slices_for_substream(stream_config, stream_api, requests_mock):
     ContentDocumentLink
     It means that ContentDocumentLink should have 2 slices, with 2 and 1 records in each
     """
-    stream_config['start_date'] = '2023-01-01'
+    stream_config["start_date"] = "2023-01-01"
     stream: BulkSalesforceSubStream = generate_stream("ContentDocumentLink", stream_config, stream_api)
     stream.SLICE_BATCH_SIZE = 2  # each ContentDocumentLink should contain 2 records from parent ContentDocument stream
 
     job_id = "fake_job"
     requests_mock.register_uri("POST", stream.path(), json={"id": job_id})
     requests_mock.register_uri("GET", stream.path() + f"/{job_id}", json={"state": "JobComplete"})
-    requests_mock.register_uri("GET", stream.path() + f"/{job_id}/results", [{"text": "Field1,LastModifiedDate,ID\ntest,2021-11-16,123", "headers": {"Sforce-Locator": "null"}}])
+    requests_mock.register_uri(
+        "GET",
+        stream.path() + f"/{job_id}/results",
+        [{"text": "Field1,LastModifiedDate,ID\ntest,2021-11-16,123", "headers": {"Sforce-Locator": "null"}}],
+    )
     requests_mock.register_uri("DELETE", stream.path() + f"/{job_id}")
 
     stream_slices = list(stream.stream_slices(sync_mode=SyncMode.full_refresh))
     assert stream_slices == [
-         {'parents': [{'Field1': 'test', 'ID': '123', 'LastModifiedDate': '2021-11-16'},
-                      {'Field1': 'test', 'ID': '123', 'LastModifiedDate': '2021-11-16'}]},
-         {'parents': [{'Field1': 'test', 'ID': '123', 'LastModifiedDate': '2021-11-16'}]}
+        {
+            "parents": [
+                {"Field1": "test", "ID": "123", "LastModifiedDate": "2021-11-16"},
+                {"Field1": "test", "ID": "123", "LastModifiedDate": "2021-11-16"},
+            ]
+        },
+        {"parents": [{"Field1": "test", "ID": "123", "LastModifiedDate": "2021-11-16"}]},
     ]
-
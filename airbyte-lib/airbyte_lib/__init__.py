@@ -1,10 +1,11 @@
 
-from .factories import (get_connector, get_in_memory_cache)
+from .factories import (get_connector, get_duckdb_cache, get_in_memory_cache)
 from .sync_result import (Dataset, SyncResult)
 from .source import (Source)
 
 __all__ = [
     "get_connector",
+    "get_duckdb_cache",
     "get_in_memory_cache",
     "Dataset",
     "SyncResult",
@@ -1,17 +1,76 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
 
+import json
+import os
+import re
+import tempfile
+import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, List
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from airbyte_protocol.models import AirbyteRecordMessage
+import duckdb
+from airbyte_protocol.models import (
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+)
+
+
+def _primary_key(configured_stream: ConfiguredAirbyteStream) -> Optional[List[List[str]]]:
+    """
+    Get the primary key to deduplicate the records of a stream by, if any.
+    """
+    if configured_stream.destination_sync_mode != DestinationSyncMode.append_dedup:
+        return None
+    return configured_stream.primary_key or configured_stream.stream.source_defined_primary_key or None
+
+
+def _primary_key_value(primary_key: List[List[str]], record: Dict[str, Any]) -> Tuple[str, ...]:
+    values = []
+    for path in primary_key:
+        value: Any = record
+        for field in path:
+            value = value.get(field) if isinstance(value, dict) else None
+        values.append(json.dumps(value, sort_keys=True))
+    return tuple(values)
 
 
 class Cache(ABC):
+    def register_catalog(self, catalog: ConfiguredAirbyteCatalog) -> None:
+        """
+        Called with the catalog of a sync before its records are written, so that the cache can prepare the storage of each stream.
+        """
+        pass
+
     @abstractmethod
     def write(self, messages: Iterable[AirbyteRecordMessage]):
         pass
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Wrap the writes of a sync, so that its records and its state are stored together or not at all if the sync fails.
+        Caches that can't roll back writes store them right away.
+        """
+        yield
+
+    def get_state(self) -> List[AirbyteStateMessage]:
+        """
+        Get the state of the incremental syncs written to the cache, to continue them from.
+        """
+        raise NotImplementedError()
+
+    def write_state(self, state: List[AirbyteStateMessage]) -> None:
+        """
+        Store the state of the streams after a sync, replacing the state stored before.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def get_iterable(self, stream: str) -> Iterable[Dict[str, Any]]:
         pass
@@ -30,16 +89,56 @@ class Cache(ABC):
 
 
 class InMemoryCache(Cache):
-    """The in-memory cache is accepting airbyte messages and stores them in a dictionary for streams (one list of dicts per stream)."""
+    """
+    The in-memory cache is accepting airbyte messages and stores them in a dictionary for streams (one list of dicts per stream).
+
+    The records of the streams synced in full refresh mode are replaced when the sync starts. Records of streams synced incrementally with a
+    primary key replace the record with the same primary key, if any.
+    """
 
     def __init__(self) -> None:
         self.streams: Dict[str, List[Dict[str, Any]]] = {}
+        self.state: List[AirbyteStateMessage] = []
+        self._primary_keys: Dict[str, List[List[str]]] = {}
+        # positions of the records of the streams with a primary key, by primary key value
+        self._positions: Dict[str, Dict[Tuple[str, ...], int]] = {}
+
+    def register_catalog(self, catalog: ConfiguredAirbyteCatalog) -> None:
+        for configured_stream in catalog.streams:
+            name = configured_stream.stream.name
+            if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
+                self.streams[name] = []
+            primary_key = _primary_key(configured_stream)
+            if primary_key is None:
+                self._primary_keys.pop(name, None)
+                self._positions.pop(name, None)
+                continue
+            self._primary_keys[name] = primary_key
+            self._positions[name] = {
+                _primary_key_value(primary_key, record): position for position, record in enumerate(self.streams.get(name, []))
+            }
 
     def write(self, messages: Iterable[AirbyteRecordMessage]) -> None:
         for message in messages:
             if message.stream not in self.streams:
                 self.streams[message.stream] = []
-            self.streams[message.stream].append(message.data)
+            records = self.streams[message.stream]
+            positions = self._positions.get(message.stream)
+            if positions is None:
+                records.append(message.data)
+                continue
+            key = _primary_key_value(self._primary_keys[message.stream], message.data)
+            if key in positions:
+                records[positions[key]] = message.data
+            else:
+                positions[key] = len(records)
+                records.append(message.data)
+
+    def get_state(self) -> List[AirbyteStateMessage]:
+        return list(self.state)
+
+    def write_state(self, state: List[AirbyteStateMessage]) -> None:
+        self.state = list(state)
 
     def get_iterable(self, stream: str) -> Iterable[Dict[str, Any]]:
         return iter(self.streams[stream])
@@ -52,3 +151,259 @@ class InMemoryCache(Cache):
 
     def get_sql_engine(self) -> Any:
         raise NotImplementedError()
+
+
+DEFAULT_DUCKDB_PATH = ".cache/airbyte_lib.duckdb"
+
+# records of a stream staged on disk before they are loaded into its table
+DUCKDB_BATCH_SIZE = 100_000
+
+# rows fetched at once when iterating over a stream
+DUCKDB_FETCH_SIZE = 10_000
+
+# column of the tables of streams without declared properties, holding the whole record
+RAW_DATA_COLUMN = "_airbyte_data"
+
+# table holding the state of the streams, one state message per row
+STATE_TABLE = "_airbyte_state"
+
+_JSON_SCHEMA_TYPES_TO_DUCKDB = {
+    "string": "VARCHAR",
+    "integer": "BIGINT",
+    "number": "DOUBLE",
+    "boolean": "BOOLEAN",
+}
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _column_type(property_schema: Dict[str, Any]) -> str:
+    """
+    Map the JSON schema of a property to a DuckDB column type. Objects, arrays and properties with several types are stored as JSON.
+    """
+    types = property_schema.get("type", [])
+    if isinstance(types, str):
+        types = [types]
+    types = [t for t in types if t != "null"]
+    if len(types) == 1 and types[0] in _JSON_SCHEMA_TYPES_TO_DUCKDB:
+        return _JSON_SCHEMA_TYPES_TO_DUCKDB[types[0]]
+    return "JSON"
+
+
+def _key_expressions(columns: Dict[str, str], primary_key: List[List[str]], alias: str) -> List[str]:
+    """
+    Get the SQL expressions of the fields of a primary key in a table with the given columns. Fields that aren't stored are skipped.
+    """
+    expressions = []
+    for path in primary_key:
+        if list(columns) == [RAW_DATA_COLUMN]:
+            column, json_path = RAW_DATA_COLUMN, path
+        elif path and path[0] in columns:
+            column, json_path = path[0], path[1:]
+        else:
+            continue
+        expression = f"{alias}.{_quote_identifier(column)}"
+        if json_path:
+            expression = f"json_extract_string({expression}, {_quote_literal('$.' + '.'.join(json_path))})"
+        expressions.append(expression)
+    return expressions
+
+
+class DuckDBCache(Cache):
+    """
+    The DuckDB cache stores the records of each stream in a table of a DuckDB database file, so that the data of a sync doesn't have to fit into memory
+    and is still available in later Python sessions.
+
+    The columns of a table are derived from the properties declared in the JSON schema of its stream: strings, integers, numbers and booleans get
+    columns of the matching type, everything else is stored as JSON. Properties that aren't declared are not stored, and values that can't be
+    cast to the type of their column are stored as NULL. Streams without declared properties store each record in a single JSON column.
+
+    Records are staged in a JSON lines file per stream and loaded into the tables in batches. The tables of the streams synced in full refresh
+    mode are replaced when the sync starts. Records of streams synced incrementally are added to their table, replacing the records with the
+    same primary key if the stream has one. A sync runs in a single transaction, so a failed sync leaves the tables and the state as they were.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DUCKDB_PATH, batch_size: int = DUCKDB_BATCH_SIZE) -> None:
+        if db_path != ":memory:" and os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._connection = duckdb.connect(db_path)
+        self._staging_dir = tempfile.TemporaryDirectory()
+        self._staged_files: Dict[str, IO[str]] = {}
+        self._staged_records: Dict[str, int] = {}
+        self._primary_keys: Dict[str, List[List[str]]] = {}
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        self._connection.begin()
+        try:
+            yield
+        except BaseException:
+            self._connection.rollback()
+            raise
+        self._connection.commit()
+
+    @staticmethod
+    def table_name(stream: str) -> str:
+        return re.sub(r"[^a-zA-Z0-9_]", "_", stream)
+
+    def _table_exists(self, stream: str) -> bool:
+        row = self._connection.execute(
+            "SELECT count(*) FROM information_schema.tables WHERE table_name = ?", [self.table_name(stream)]
+        ).fetchone()
+        return row is not None and bool(row[0])
+
+    def _columns(self, stream: str) -> Dict[str, str]:
+        rows = self._connection.execute(
+            "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = ? ORDER BY ordinal_position",
+            [self.table_name(stream)],
+        ).fetchall()
+        return {name: data_type for name, data_type in rows}
+
+    def _create_table(self, stream: str, json_schema: Optional[Dict[str, Any]] = None, replace: bool = False) -> None:
+        properties = (json_schema or {}).get("properties") or {}
+        columns = {name: _column_type(schema) for name, schema in properties.items()} or {RAW_DATA_COLUMN: "JSON"}
+        column_definitions = ", ".join(f"{_quote_identifier(name)} {column_type}" for name, column_type in columns.items())
+        create = "CREATE OR REPLACE TABLE" if replace else "CREATE TABLE IF NOT EXISTS"
+        self._connection.execute(f"{create} {_quote_identifier(self.table_name(stream))} ({column_definitions})")
+
+    def register_catalog(self, catalog: ConfiguredAirbyteCatalog) -> None:
+        for configured_stream in catalog.streams:
+            name = configured_stream.stream.name
+            incremental = configured_stream.sync_mode == SyncMode.incremental
+            self._create_table(name, configured_stream.stream.json_schema, replace=not incremental)
+            primary_key = _primary_key(configured_stream)
+            if primary_key is None:
+                self._primary_keys.pop(name, None)
+            else:
+                self._primary_keys[name] = primary_key
+
+    def write(self, messages: Iterable[AirbyteRecordMessage]) -> None:
+        try:
+            for message in messages:
+                staged_file = self._staged_files.get(message.stream)
+                if staged_file is None:
+                    path = os.path.join(self._staging_dir.name, f"{len(self._staged_files)}.jsonl")
+                    staged_file = self._staged_files[message.stream] = open(path, "w+", encoding="utf-8")
+                    self._staged_records[message.stream] = 0
+                staged_file.write(json.dumps(message.data))
+                staged_file.write("\n")
+                self._staged_records[message.stream] += 1
+                if self._staged_records[message.stream] >= self.batch_size:
+                    self._load(message.stream)
+            for stream in self._staged_files:
+                self._load(stream)
+        finally:
+            for staged_file in self._staged_files.values():
+                staged_file.close()
+            self._staged_files.clear()
+            self._staged_records.clear()
+
+    def _load(self, stream: str) -> None:
+        """
+        Load the records staged for a stream into its table with a single INSERT ... SELECT and empty the staging file.
+
+        For streams with a primary key, the last staged record of each primary key value replaces the record with this value in the table.
+        """
+        staged_file = self._staged_files[stream]
+        if not self._staged_records[stream]:
+            return
+        staged_file.flush()
+
+        if not self._table_exists(stream):
+            self._create_table(stream)
+        columns = self._columns(stream)
+        table = _quote_identifier(self.table_name(stream))
+        if list(columns) == [RAW_DATA_COLUMN]:
+            staged = f"SELECT json AS {_quote_identifier(RAW_DATA_COLUMN)} FROM read_ndjson_objects(?)"
+        else:
+            column_types = ", ".join(f"{_quote_literal(name)}: {_quote_literal(column_type)}" for name, column_type in columns.items())
+            staged = f"SELECT * FROM read_json(?, format='newline_delimited', ignore_errors=true, columns={{{column_types}}})"
+
+        # the name of the temporary table can't be the one of a stream table, which it would shadow
+        staged_table = _quote_identifier(f"_airbyte_staged_{uuid.uuid4().hex}")
+        keys = _key_expressions(columns, self._primary_keys.get(stream, []), staged_table)
+        if not keys:
+            self._connection.execute(f"INSERT INTO {table} {staged}", [staged_file.name])
+        else:
+            self._connection.execute(
+                f"CREATE TEMP TABLE {staged_table} AS SELECT * EXCLUDE (_airbyte_position) FROM "
+                f"(SELECT *, row_number() OVER () AS _airbyte_position FROM ({staged})) AS {staged_table} "
+                f"QUALIFY row_number() OVER (PARTITION BY {', '.join(keys)} ORDER BY _airbyte_position DESC) = 1",
+                [staged_file.name],
+            )
+            matching_keys = " AND ".join(
+                f"{key} IS NOT DISTINCT FROM {table_key}"
+                for key, table_key in zip(keys, _key_expressions(columns, self._primary_keys[stream], table))
+            )
+            self._connection.execute(f"DELETE FROM {table} WHERE EXISTS (SELECT 1 FROM {staged_table} WHERE {matching_keys})")
+            self._connection.execute(f"INSERT INTO {table} SELECT * FROM {staged_table}")
+            self._connection.execute(f"DROP TABLE {staged_table}")
+
+        staged_file.seek(0)
+        staged_file.truncate()
+        self._staged_records[stream] = 0
+
+    def get_state(self) -> List[AirbyteStateMessage]:
+        if not self._table_exists(STATE_TABLE):
+            return []
+        rows = self._connection.execute(f"SELECT state FROM {_quote_identifier(STATE_TABLE)} ORDER BY position").fetchall()
+        return [AirbyteStateMessage.parse_raw(state) for state, in rows]
+
+    def write_state(self, state: List[AirbyteStateMessage]) -> None:
+        table = _quote_identifier(STATE_TABLE)
+        self._connection.execute(f"CREATE OR REPLACE TABLE {table} (position INTEGER, state JSON)")
+        if state:
+            self._connection.executemany(
+                f"INSERT INTO {table} VALUES (?, ?)",
+                [[position, message.json(exclude_unset=True, by_alias=True)] for position, message in enumerate(state)],
+            )
+
+    def get_iterable(self, stream: str) -> Iterable[Dict[str, Any]]:
+        """
+        Iterate over the records of a stream, fetching them from the database in batches.
+        """
+        columns = self._columns(stream)
+        json_columns = [name for name, data_type in columns.items() if data_type == "JSON"]
+        # use a separate cursor so that other queries can run while iterating
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(f"SELECT * FROM {_quote_identifier(self.table_name(stream))}")
+            while True:
+                rows = cursor.fetchmany(DUCKDB_FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    record = dict(zip(columns, row))
+                    for name in json_columns:
+                        if record[name] is not None:
+                            record[name] = json.loads(record[name])
+                    yield record[RAW_DATA_COLUMN] if list(columns) == [RAW_DATA_COLUMN] else record
+        finally:
+            cursor.close()
+
+    def get_pandas(self, stream: str) -> Any:
+        return self._connection.table(self.table_name(stream)).df()
+
+    def get_sql_table(self, stream: str) -> Any:
+        """
+        Return the table of a stream as a DuckDB relation, which can be filtered, aggregated and joined without loading it into memory.
+        """
+        return self._connection.table(self.table_name(stream))
+
+    def get_sql_engine(self) -> Any:
+        """
+        Return the DuckDB connection of the cache to run SQL queries against the tables of the streams.
+        """
+        return self._connection
+
+    def close(self) -> None:
+        self._connection.close()
+        self._staging_dir.cleanup()
@@ -6,11 +6,13 @@ import sys
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from pathlib import Path
-from typing import IO, Generator, Iterable, List
+from typing import IO, Generator, Iterable, List, Set
 
 from airbyte_lib.registry import ConnectorMetadata
 
 _LATEST_VERSION = "latest"
+# time given to a connector process to exit after being terminated before it is killed
+_TERMINATE_TIMEOUT_SECONDS = 10
 
 
 class Executor(ABC):
@@ -25,11 +27,28 @@ class Executor(ABC):
             self.target_version = metadata.latest_available_version
         else:
             self.target_version = target_version
+        # connector processes started by execute that are still running
+        self._processes: Set[subprocess.Popen] = set()
 
     @abstractmethod
     def execute(self, args: List[str]) -> Iterable[str]:
         pass
 
+    def stop_processes(self) -> None:
+        """
+        Terminate the running connector processes started by execute, killing the ones that don't exit in time. The threads reading
+        their output then get the end of it instead of waiting for output that may never come.
+        """
+        processes = list(self._processes)
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=_TERMINATE_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
     @abstractmethod
     def ensure_installation(self):
         pass
@@ -38,15 +57,22 @@ class Executor(ABC):
     def install(self):
         pass
 
+    def get_installed_version(self) -> str | None:
+        """
+        The version of the installed connector, or None if it can't be determined.
+        """
+        return None
+
 
 @contextmanager
-def _stream_from_subprocess(args: List[str]) -> Generator[Iterable[str], None, None]:
+def _stream_from_subprocess(args: List[str], processes: Set[subprocess.Popen]) -> Generator[Iterable[str], None, None]:
     process = subprocess.Popen(
         args,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         universal_newlines=True,
     )
+    processes.add(process)
 
     def _stream_from_file(file: IO[str]):
         while True:
@@ -56,10 +82,12 @@ def _stream_from_subprocess(args: List[str]) -> Generator[Iterable[str], None, N
             yield line
 
     if process.stdout is None:
+        processes.discard(process)
         raise Exception("Failed to start subprocess")
     try:
         yield _stream_from_file(process.stdout)
     finally:
+        processes.discard(process)
         # Close the stdout stream
         if process.stdout:
             process.stdout.close()
@@ -92,6 +120,8 @@ class VenvExecutor(Executor):
     ) -> None:
         super().__init__(metadata, target_version)
         self.install_if_missing = install_if_missing
+        self._installed_version: str | None = None
+        self._installation_verified = False
 
         # This is a temporary install path that will be replaced with a proper package
         # name once they are published.
@@ -116,6 +146,8 @@ class VenvExecutor(Executor):
         pip_path = os.path.join(venv_name, "bin", "pip")
 
         self._run_subprocess_and_raise_on_failure([pip_path, "install", "-e", self.pip_url])
+        self._installed_version = None
+        self._installation_verified = False
 
     def _get_installed_version(self):
         """
@@ -132,6 +164,12 @@ class VenvExecutor(Executor):
             universal_newlines=True,
         ).strip()
 
+    def get_installed_version(self) -> str | None:
+        self.ensure_installation()
+        if self._installed_version is None:
+            self._installed_version = self._get_installed_version()
+        return self._installed_version
+
     def ensure_installation(
         self,
     ):
@@ -143,7 +181,12 @@ class VenvExecutor(Executor):
 
         Note: Version verification is not supported for connectors installed from a
         local path.
+
+        The installation is only verified once, as checking the installed version runs a subprocess.
         """
+        if self._installation_verified:
+            return
+
         venv_name = f".venv-{self.metadata.name}"
         venv_path = Path(venv_name)
         if not venv_path.exists():
@@ -170,10 +213,12 @@ class VenvExecutor(Executor):
                         f"Failed to install connector {self.metadata.name} version {self.target_version}. Installed version is {version_after_install}"
                     )
 
+        self._installation_verified = True
+
     def execute(self, args: List[str]) -> Iterable[str]:
         connector_path = self._get_connector_path()
 
-        with _stream_from_subprocess([str(connector_path)] + args) as stream:
+        with _stream_from_subprocess([str(connector_path)] + args, self._processes) as stream:
             yield from stream
 
 
@@ -188,5 +233,5 @@ class PathExecutor(Executor):
         raise Exception(f"Connector {self.metadata.name} is not available - cannot install it")
 
     def execute(self, args: List[str]) -> Iterable[str]:
-        with _stream_from_subprocess([self.metadata.name] + args) as stream:
+        with _stream_from_subprocess([self.metadata.name] + args, self._processes) as stream:
             yield from stream
@@ -1,18 +1,27 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
 
+from datetime import timedelta
 from typing import Any
 
-from airbyte_lib.cache import InMemoryCache
+from airbyte_lib.cache import DEFAULT_DUCKDB_PATH, DuckDBCache, InMemoryCache
 from airbyte_lib.executor import Executor, PathExecutor, VenvExecutor
 from airbyte_lib.registry import get_connector_metadata
-from airbyte_lib.source import Source
+from airbyte_lib.source import DEFAULT_DISCOVER_CACHE_TTL, Source
 
 
 def get_in_memory_cache():
     return InMemoryCache()
 
 
+def get_duckdb_cache(db_path: str = DEFAULT_DUCKDB_PATH):
+    """
+    Get a cache storing the synced records in a DuckDB database file, which keeps them out of memory and across Python sessions.
+    :param db_path: path of the database file - reusing the same path gives access to the records of previous syncs.
+    """
+    return DuckDBCache(db_path)
+
+
 def get_connector(
     name: str,
     version: str | None = None,
@@ -20,6 +29,8 @@ def get_connector(
     config: dict[str, Any] | None = None,
     use_local_install: bool = False,
     install_if_missing: bool = False,
+    discover_cache_dir: str | None = None,
+    discover_cache_ttl: timedelta = DEFAULT_DISCOVER_CACHE_TTL,
 ):
     """
     Get a connector by name and version.
@@ -29,6 +40,8 @@ def get_connector(
     :param config: connector config - if not provided, you need to set it later via the set_config method.
     :param use_local_install: whether to use a virtual environment to run the connector. If True, the connector is expected to be available on the path (e.g. installed via pip). If False, the connector will be installed automatically in a virtual environment.
     :param install_if_missing: whether to install the connector if it is not available locally. This parameter is ignored if use_local_install is True.
+    :param discover_cache_dir: directory to store the spec and catalogs of the connector in, so that they are reused across Python sessions. They are stored per connector version and per hash of the config. This parameter is ignored if use_local_install is True, as the installed version isn't known then.
+    :param discover_cache_ttl: time after which the catalogs stored in discover_cache_dir are discovered again, as they can change with the data of the account. Call refresh_catalog on the source to discover the catalog again right away.
     """
     metadata = get_connector_metadata(name)
     if use_local_install:
@@ -52,4 +65,6 @@ def get_connector(
         executor=executor,
         name=name,
         config=config,
+        discover_cache_dir=discover_cache_dir,
+        discover_cache_ttl=discover_cache_ttl,
     )
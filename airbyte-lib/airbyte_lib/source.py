@@ -1,10 +1,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
+import hashlib
 import json
+import logging
+import os
+import queue
 import tempfile
-from contextlib import contextmanager
-from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional
+import threading
+import time
+from contextlib import closing, contextmanager
+from datetime import timedelta
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar, Union
 
 import jsonschema
 from airbyte_lib.cache import Cache, InMemoryCache
@@ -14,6 +20,9 @@ from airbyte_protocol.models import (
     AirbyteCatalog,
     AirbyteMessage,
     AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStream,
     ConfiguredAirbyteCatalog,
     ConfiguredAirbyteStream,
     ConnectorSpecification,
@@ -22,6 +31,93 @@ from airbyte_protocol.models import (
     SyncMode,
     Type,
 )
+from pydantic import BaseModel
+
+logger = logging.getLogger("airbyte_lib")
+
+_Model = TypeVar("_Model", bound=BaseModel)
+
+# Catalogs stored in the discover cache directory are discovered again after this time, as they can change with the data of the account
+DEFAULT_DISCOVER_CACHE_TTL = timedelta(days=1)
+
+# Records read in parallel waiting to be written to the cache
+_PARALLEL_READ_QUEUE_SIZE = 10_000
+# Marks the end of the records of a parallel read
+_READ_DONE = object()
+
+
+_UNVALIDATED_RECORD_FIELDS = {"namespace", "stream", "data", "emitted_at"}
+
+
+def _is_simple_record(record: Any) -> bool:
+    """
+    Check that a record only has fields with the types expected by AirbyteRecordMessage, so that it doesn't need to be validated.
+    """
+    return (
+        isinstance(record, dict)
+        and record.keys() <= _UNVALIDATED_RECORD_FIELDS
+        and isinstance(record.get("stream"), str)
+        and isinstance(record.get("data"), dict)
+        and isinstance(record.get("emitted_at"), (int, float))
+        and not isinstance(record["emitted_at"], bool)
+        and isinstance(record.get("namespace", ""), str)
+    )
+
+
+def _parse_message(line: str) -> AirbyteMessage:
+    """
+    Parse a line of the connector output. Records are the bulk of the output, so the ones with the expected fields are built without
+    validation; all other messages are validated.
+    """
+    message = json.loads(line)
+    if isinstance(message, dict) and message.get("type") == Type.RECORD.value and _is_simple_record(message.get("record")):
+        record = message["record"]
+        return AirbyteMessage.construct(
+            type=Type.RECORD, record=AirbyteRecordMessage.construct(**{**record, "emitted_at": int(record["emitted_at"])})
+        )
+    return AirbyteMessage.parse_obj(message)
+
+
+def _merge_states(states: List[AirbyteStateMessage]) -> List[AirbyteStateMessage]:
+    """
+    Merge state messages into the state to start the next sync from: the last state of each stream, the last global state, and the
+    legacy states of all streams.
+    """
+    stream_states: Dict[Tuple[str, Optional[str]], AirbyteStateMessage] = {}
+    global_state: Optional[AirbyteStateMessage] = None
+    legacy_state: Dict[str, Any] = {}
+    for state in states:
+        if state.type == AirbyteStateType.STREAM and state.stream:
+            stream_states[(state.stream.stream_descriptor.name, state.stream.stream_descriptor.namespace)] = state
+        elif state.type == AirbyteStateType.GLOBAL:
+            global_state = state
+        elif state.data:
+            legacy_state.update(state.data)
+    merged = list(stream_states.values()) + ([global_state] if global_state else [])
+    if not merged and legacy_state:
+        merged.append(AirbyteStateMessage(type=AirbyteStateType.LEGACY, data=legacy_state))
+    return merged
+
+
+def _filter_states(states: List[AirbyteStateMessage], streams: Set[str]) -> List[AirbyteStateMessage]:
+    """
+    Keep the states of the given streams, so that the states emitted by parallel reads don't overwrite each other when they are merged.
+    Global states are kept as they are.
+    """
+    filtered = []
+    for state in states:
+        if state.type == AirbyteStateType.STREAM:
+            if state.stream and state.stream.stream_descriptor.name in streams:
+                filtered.append(state)
+        elif state.type == AirbyteStateType.GLOBAL:
+            filtered.append(state)
+        elif state.data:
+            filtered.append(
+                AirbyteStateMessage(
+                    type=AirbyteStateType.LEGACY, data={name: value for name, value in state.data.items() if name in streams}
+                )
+            )
+    return filtered
 
 
 @contextmanager
@@ -43,7 +139,14 @@ def as_temp_files(files: List[Any]):
 
 
 class Source:
-    """This class is representing a source that can be called"""
+    """
+    This class is representing a source that can be called
+
+    The spec and the catalogs returned by the connector are kept for the lifetime of the source, so that the connector is only run once
+    for them. If discover_cache_dir is set, they are also stored in this directory for the installed version of the connector, and reused
+    by other sources and Python sessions. Stored catalogs older than discover_cache_ttl are discovered again, call refresh_catalog to
+    discover the catalog again right away.
+    """
 
     def __init__(
         self,
@@ -51,12 +154,20 @@ class Source:
         name: str,
         config: Optional[Dict[str, Any]] = None,
         streams: Optional[List[str]] = None,
+        discover_cache_dir: Optional[str] = None,
+        discover_cache_ttl: timedelta = DEFAULT_DISCOVER_CACHE_TTL,
     ):
         self.executor = executor
         self.name = name
         self.streams: Optional[List[str]] = None
+        self.discover_cache_dir = discover_cache_dir
+        self.discover_cache_ttl = discover_cache_ttl
         self._config_dict: Optional[Dict[str, Any]] = None
-        self._last_log_messages: List[str] = []
+        # the last log messages of the connector run by each thread, as parallel reads run a connector per thread
+        self._log_buffers = threading.local()
+        self._spec_result: Optional[ConnectorSpecification] = None
+        # discovered catalogs by hash of the config
+        self._catalogs: Dict[str, AirbyteCatalog] = {}
         if config is not None:
             self.set_config(config)
         if streams is not None:
@@ -80,6 +191,29 @@ class Source:
         return self._config_dict
 
     def _discover(self) -> AirbyteCatalog:
+        """
+        Get the catalog of the connector for the current config, from the catalogs discovered so far or by calling discover.
+        """
+        config_hash = self._config_hash()
+        if config_hash not in self._catalogs:
+            self._catalogs[config_hash] = self._get_from_discover_cache(
+                f"catalog-{config_hash}", AirbyteCatalog, self._run_discover, max_age=self.discover_cache_ttl
+            )
+        return self._catalogs[config_hash]
+
+    def refresh_catalog(self) -> None:
+        """
+        Discover the catalog of the connector for the current config again, bypassing the catalogs discovered so far and the discover cache.
+        """
+        config_hash = self._config_hash()
+        self._catalogs[config_hash] = self._get_from_discover_cache(
+            f"catalog-{config_hash}", AirbyteCatalog, self._run_discover, refresh=True
+        )
+
+    def _config_hash(self) -> str:
+        return hashlib.sha256(json.dumps(self._config, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _run_discover(self) -> AirbyteCatalog:
         """
         Call discover on the connector.
 
@@ -108,8 +242,40 @@ class Source:
         """
         return [s.name for s in self._discover().streams]
 
-    @lru_cache(maxsize=1)
     def _spec(self) -> ConnectorSpecification:
+        """
+        Get the spec of the connector, calling spec on the connector the first time.
+        """
+        if self._spec_result is None:
+            self._spec_result = self._get_from_discover_cache("spec", ConnectorSpecification, self._run_spec)
+        return self._spec_result
+
+    def _get_from_discover_cache(
+        self, key: str, model: type[_Model], run: Callable[[], _Model], max_age: Optional[timedelta] = None, refresh: bool = False
+    ) -> _Model:
+        """
+        Get the result of running the connector from the discover cache directory, or run the connector and store the result there.
+        Results stored more than max_age ago, or any stored result if refresh is set, are replaced by running the connector again.
+        The result isn't cached if the installed version of the connector is unknown.
+        """
+        if self.discover_cache_dir is None:
+            return run()
+        version = self.executor.get_installed_version()
+        if version is None:
+            return run()
+
+        path = os.path.join(self.discover_cache_dir, f"{self.name}-{version}-{key}.json")
+        if not refresh and os.path.exists(path) and (max_age is None or time.time() - os.path.getmtime(path) <= max_age.total_seconds()):
+            return model.parse_file(path)
+        result = run()
+        os.makedirs(self.discover_cache_dir, exist_ok=True)
+        # write to a temporary file first so that concurrent sessions never read a partial file
+        with tempfile.NamedTemporaryFile(mode="w", dir=self.discover_cache_dir, delete=False) as f:
+            f.write(result.json(exclude_unset=True))
+        os.replace(f.name, path)
+        return result
+
+    def _run_spec(self) -> ConnectorSpecification:
         """
         Call spec on the connector.
 
@@ -173,52 +339,72 @@ class Source:
 
     def install(self):
         self.executor.install()
+        self._spec_result = None
+        self._catalogs = {}
 
-    def _read(self) -> Iterable[AirbyteRecordMessage]:
+    def _get_configured_catalog(self, incremental: bool = False) -> ConfiguredAirbyteCatalog:
         """
-        Call read on the connector.
-
-        This involves the following steps:
-        * Call discover to get the catalog
-        * Generate a configured catalog that syncs all streams in full_refresh mode
-        * Write the configured catalog and the config to a temporary file
-        * execute the connector with read --config <config_file> --catalog <catalog_file>
-        * Listen to the messages and return the AirbyteRecordMessages that come along.
+        Call discover to get the catalog and generate a configured catalog that syncs all selected streams in full_refresh mode, or in
+        incremental mode for the streams supporting it if incremental is set.
         """
         catalog = self._discover()
-        configured_catalog = ConfiguredAirbyteCatalog(
-            streams=[
-                ConfiguredAirbyteStream(
-                    stream=s,
-                    sync_mode=SyncMode.full_refresh,
-                    destination_sync_mode=DestinationSyncMode.overwrite,
-                )
-                for s in catalog.streams
-                if self.streams is None or s.name in self.streams
-            ]
+        return ConfiguredAirbyteCatalog(
+            streams=[self._configure_stream(s, incremental) for s in catalog.streams if self.streams is None or s.name in self.streams]
         )
-        yield from self._read_catalog(configured_catalog)
 
-    def _read_catalog(self, catalog: ConfiguredAirbyteCatalog) -> Iterable[AirbyteRecordMessage]:
+    @staticmethod
+    def _configure_stream(stream: AirbyteStream, incremental: bool) -> ConfiguredAirbyteStream:
+        """
+        Sync a stream incrementally if it supports it and has a cursor field, deduplicating its records if it has a primary key.
+        """
+        has_cursor = stream.source_defined_cursor or stream.default_cursor_field
+        if incremental and SyncMode.incremental in stream.supported_sync_modes and has_cursor:
+            return ConfiguredAirbyteStream(
+                stream=stream,
+                sync_mode=SyncMode.incremental,
+                cursor_field=stream.default_cursor_field,
+                destination_sync_mode=DestinationSyncMode.append_dedup if stream.source_defined_primary_key else DestinationSyncMode.append,
+                primary_key=stream.source_defined_primary_key,
+            )
+        return ConfiguredAirbyteStream(
+            stream=stream,
+            sync_mode=SyncMode.full_refresh,
+            destination_sync_mode=DestinationSyncMode.overwrite,
+        )
+
+    def _read_catalog(
+        self,
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[List[AirbyteStateMessage]] = None,
+        on_state: Optional[Callable[[AirbyteStateMessage], None]] = None,
+    ) -> Generator[AirbyteRecordMessage, None, None]:
         """
         Call read on the connector.
 
         This involves the following steps:
-        * Write the config to a temporary file
-        * execute the connector with read --config <config_file> --catalog <catalog_file>
-        * Listen to the messages and return the AirbyteRecordMessages that come along.
+        * Write the config, the catalog and the state if any to temporary files
+        * execute the connector with read --config <config_file> --catalog <catalog_file> [--state <state_file>]
+        * Listen to the messages and return the AirbyteRecordMessages that come along, passing the AirbyteStateMessages to on_state.
         """
-        with as_temp_files([self._config, catalog.json()]) as [
-            config_file,
-            catalog_file,
-        ]:
-            for msg in self._execute(["read", "--config", config_file, "--catalog", catalog_file]):
+        files: List[Any] = [self._config, catalog.json()]
+        if state:
+            files.append("[" + ", ".join(message.json(exclude_unset=True, by_alias=True) for message in state) + "]")
+        with as_temp_files(files) as [config_file, catalog_file, *state_file]:
+            args = ["read", "--config", config_file, "--catalog", catalog_file]
+            if state_file:
+                args += ["--state", state_file[0]]
+            for msg in self._execute(args):
                 if msg.type == Type.RECORD:
                     yield msg.record
+                elif msg.type == Type.STATE and msg.state and on_state:
+                    on_state(msg.state)
+
+    @property
+    def _last_log_messages(self) -> List[str]:
+        return getattr(self._log_buffers, "messages", [])
 
     def _add_to_logs(self, message: str):
-        self._last_log_messages.append(message)
-        self._last_log_messages = self._last_log_messages[-10:]
+        self._log_buffers.messages = (self._last_log_messages + [message])[-10:]
 
     def _execute(self, args: List[str]) -> Iterable[AirbyteMessage]:
         """
@@ -232,11 +418,15 @@ class Source:
 
         self.executor.ensure_installation()
 
+        start = time.perf_counter()
+        startup_time: Optional[float] = None
         try:
-            self._last_log_messages = []
+            self._log_buffers.messages = []
             for line in self.executor.execute(args):
+                if startup_time is None:
+                    startup_time = time.perf_counter() - start
                 try:
-                    message = AirbyteMessage.parse_raw(line)
+                    message = _parse_message(line)
                     yield message
                     if message.type == Type.LOG:
                         self._add_to_logs(message.log.message)
@@ -244,6 +434,11 @@ class Source:
                     self._add_to_logs(line)
         except Exception as e:
             raise Exception(f"{str(e)}. Last logs: {self._last_log_messages}")
+        finally:
+            if startup_time is not None:
+                logger.info(
+                    f"Connector {self.name} {args[0]}: first message after {startup_time:.2f}s, ran for {time.perf_counter() - start:.2f}s"
+                )
 
     def _process(self, messages: Iterable[AirbyteRecordMessage]):
         self._processed_records = 0
@@ -251,10 +446,93 @@ class Source:
             self._processed_records += 1
             yield message
 
-    def read_all(self, cache: Optional[Cache] = None) -> SyncResult:
+    def _read_catalog_in_parallel(
+        self,
+        catalog: ConfiguredAirbyteCatalog,
+        parallel_reads: int,
+        state: List[AirbyteStateMessage],
+        on_state: Callable[[AirbyteStateMessage], None],
+    ) -> Iterator[AirbyteRecordMessage]:
+        """
+        Split the streams of the catalog across parallel_reads connector processes, and return the records of all of them as they come.
+
+        Each process is read by its own thread, which also parses its output. The records are passed through a bounded queue, so that
+        the processes wait when the records aren't consumed fast enough.
+        """
+        groups = [ConfiguredAirbyteCatalog(streams=catalog.streams[i::parallel_reads]) for i in range(parallel_reads)]
+        groups = [group for group in groups if group.streams]
+        if len(groups) <= 1:
+            yield from self._read_catalog(catalog, state, on_state)
+            return
+
+        # install the connector before the threads need it
+        self.executor.ensure_installation()
+        records: queue.Queue[Union[AirbyteRecordMessage, BaseException, object]] = queue.Queue(maxsize=_PARALLEL_READ_QUEUE_SIZE)
+        stopped = threading.Event()
+
+        def put(item: Union[AirbyteRecordMessage, BaseException, object]) -> bool:
+            while not stopped.is_set():
+                try:
+                    records.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def read_group(group: ConfiguredAirbyteCatalog) -> None:
+            try:
+                group_state = _filter_states(state, {configured_stream.stream.name for configured_stream in group.streams})
+                with closing(self._read_catalog(group, group_state, on_state)) as group_records:
+                    for record in group_records:
+                        if not put(record):
+                            return
+                put(_READ_DONE)
+            except BaseException as e:
+                put(e)
+
+        threads = [threading.Thread(target=read_group, args=(group,), daemon=True) for group in groups]
+        for thread in threads:
+            thread.start()
+        try:
+            running = len(threads)
+            while running:
+                item = records.get()
+                if item is _READ_DONE:
+                    running -= 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stopped.set()
+            if any(thread.is_alive() for thread in threads):
+                # the threads may be waiting for the output of their connector, which ends once it is terminated
+                self.executor.stop_processes()
+            for thread in threads:
+                thread.join()
+
+    def read_all(self, cache: Optional[Cache] = None, parallel_reads: int = 1, incremental: bool = False) -> SyncResult:
+        """
+        Read all the selected streams into the cache.
+        :param cache: the cache to write the records to - an in-memory cache by default.
+        :param parallel_reads: number of connector processes to split the streams across. Use more than one for sources with many streams
+            that can be read independently, as long as the API rate limits allow for it. Sources with a global state, like database sources
+            reading a change log, need to be read by a single process.
+        :param incremental: sync the streams supporting it incrementally, starting from the state stored in the cache by the previous
+            syncs, and store their new state once all records are written. Their records are added to the ones in the cache, replacing the
+            records with the same primary key. The other streams are synced in full refresh mode.
+        """
         if cache is None:
             cache = InMemoryCache()
-        cache.write(self._process(self._read()))
+        configured_catalog = self._get_configured_catalog(incremental)
+        # the records and the new state are stored together, so that a failed incremental sync can be retried from the stored state
+        with cache.transaction():
+            cache.register_catalog(configured_catalog)
+            state = cache.get_state() if incremental else []
+            emitted_states: List[AirbyteStateMessage] = []
+            cache.write(self._process(self._read_catalog_in_parallel(configured_catalog, parallel_reads, state, emitted_states.append)))
+            if incremental:
+                cache.write_state(_merge_states(state + emitted_states))
 
         return SyncResult(
             processed_records=self._processed_records,
@@ -12,6 +12,7 @@ sample_catalog = {
                 "supported_sync_modes": ["full_refresh", "incremental"],
                 "source_defined_cursor": True,
                 "default_cursor_field": ["column1"],
+                "source_defined_primary_key": [["column1"]],
                 "json_schema": {
                     "$schema": "http://json-schema.org/draft-07/schema#",
                     "type": "object",
@@ -91,6 +92,21 @@ sample_record_stream2 = {
     },
 }
 
+sample_state_stream1 = {
+    "type": "STATE",
+    "state": {
+        "type": "STREAM",
+        "stream": {"stream_descriptor": {"name": "stream1"}, "stream_state": {"column1": "value2"}},
+    },
+}
+
+
+def get_stream1_cursor(state):
+    for message in state:
+        if message["type"] == "STREAM" and message["stream"]["stream_descriptor"]["name"] == "stream1":
+            return message["stream"]["stream_state"]["column1"]
+    return None
+
 
 def parse_args():
     arg_dict = {}
@@ -122,9 +138,14 @@ def run():
     elif args[0] == "read":
         args = parse_args()
         catalog = get_json_file(args["--catalog"])
+        state = get_json_file(args["--state"]) if "--state" in args else []
         for stream in catalog["streams"]:
             if stream["stream"]["name"] == "stream1":
-                print(json.dumps(sample_record1_stream1))
-                print(json.dumps(sample_record2_stream1))
+                cursor = get_stream1_cursor(state) if stream["sync_mode"] == "incremental" else None
+                for record in [sample_record1_stream1, sample_record2_stream1]:
+                    if cursor is None or record["record"]["data"]["column1"] >= cursor:
+                        print(json.dumps(record))
+                if stream["sync_mode"] == "incremental":
+                    print(json.dumps(sample_state_stream1))
             elif stream["stream"]["name"] == "stream2":
                 print(json.dumps(sample_record_stream2))
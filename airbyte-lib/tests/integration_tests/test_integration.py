@@ -112,6 +112,44 @@ def test_sync():
     assert list(result["stream2"]) == [{"column1": "value1", "column2": 1}]
 
 
+def test_sync_with_duckdb_cache(tmp_path):
+    source = ab.get_connector("source-test", config={"apiKey": "test"})
+    cache = ab.get_duckdb_cache(str(tmp_path / "cache.duckdb"))
+
+    result = source.read_all(cache)
+
+    assert result.processed_records == 3
+    assert list(result["stream1"]) == [{"column1": "value1", "column2": 1}, {"column1": "value2", "column2": 2}]
+    assert list(result["stream2"]) == [{"column1": "value1", "column2": 1}]
+    assert result["stream1"].to_pandas()["column2"].sum() == 3
+    assert result.get_sql_engine().execute("SELECT column1 FROM stream1 WHERE column2 = 2").fetchall() == [("value2",)]
+
+
+def test_sync_in_parallel_with_duckdb_cache(tmp_path):
+    source = ab.get_connector("source-test", config={"apiKey": "test"})
+    cache = ab.get_duckdb_cache(str(tmp_path / "cache.duckdb"))
+
+    result = source.read_all(cache, parallel_reads=2)
+
+    assert result.processed_records == 3
+    assert list(result["stream1"]) == [{"column1": "value1", "column2": 1}, {"column1": "value2", "column2": 2}]
+    assert list(result["stream2"]) == [{"column1": "value1", "column2": 1}]
+
+
+def test_incremental_sync_with_duckdb_cache(tmp_path):
+    source = ab.get_connector("source-test", config={"apiKey": "test"})
+    cache = ab.get_duckdb_cache(str(tmp_path / "cache.duckdb"))
+
+    first_result = source.read_all(cache, incremental=True)
+    second_result = source.read_all(cache, incremental=True)
+
+    assert first_result.processed_records == 3
+    # the second sync only reads the records of stream1 from the last cursor value on, stream2 doesn't support incremental syncs
+    assert second_result.processed_records == 2
+    assert list(second_result["stream1"]) == [{"column1": "value1", "column2": 1}, {"column1": "value2", "column2": 2}]
+    assert list(second_result["stream2"]) == [{"column1": "value1", "column2": 1}]
+
+
 def test_sync_limited_streams():
     source = ab.get_connector("source-test", config={"apiKey": "test"})
     cache = ab.get_in_memory_cache()
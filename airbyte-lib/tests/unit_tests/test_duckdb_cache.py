@@ -0,0 +1,207 @@
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+
+from typing import Any, Dict, Iterable, List
+
+import pytest
+from airbyte_lib.cache import DuckDBCache
+from airbyte_protocol.models import (
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStream,
+    AirbyteStreamState,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    StreamDescriptor,
+    SyncMode,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": ["null", "string"]},
+        "amount": {"type": "number"},
+        "active": {"type": "boolean"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "address": {"type": "object"},
+    },
+}
+
+
+def _catalog(json_schema: Dict[str, Any] = SCHEMA) -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="users", json_schema=json_schema, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.overwrite,
+            )
+        ]
+    )
+
+
+def _incremental_catalog(json_schema: Dict[str, Any] = SCHEMA, stream: str = "users") -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name=stream,
+                    json_schema=json_schema,
+                    supported_sync_modes=[SyncMode.full_refresh, SyncMode.incremental],
+                    source_defined_primary_key=[["id"]],
+                ),
+                sync_mode=SyncMode.incremental,
+                destination_sync_mode=DestinationSyncMode.append_dedup,
+            )
+        ]
+    )
+
+
+def _data(count: int) -> List[Dict[str, Any]]:
+    return [
+        {"id": i, "name": f"user's {i}", "amount": i / 2, "active": i % 2 == 0, "tags": ["a", "b"], "address": {"city": "Berlin"}}
+        for i in range(count)
+    ]
+
+
+def _messages(data: List[Dict[str, Any]], stream: str = "users") -> Iterable[AirbyteRecordMessage]:
+    for record in data:
+        yield AirbyteRecordMessage(stream=stream, data=record, emitted_at=0)
+
+
+def test_records_are_stored_in_columns_derived_from_the_schema(tmp_path):
+    cache = DuckDBCache(str(tmp_path / "cache.duckdb"), batch_size=3)
+    cache.register_catalog(_catalog())
+    cache.write(_messages(_data(10)))
+
+    assert list(cache.get_iterable("users")) == _data(10)
+    columns = cache.get_sql_engine().execute(
+        "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = 'users' ORDER BY ordinal_position"
+    )
+    assert columns.fetchall() == [
+        ("id", "BIGINT"),
+        ("name", "VARCHAR"),
+        ("amount", "DOUBLE"),
+        ("active", "BOOLEAN"),
+        ("tags", "JSON"),
+        ("address", "JSON"),
+    ]
+
+
+def test_values_not_matching_the_schema(tmp_path):
+    cache = DuckDBCache(str(tmp_path / "cache.duckdb"))
+    cache.register_catalog(_catalog())
+    cache.write(_messages([{"id": "not a number", "name": "a"}, {"id": 2, "undeclared": "b"}]))
+
+    assert list(cache.get_iterable("users")) == [
+        {"id": None, "name": "a", "amount": None, "active": None, "tags": None, "address": None},
+        {"id": 2, "name": None, "amount": None, "active": None, "tags": None, "address": None},
+    ]
+
+
+def test_streams_without_declared_properties_store_whole_records(tmp_path):
+    cache = DuckDBCache(str(tmp_path / "cache.duckdb"))
+    cache.register_catalog(_catalog({"type": "object"}))
+    cache.write(_messages(_data(2)))
+    cache.write(_messages(_data(1), stream="not_in_catalog"))
+
+    assert list(cache.get_iterable("users")) == _data(2)
+    assert list(cache.get_iterable("not_in_catalog")) == _data(1)
+
+
+def test_records_are_kept_across_sessions(tmp_path):
+    db_path = str(tmp_path / "cache.duckdb")
+    cache = DuckDBCache(db_path)
+    cache.register_catalog(_catalog())
+    cache.write(_messages(_data(5)))
+    cache.close()
+
+    cache = DuckDBCache(db_path)
+    assert list(cache.get_iterable("users")) == _data(5)
+    assert cache.get_pandas("users")["amount"].sum() == 5.0
+    assert cache.get_sql_table("users").filter("active").aggregate("count(*)").fetchone() == (3,)
+
+    # a new sync of the stream replaces its records
+    cache.register_catalog(_catalog())
+    cache.write(_messages(_data(2)))
+    assert list(cache.get_iterable("users")) == _data(2)
+
+
+def test_incremental_syncs_replace_records_with_the_same_primary_key(tmp_path):
+    cache = DuckDBCache(str(tmp_path / "cache.duckdb"), batch_size=3)
+    cache.register_catalog(_incremental_catalog())
+    cache.write(_messages(_data(5)))
+
+    cache.register_catalog(_incremental_catalog())
+    updated = [{"id": 3, "name": "first update"}, {"id": 7, "name": "new"}, {"id": 3, "name": "second update"}, {"id": 4, "name": "update"}]
+    cache.write(_messages(updated))
+
+    names = cache.get_sql_engine().execute("SELECT id, name FROM users ORDER BY id").fetchall()
+    assert names == [(0, "user's 0"), (1, "user's 1"), (2, "user's 2"), (3, "second update"), (4, "update"), (7, "new")]
+
+
+def test_incremental_syncs_of_a_stream_named_like_the_staged_records(tmp_path):
+    cache = DuckDBCache(str(tmp_path / "cache.duckdb"))
+    cache.register_catalog(_incremental_catalog(stream="staged"))
+    cache.write(_messages(_data(3), stream="staged"))
+    cache.write(_messages([{"id": 1, "name": "update"}], stream="staged"))
+
+    names = cache.get_sql_engine().execute("SELECT id, name FROM staged ORDER BY id").fetchall()
+    assert names == [(0, "user's 0"), (1, "update"), (2, "user's 2")]
+
+
+def test_failed_syncs_are_rolled_back(tmp_path):
+    cache = DuckDBCache(str(tmp_path / "cache.duckdb"), batch_size=2)
+    state = [
+        AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name="users"), stream_state={"updated_at": "2023-12-01"}),
+        )
+    ]
+    with cache.transaction():
+        cache.register_catalog(_catalog())
+        cache.write(_messages(_data(3)))
+        cache.write_state(state)
+
+    def failing_messages() -> Iterable[AirbyteRecordMessage]:
+        yield from _messages(_data(5))
+        raise Exception("sync failed")
+
+    with pytest.raises(Exception, match="sync failed"):
+        with cache.transaction():
+            cache.register_catalog(_catalog())
+            cache.write(failing_messages())
+            cache.write_state([])
+
+    assert list(cache.get_iterable("users")) == _data(3)
+    assert cache.get_state() == state
+
+
+def test_incremental_syncs_of_streams_without_declared_properties(tmp_path):
+    cache = DuckDBCache(str(tmp_path / "cache.duckdb"))
+    cache.register_catalog(_incremental_catalog({"type": "object"}))
+    cache.write(_messages([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]))
+    cache.write(_messages([{"id": 2, "name": "c"}]))
+
+    assert sorted(cache.get_iterable("users"), key=lambda record: record["id"]) == [{"id": 1, "name": "a"}, {"id": 2, "name": "c"}]
+
+
+def test_state_is_kept_across_sessions(tmp_path):
+    db_path = str(tmp_path / "cache.duckdb")
+    state = [
+        AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name="users"), stream_state={"updated_at": "2023-12-01"}),
+        )
+    ]
+    cache = DuckDBCache(db_path)
+    assert cache.get_state() == []
+    cache.write_state(state)
+    cache.close()
+
+    cache = DuckDBCache(db_path)
+    assert cache.get_state() == state
+    cache.write_state([])
+    assert cache.get_state() == []
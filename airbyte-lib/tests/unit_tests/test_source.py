@@ -0,0 +1,322 @@
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Iterable, List, Optional
+
+import pytest
+from airbyte_lib.cache import DuckDBCache, InMemoryCache
+from airbyte_lib.executor import Executor, _stream_from_subprocess
+from airbyte_lib.registry import ConnectorMetadata
+from airbyte_lib.source import Source
+
+SPEC = {
+    "type": "SPEC",
+    "spec": {"connectionSpecification": {"type": "object", "properties": {"apiKey": {"type": "string"}}}},
+}
+CATALOG = {
+    "type": "CATALOG",
+    "catalog": {
+        "streams": [
+            {
+                "name": "stream1",
+                "json_schema": {"type": "object"},
+                "supported_sync_modes": ["full_refresh", "incremental"],
+                "source_defined_cursor": True,
+                "source_defined_primary_key": [["id"]],
+            },
+            {"name": "stream2", "json_schema": {"type": "object"}, "supported_sync_modes": ["full_refresh"]},
+        ]
+    },
+}
+
+
+def _record(stream: str) -> dict:
+    return {"type": "RECORD", "record": {"stream": stream, "data": {"id": 1}, "emitted_at": 0}}
+
+
+def _state(stream: str) -> dict:
+    return {"type": "STATE", "state": {"type": "STREAM", "stream": {"stream_descriptor": {"name": stream}, "stream_state": {"cursor": 1}}}}
+
+
+class FakeExecutor(Executor):
+    def __init__(
+        self,
+        installed_version: str | None = "0.0.1",
+        read_barrier: Optional[threading.Barrier] = None,
+        extra_read_lines: Iterable[str] = (),
+    ) -> None:
+        super().__init__(ConnectorMetadata("source-fake", "0.0.1"))
+        self.installed_version = installed_version
+        self.read_barrier = read_barrier
+        self.extra_read_lines = list(extra_read_lines)
+        self.commands: List[str] = []
+        self.read_streams: List[List[str]] = []
+        self.read_states: List[List[dict]] = []
+
+    def execute(self, args: List[str]) -> Iterable[str]:
+        self.commands.append(args[0])
+        if args[0] != "read":
+            yield json.dumps({"spec": SPEC, "discover": CATALOG}[args[0]])
+            return
+        with open(args[args.index("--catalog") + 1]) as f:
+            streams = [configured_stream["stream"]["name"] for configured_stream in json.load(f)["streams"]]
+        self.read_streams.append(streams)
+        if "--state" in args:
+            with open(args[args.index("--state") + 1]) as f:
+                self.read_states.append(json.load(f))
+        if self.read_barrier:
+            # fails unless enough reads run at the same time
+            self.read_barrier.wait()
+        yield "not a message"
+        yield from self.extra_read_lines
+        yield json.dumps({"type": "LOG", "log": {"level": "INFO", "message": f"reading {', '.join(streams)}"}})
+        for stream in streams:
+            yield json.dumps(_record(stream))
+            yield json.dumps(_state(stream))
+
+    def ensure_installation(self) -> None:
+        pass
+
+    def install(self) -> None:
+        pass
+
+    def get_installed_version(self) -> str | None:
+        return self.installed_version
+
+
+def test_spec_and_catalog_are_fetched_once():
+    executor = FakeExecutor()
+    source = Source(executor, "source-fake", config={"apiKey": "test"})
+
+    source.set_streams(["stream1"])
+    source.set_config({"apiKey": "test"})
+    result = source.read_all()
+
+    assert list(result["stream1"]) == [{"id": 1}]
+    assert executor.commands == ["spec", "discover", "read"]
+
+
+def test_streams_are_read_in_parallel():
+    executor = FakeExecutor(read_barrier=threading.Barrier(2, timeout=5))
+    source = Source(executor, "source-fake", config={"apiKey": "test"})
+    source.set_streams(["stream1", "stream2"])
+
+    result = source.read_all(parallel_reads=4)
+
+    assert list(result["stream1"]) == [{"id": 1}]
+    assert list(result["stream2"]) == [{"id": 1}]
+    assert sorted(executor.read_streams) == [["stream1"], ["stream2"]]
+    assert source._processed_records == 2
+
+
+def test_parallel_read_errors_are_raised():
+    executor = FakeExecutor(read_barrier=threading.Barrier(3, timeout=0.5))
+    source = Source(executor, "source-fake", config={"apiKey": "test"})
+    source.set_streams(["stream1", "stream2"])
+
+    with pytest.raises(Exception, match="Last logs"):
+        source.read_all(parallel_reads=2)
+
+
+def test_parallel_read_errors_have_the_logs_of_their_connector():
+    class FailingExecutor(FakeExecutor):
+        def execute(self, args: List[str]) -> Iterable[str]:
+            if args[0] != "read":
+                yield from super().execute(args)
+                return
+            lines = list(super().execute(args))
+            if self.read_streams[-1] == ["stream1"]:
+                # logs once the other connector logged
+                time.sleep(0.1)
+                yield from lines
+                return
+            yield from lines
+            # the connector of the other stream logs while this one fails
+            time.sleep(0.3)
+            raise Exception("stream2 failed")
+
+    source = Source(FailingExecutor(), "source-fake", config={"apiKey": "test"})
+    source.set_streams(["stream1", "stream2"])
+
+    with pytest.raises(Exception, match="stream2 failed") as error:
+        source.read_all(parallel_reads=2)
+
+    assert "reading stream2" in str(error.value)
+    assert "reading stream1" not in str(error.value)
+
+
+class SubprocessExecutor(FakeExecutor):
+    """Runs a connector process printing the output of the fake connector, which then hangs when reading one of the hanging_streams"""
+
+    def __init__(self, hanging_streams: List[str]) -> None:
+        super().__init__()
+        self.hanging_streams = hanging_streams
+
+    def execute(self, args: List[str]) -> Iterable[str]:
+        lines = list(super().execute(args))
+        hangs = args[0] == "read" and bool(set(self.read_streams[-1]) & set(self.hanging_streams))
+        script = "import sys, time; print(sys.argv[1], flush=True); time.sleep(600 if sys.argv[2] == 'hang' else 0)"
+        with _stream_from_subprocess([sys.executable, "-c", script, "\n".join(lines), "hang" if hangs else ""], self._processes) as stream:
+            yield from stream
+
+
+def test_stopped_parallel_reads_stop_connectors_waiting_for_output():
+    executor = SubprocessExecutor(hanging_streams=["stream2"])
+    source = Source(executor, "source-fake", config={"apiKey": "test"})
+    source.set_streams(["stream1", "stream2"])
+    records = source._read_catalog_in_parallel(source._get_configured_catalog(), 2, [], lambda state: None)
+    assert sorted(next(records).stream for _ in range(2)) == ["stream1", "stream2"]
+
+    closing_thread = threading.Thread(target=records.close, daemon=True)
+    closing_thread.start()
+    closing_thread.join(timeout=30)
+
+    assert not closing_thread.is_alive()
+    assert not executor._processes
+
+
+@pytest.mark.parametrize(
+    "parallel_reads, expected_read_states",
+    [
+        pytest.param(1, [[_state("stream1"), _state("stream2")]], id="test_single_read"),
+        pytest.param(2, [[_state("stream1")], [_state("stream2")]], id="test_parallel_reads_get_the_state_of_their_streams"),
+    ],
+)
+def test_incremental_reads_continue_from_the_stored_state(parallel_reads, expected_read_states):
+    executor = FakeExecutor()
+    source = Source(executor, "source-fake", config={"apiKey": "test"})
+    cache = InMemoryCache()
+
+    source.read_all(cache, parallel_reads=parallel_reads, incremental=True)
+    assert executor.read_states == []
+    result = source.read_all(cache, parallel_reads=parallel_reads, incremental=True)
+
+    # stream1 is synced incrementally and deduplicated by primary key, stream2 has no cursor and is synced in full refresh mode
+    assert list(result["stream1"]) == [{"id": 1}]
+    assert list(result["stream2"]) == [{"id": 1}]
+    assert sorted(executor.read_states, key=json.dumps) == [[state["state"] for state in states] for states in expected_read_states]
+    assert {state.stream.stream_descriptor.name for state in cache.get_state()} == {"stream1", "stream2"}
+
+
+def test_failed_incremental_reads_store_neither_records_nor_state(tmp_path):
+    class CrashingExecutor(FakeExecutor):
+        def execute(self, args: List[str]) -> Iterable[str]:
+            yield from super().execute(args)
+            if args[0] == "read":
+                raise Exception("connector crashed")
+
+    # records are loaded into the tables one by one
+    cache = DuckDBCache(str(tmp_path / "cache.duckdb"), batch_size=1)
+    Source(FakeExecutor(), "source-fake", config={"apiKey": "test"}).read_all(cache, incremental=True)
+    state = cache.get_state()
+
+    new_state = {
+        "type": "STATE",
+        "state": {"type": "STREAM", "stream": {"stream_descriptor": {"name": "stream1"}, "stream_state": {"cursor": 2}}},
+    }
+    new_record = {"type": "RECORD", "record": {"stream": "stream1", "data": {"id": 2}, "emitted_at": 0}}
+    source = Source(
+        CrashingExecutor(extra_read_lines=[json.dumps(new_record), json.dumps(new_state)]), "source-fake", config={"apiKey": "test"}
+    )
+    with pytest.raises(Exception, match="connector crashed"):
+        source.read_all(cache, incremental=True)
+
+    assert list(cache.get_iterable("stream1")) == [{"id": 1}]
+    assert cache.get_state() == state
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        pytest.param({"data": {"id": 2}, "emitted_at": 0}, id="test_missing_stream"),
+        pytest.param({"stream": "stream1", "emitted_at": 0}, id="test_missing_data"),
+        pytest.param({"stream": "stream1", "data": {"id": 2}}, id="test_missing_emitted_at"),
+        pytest.param({"stream": "stream1", "data": "not an object", "emitted_at": 0}, id="test_invalid_data"),
+    ],
+)
+def test_malformed_records_are_not_written_to_the_cache(record):
+    executor = FakeExecutor(extra_read_lines=[json.dumps({"type": "RECORD", "record": record})])
+    source = Source(executor, "source-fake", config={"apiKey": "test"})
+    source.set_streams(["stream1"])
+
+    result = source.read_all()
+
+    assert list(result["stream1"]) == [{"id": 1}]
+    assert json.dumps({"type": "RECORD", "record": record}) in source._last_log_messages
+
+
+def test_catalog_is_discovered_again_for_another_config():
+    executor = FakeExecutor()
+    source = Source(executor, "source-fake", config={"apiKey": "test"})
+
+    source.get_available_streams()
+    source.set_config({"apiKey": "other"})
+    source.get_available_streams()
+    source.install()
+    source.get_available_streams()
+
+    assert executor.commands == ["spec", "discover", "discover", "discover"]
+
+
+@pytest.mark.parametrize(
+    "installed_version, expected_commands",
+    [
+        pytest.param("0.0.1", [], id="test_results_are_reused_for_same_version"),
+        pytest.param("0.0.2", ["spec", "discover"], id="test_results_are_not_reused_for_other_versions"),
+        pytest.param(None, ["spec", "discover"], id="test_results_are_not_cached_for_unknown_versions"),
+    ],
+)
+def test_discover_cache_dir(tmp_path, installed_version, expected_commands):
+    Source(FakeExecutor(), "source-fake", config={"apiKey": "test"}, discover_cache_dir=str(tmp_path)).get_available_streams()
+
+    executor = FakeExecutor(installed_version)
+    source = Source(executor, "source-fake", config={"apiKey": "test"}, discover_cache_dir=str(tmp_path))
+
+    assert source.get_available_streams() == ["stream1", "stream2"]
+    assert executor.commands == expected_commands
+
+
+def test_discover_cache_dir_catalogs_expire(tmp_path):
+    Source(FakeExecutor(), "source-fake", config={"apiKey": "test"}, discover_cache_dir=str(tmp_path)).get_available_streams()
+    day_old = time.time() - 24 * 60 * 60 - 1
+    for path in tmp_path.iterdir():
+        os.utime(path, (day_old, day_old))
+
+    executor = FakeExecutor()
+    source = Source(executor, "source-fake", config={"apiKey": "test"}, discover_cache_dir=str(tmp_path))
+    source.get_available_streams()
+
+    # the spec only depends on the version of the connector, the catalog can change with the data of the account
+    assert executor.commands == ["discover"]
+
+
+def test_refresh_catalog_bypasses_the_discover_cache(tmp_path):
+    Source(FakeExecutor(), "source-fake", config={"apiKey": "test"}, discover_cache_dir=str(tmp_path)).get_available_streams()
+
+    executor = FakeExecutor()
+    source = Source(executor, "source-fake", config={"apiKey": "test"}, discover_cache_dir=str(tmp_path))
+    source.get_available_streams()
+    source.refresh_catalog()
+    source.get_available_streams()
+
+    assert executor.commands == ["discover"]
+    # the refreshed catalog is stored in the discover cache
+    executor = FakeExecutor()
+    Source(executor, "source-fake", config={"apiKey": "test"}, discover_cache_dir=str(tmp_path)).get_available_streams()
+    assert executor.commands == []
+
+
+def test_connector_run_times_are_logged(caplog):
+    source = Source(FakeExecutor(), "source-fake")
+
+    with caplog.at_level(logging.INFO, logger="airbyte_lib"):
+        source.set_config({"apiKey": "test"})
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().startswith("Connector source-fake spec: first message after ")